@@ -6,7 +6,8 @@ from .tools import SingularException, Singular_version
 from .field import Field, Q, Qi
 from .polynomial import Polynomial, Monomial
 from .point import RingPoint
-from .points import RingPoints
+from .points import RingPoints, ColumnarRingPoints
+from .serialization import save_ideals, load_ideals, save_points, load_points, PointStore
 
 
 TIMEOUT = 60  # seconds  # noqa
@@ -19,6 +20,15 @@ UNICODEPOWERS = True  # noqa, True or False
 NORMALIZE_POWERS_PATTERNS = ()  # eg. re.compile(r"(mt)(\d+)") will force mt2 to be treated as mt^2
 USE_ELLIPSIS_FOR_PRINT = False  # noqa, toggles ellipsis in for str. Use locally for prints only.
 POINT_ON_VARIETY_RANDOM_SOLUTION = True  # noqa, if False, will use the first root, otherwise a (seeded) random one is picked.
+POINT_ON_VARIETY_MIXED_PRECISION = False  # noqa, if True, mpc points are solved in double precision (numpy homotopy paths) and refined by Newton steps to the field's digits, falling back to the full precision computation.
+HOMOTOPY_CORES = 1  # noqa, number of worker processes tracking homotopy paths in point_on_variety(method='homotopy'), 1 tracks them in-process.
+POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS = None  # noqa, number of point_on_variety attempts run at once in worker processes (first success wins), 'auto' sizes it from the observed failure rate, None retries sequentially.
+POINT_ON_VARIETY_RATIONAL_PARAMETRISATION = False  # noqa, if True, exact points on ideals with a rational parametrisation (see Ideal.rational_parametrisation) are obtained by evaluating it.
+POINT_ON_VARIETY_HENSEL_LIFT = True  # noqa, if True, p-adic points are lifted from the solution modulo p by Newton steps, instead of re-solving slices.
+IDEAL_CACHE_MAXSIZE = 4096  # noqa, number of distinct ideals whose invariants are shared process-wide (LRU), 0 disables, None is unbounded
+IDEAL_CACHE_MAXBYTES = 2 ** 28  # noqa, approximate memory bound of the shared invariants (LRU), None is unbounded
+LEX_GROEBNER_STRATEGY = 'fglm'  # noqa, 'fglm' (dp basis converted to lp, with FGLM if zero-dimensional and a Groebner walk otherwise), 'walk', or 'direct'
+FINGERPRINT_PRIME = None  # noqa, prime for the modular fingerprints of ideals, None picks a random one on first use. Fix it to share fingerprints across processes.
 
 __all__ = [
     "__version__",
@@ -36,6 +46,12 @@ __all__ = [
     "TemporarySetting",
     "RingPoint",
     "RingPoints",
+    "ColumnarRingPoints",
+    "save_ideals",
+    "load_ideals",
+    "save_points",
+    "load_points",
+    "PointStore",
 ]
 
 
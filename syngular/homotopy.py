@@ -0,0 +1,295 @@
+import concurrent.futures
+import functools
+import itertools
+import numpy
+import random
+import sympy
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Predictor-corrector path tracking in double precision
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+@functools.lru_cache(maxsize=32)
+def compiled_system(equations, variables):
+    """Numpy functions evaluating the polynomial system (tuple of strings in the variables) and its Jacobian, and the degrees of the equations."""
+    symbols = sympy.symbols(variables)
+    symbols = symbols if isinstance(symbols, tuple) else (symbols, )
+    expressions = [sympy.sympify(equation.replace("^", "**")) for equation in equations]
+    system = sympy.lambdify(symbols, expressions, "numpy")
+    jacobian = sympy.lambdify(symbols, [[sympy.diff(expression, symbol) for symbol in symbols] for expression in expressions], "numpy")
+    degrees = tuple(sympy.Poly(expression, *symbols).total_degree() for expression in expressions)
+    return (lambda x: numpy.array(system(*x), dtype=complex).reshape(len(expressions)),
+            lambda x: numpy.array(jacobian(*x), dtype=complex).reshape(len(expressions), len(symbols)),
+            degrees)
+
+
+@functools.lru_cache(maxsize=32)
+def compiled_parametric_system(equations, variables, parameters):
+    """As compiled_system, for equations in the variables and parameters: functions of (x, parameter values) evaluating the system,
+    its Jacobian w.r.t. the variables and its Jacobian w.r.t. the parameters, and the degrees in the variables. Compiled once for any parameter values."""
+    symbols, parameter_symbols = tuple(map(sympy.Symbol, variables)), tuple(map(sympy.Symbol, parameters))
+    expressions = [sympy.sympify(equation.replace("^", "**")) for equation in equations]
+    system = sympy.lambdify(symbols + parameter_symbols, expressions, "numpy")
+    jacobian = sympy.lambdify(symbols + parameter_symbols, [[sympy.diff(expression, symbol) for symbol in symbols] for expression in expressions], "numpy")
+    parameter_jacobian = sympy.lambdify(symbols + parameter_symbols, [[sympy.diff(expression, symbol) for symbol in parameter_symbols] for expression in expressions], "numpy")
+    degrees = tuple(sympy.Poly(expression, *symbols).total_degree() for expression in expressions)
+    return (lambda x, values: numpy.array(system(*x, *values), dtype=complex).reshape(len(expressions)),
+            lambda x, values: numpy.array(jacobian(*x, *values), dtype=complex).reshape(len(expressions), len(symbols)),
+            lambda x, values: numpy.array(parameter_jacobian(*x, *values), dtype=complex).reshape(len(expressions), len(parameter_symbols)),
+            degrees)
+
+
+def _track(H, H_x, H_t, x, t, t_end, step, min_step=1e-12, max_step=0.1, divergence=1e8, tollerance=1e-10):
+    """Tracks x(t) with H(x(t), t) = 0 from t to t_end. Predictor: fourth order Runge-Kutta on dx/dt = -H_x^-1 H_t;
+    corrector: Newton's iteration at fixed t; the step size halves when the corrector fails and grows when it succeeds.
+    Returns the end value and the last step size, or None if the step size underflows or the path diverges."""
+
+    def dx_dt(x, t):
+        return -numpy.linalg.solve(H_x(x, t), H_t(x, t))
+
+    while t < t_end:
+        step = min(step, t_end - t)
+        try:
+            k1 = dx_dt(x, t)
+            k2 = dx_dt(x + step / 2 * k1, t + step / 2)
+            k3 = dx_dt(x + step / 2 * k2, t + step / 2)
+            k4 = dx_dt(x + step * k3, t + step)
+            y = x + step / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+            for _ in range(3):
+                delta = numpy.linalg.solve(H_x(y, t + step), H(y, t + step))
+                y = y - delta
+                if numpy.linalg.norm(delta) <= tollerance * (1 + numpy.linalg.norm(y)):
+                    break
+            else:
+                raise ArithmeticError
+        except (numpy.linalg.LinAlgError, ArithmeticError, FloatingPointError):
+            step = step / 2
+            if step < min_step * (1 - t):
+                return None, step
+            continue
+        x, t, step = y, t + step, min(1.5 * step, max_step)
+        if numpy.linalg.norm(x) > divergence:
+            return None, step
+    return x, step
+
+
+def _newton(system, jacobian, x, tollerance=1e-10, max_steps=10):
+    """Newton's iteration on a square system, or None if it does not converge."""
+    try:
+        for _ in range(max_steps):
+            delta = numpy.linalg.solve(jacobian(x), system(x))
+            x = x - delta
+            if numpy.linalg.norm(delta) <= tollerance * (1 + numpy.linalg.norm(x)):
+                return x
+    except (numpy.linalg.LinAlgError, FloatingPointError):
+        pass
+    return None
+
+
+def _in_chunks(worker, arguments, points, cores):
+    """Applies worker(*arguments, chunk) to contiguous chunks of points, in cores worker processes (in-process if cores is 1)."""
+    if cores == 1 or len(points) < 2 * cores:
+        return worker(*arguments, points)
+    size = -(-len(points) // cores)
+    chunks = [points[i:i + size] for i in range(0, len(points), size)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=cores) as executor:
+        return [endpoint for endpoints in executor.map(worker, *zip(*[(*arguments, chunk) for chunk in chunks])) for endpoint in endpoints]
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Total-degree homotopy
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+def start_points(degrees):
+    """Solutions of the start system x_i^d_i - 1 = 0."""
+    roots_of_unity = [numpy.exp(2j * numpy.pi * numpy.arange(degree) / degree) for degree in degrees]
+    return [numpy.array(point) for point in itertools.product(*roots_of_unity)]
+
+
+def track_path(equations, variables, gamma, start_point, endgame_steps=12):
+    """Tracks a path of H(x, t) = (1 - t) γ G(x) + t F(x), with G(x)_i = x_i^d_i - 1, from t = 0 to t = 1.
+    Endgame: from t = 0.9 the distance to t = 1 is divided by 4 until x(t) stabilises, then Newton's iteration on F.
+    Returns the endpoint, or None if the path diverges (solution at infinity) or ends on a singular solution."""
+    system, jacobian, degrees = compiled_system(equations, variables)
+    return _track_total_degree_path(system, jacobian, degrees, gamma, start_point, endgame_steps)
+
+
+def _track_total_degree_path(system, jacobian, degrees, gamma, start_point, endgame_steps=12):
+    degrees = numpy.array(degrees)
+
+    def H(x, t):
+        return (1 - t) * gamma * (x ** degrees - 1) + t * system(x)
+
+    def H_x(x, t):
+        return (1 - t) * gamma * numpy.diag(degrees * x ** (degrees - 1)) + t * jacobian(x)
+
+    def H_t(x, t):
+        return system(x) - gamma * (x ** degrees - 1)
+
+    x, step = _track(H, H_x, H_t, numpy.array(start_point, dtype=complex), 0., 0.9, 0.01)
+    distance = 0.1
+    for _ in range(endgame_steps):
+        if x is None:
+            return None
+        previous, distance = x, distance / 4
+        x, step = _track(H, H_x, H_t, x, 1 - 4 * distance, 1 - distance, min(step, distance))
+        if x is not None and numpy.linalg.norm(x - previous) <= 1e-6 * (1 + numpy.linalg.norm(x)):
+            break
+    else:
+        return None
+    return _newton(system, jacobian, x)
+
+
+def _track_paths_chunk(equations, variables, gamma, chunk):
+    with numpy.errstate(all="raise"):
+        return [track_path(equations, variables, gamma, start_point) for start_point in chunk]
+
+
+def track_paths(equations, variables, cores=1, seed=None):
+    """Finite isolated non-singular solutions of a square polynomial system by total-degree homotopy continuation.
+    equations are strings in the variables; paths are tracked in chunks by cores worker processes (serially if cores is 1).
+    Returns the list of endpoints as complex128 arrays, ordered as the variables."""
+    equations, variables = tuple(map(str, equations)), tuple(map(str, variables))
+    if len(equations) != len(variables):
+        raise ValueError(f"Homotopy continuation needs a square system, got {len(equations)} equations in {len(variables)} variables.")
+    rng = random.Random(seed)
+    gamma = numpy.exp(2j * numpy.pi * rng.random())
+    *_, degrees = compiled_system(equations, variables)
+    endpoints = _in_chunks(_track_paths_chunk, (equations, variables, gamma), start_points(degrees), cores)
+    return [endpoint for endpoint in endpoints if endpoint is not None]
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Parameter homotopy
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+class ParameterHomotopy(object):
+    """Solutions of a square system of equations in the variables, at any values of the parameters. The start solutions, at random complex
+    start values of the parameters, are found once by total-degree homotopy; then each solution at new values costs a single path,
+    tracked as the parameters move on the segment from the start values (generic, so the path avoids the discriminant)."""
+
+    def __init__(self, equations, variables, parameters, seed=0):
+        self.equations, self.variables, self.parameters = tuple(map(str, equations)), tuple(map(str, variables)), tuple(map(str, parameters))
+        if len(self.equations) != len(self.variables):
+            raise ValueError(f"Homotopy continuation needs a square system, got {len(self.equations)} equations in {len(self.variables)} variables.")
+        self._system, self._jacobian, self._parameter_jacobian, degrees = compiled_parametric_system(self.equations, self.variables, self.parameters)
+        rng = random.Random(seed)
+        self.start_values = random_slice(1, self.parameters, rng)[0][0]
+        gamma = numpy.exp(2j * numpy.pi * rng.random())
+        endpoints = []
+        for start_point in start_points(degrees) if min(degrees, default=0) > 0 else []:
+            with numpy.errstate(all="raise"):
+                endpoints += [_track_total_degree_path(lambda x: self._system(x, self.start_values), lambda x: self._jacobian(x, self.start_values),
+                                                       degrees, gamma, start_point)]
+        self.start_solutions = [endpoint for endpoint in endpoints if endpoint is not None]
+
+    def __call__(self, values, start_solution):
+        """Tracks a start solution to the parameter values. Returns the endpoint, or None if the path fails."""
+        start_values, values = self.start_values, numpy.array(values, dtype=complex)
+
+        def H(x, t):
+            return self._system(x, start_values + t * (values - start_values))
+
+        def H_x(x, t):
+            return self._jacobian(x, start_values + t * (values - start_values))
+
+        def H_t(x, t):
+            return self._parameter_jacobian(x, start_values + t * (values - start_values)) @ (values - start_values)
+
+        with numpy.errstate(all="raise"):
+            x, _ = _track(H, H_x, H_t, numpy.array(start_solution, dtype=complex), 0., 1., 0.05)
+            if x is None:
+                return None
+            return _newton(lambda x: H(x, 1.), lambda x: H_x(x, 1.), x)
+
+
+@functools.lru_cache(maxsize=32)
+def parameter_homotopy(equations, variables, parameters):
+    """The ParameterHomotopy of equations (tuple of strings) in the variables and parameters, cached."""
+    return ParameterHomotopy(equations, variables, parameters)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Moving linear slices and monodromy
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+def random_slice(dimension, variables, rng):
+    """A random complex affine linear space of codimension dimension, as the pair (A, b) of the equations A x = b."""
+    def random_complex(*shape):
+        return numpy.array([complex(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(int(numpy.prod(shape)))]).reshape(shape)
+    return random_complex(dimension, len(variables)), random_complex(dimension)
+
+
+def track_slice_path(equations, variables, start_slice, end_slice, gamma, start_point):
+    """Tracks a point of V(equations) ∩ {A0 x = b0} as the slice moves to {A1 x = b1}, along
+    H(x, t) = (F(x), (1 - t) γ (A0 x - b0) + t (A1 x - b1)). Returns the endpoint, or None if the path fails."""
+    system, jacobian, _ = compiled_system(equations, variables)
+    (A0, b0), (A1, b1) = start_slice, end_slice
+
+    def H(x, t):
+        return numpy.concatenate([system(x), (1 - t) * gamma * (A0 @ x - b0) + t * (A1 @ x - b1)])
+
+    def H_x(x, t):
+        return numpy.vstack([jacobian(x), (1 - t) * gamma * A0 + t * A1])
+
+    def H_t(x, t):
+        return numpy.concatenate([numpy.zeros(len(equations), dtype=complex), (A1 @ x - b1) - gamma * (A0 @ x - b0)])
+
+    x, _ = _track(H, H_x, H_t, numpy.array(start_point, dtype=complex), 0., 1., 0.01)
+    if x is None:
+        return None
+    return _newton(lambda x: H(x, 1.), lambda x: H_x(x, 1.), x)
+
+
+def _track_slice_paths_chunk(equations, variables, start_slice, end_slice, gamma, chunk):
+    with numpy.errstate(all="raise"):
+        return [track_slice_path(equations, variables, start_slice, end_slice, gamma, start_point) for start_point in chunk]
+
+
+def track_slice_paths(equations, variables, start_slice, end_slice, points, cores=1, seed=None):
+    """Moves the witness points of V(equations) ∩ start_slice to end_slice, see track_slice_path. Failed paths give None."""
+    gamma = numpy.exp(2j * numpy.pi * random.Random(seed).random())
+    return _in_chunks(_track_slice_paths_chunk, (tuple(equations), tuple(variables), start_slice, end_slice, gamma), list(points), cores)
+
+
+def monodromy_groups(equations, variables, witness_slice, points, cores=1, seed=None, max_loops=50, stable_loops=10):
+    """Partitions witness points into irreducible components, by following them around random loops of linear slices
+    (witness_slice → random slice → witness_slice, with independent γ's) and merging the points permuted into each other.
+    Stops when all points are merged, after stable_loops consecutive loops with no merge, or after max_loops loops.
+    Returns the groups as sorted lists of indices into points."""
+    rng = random.Random(seed)
+    points = [numpy.array(point, dtype=complex) for point in points]
+    parents = list(range(len(points)))
+
+    def root(i):
+        while parents[i] != i:
+            parents[i] = parents[parents[i]]
+            i = parents[i]
+        return i
+
+    unchanged = 0
+    for _ in range(max_loops):
+        if len(set(map(root, range(len(points))))) <= 1 or unchanged >= stable_loops:
+            break
+        loop_slice = random_slice(len(witness_slice[1]), variables, rng)
+        midpoints = track_slice_paths(equations, variables, witness_slice, loop_slice, points, cores=cores, seed=rng.random())
+        started = [i for i, midpoint in enumerate(midpoints) if midpoint is not None]
+        endpoints = track_slice_paths(equations, variables, loop_slice, witness_slice, [midpoints[i] for i in started], cores=cores, seed=rng.random())
+        merged = False
+        for i, endpoint in zip(started, endpoints):
+            if endpoint is None:
+                continue
+            distances = [numpy.linalg.norm(endpoint - point) for point in points]
+            j = int(numpy.argmin(distances))
+            if distances[j] <= 1e-6 * (1 + numpy.linalg.norm(endpoint)) and root(i) != root(j):
+                parents[root(i)], merged = root(j), True
+        unchanged = 0 if merged else unchanged + 1
+    groups = {}
+    for i in range(len(points)):
+        groups.setdefault(root(i), []).append(i)
+    return sorted(groups.values())
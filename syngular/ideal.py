@@ -1,20 +1,54 @@
+import concurrent.futures
 import functools
 import re
 import sympy
 import numpy
 import inspect
 import random
+import syngular
 import warnings
 
+from copy import copy
+
+from collections import namedtuple
 from packaging.version import Version
+from pycoretools import flatten, default_cores
 
-from .tools import execute_singular_command, Singular_version
+from .tools import execute_singular_command, Singular_version, SingularException, SingularProcesses
 from .ring import Ring
 from .qring import QuotientRing
 from .ideal_algorithms import Ideal_Algorithms
 from .variety import Variety_of_Ideal
 from .polynomial import Polynomial
 from .field import Field
+from .interning import ideal_intern_table, intern_key, interned_cached_property
+from .serialization import save_ideals, load_ideals
+
+Fingerprint = namedtuple("Fingerprint", ["prime", "groebner_basis", "hilbert"])
+LexGroebnerBasis = namedtuple("LexGroebnerBasis", ["basis", "strategy", "timings"])
+MultiSaturation = namedtuple("MultiSaturation", ["ideal", "indices", "timings", "intermediates"])
+
+singular_proc_rabinowitsch_saturation = """
+proc rabinowitsch_saturation(ideal I, poly f)
+{
+    def r0 = basering;
+    list L = ringlist(r0);
+    L[2] = L[2] + list("@t");
+    L[3] = list(list("dp", 1:(nvars(r0) + 1)), list("C", 0));
+    def rt = ring(L);
+    setring rt;
+    ideal Irt = imap(r0, I);
+    poly frt = imap(r0, f);
+    ideal E = eliminate(Irt + ideal(1 - @t * frt), @t);
+    setring r0;
+    ideal J = std(imap(rt, E));
+    ideal Istd = std(I);
+    int s = 0;
+    poly fs = 1;
+    while (size(reduce(fs * J, Istd)) != 0) { s = s + 1; fs = fs * f; }
+    return(list(J, s));
+}
+"""
 
 
 class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
@@ -26,9 +60,14 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
             raise Exception("Invalid Ideal initialisation.")
         self.ring = ring
         self.generators = generators
-        self.test_valid_ideal()
+        if self._intern_key not in ideal_intern_table:  # an equal definition was already validated
+            self.test_valid_ideal()
+            ideal_intern_table.register(self._intern_key)
         self._dim = None
         self._indepSets = None
+        self._fingerprint = None
+        self._lex_groebner_bases = {}
+        self._assigned_invariants = set()  # dim / indepSets set from outside (e.g. learnt or guessed by point_on_variety), not computed by Singular
 
     def test_valid_ideal(self):
         if any(isinstance(entry, (list, tuple)) for entry in self.generators):
@@ -51,10 +90,81 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
             generators = ['0']
         self._generators = generators
 
+    @property
+    def _intern_key(self):
+        return intern_key(self.ring, self)
+
+    @staticmethod
+    def cache_info():
+        """Statistics of the process-wide table of invariants shared among equal ideal definitions."""
+        return ideal_intern_table.info()
+
+    @staticmethod
+    def cache_clear():
+        ideal_intern_table.clear()
+
+    @property
+    def fingerprint(self):
+        """Probabilistic invariant: reduced Groebner basis and Hilbert series over a random large prime (syngular.FINGERPRINT_PRIME).
+        Different fingerprints w.r.t. the same prime imply different ideals, up to the (negligible) chance of an unlucky prime.
+        Only available for rings over Q or Fp which are not quotient rings, otherwise groebner_basis and hilbert are None."""
+        if syngular.FINGERPRINT_PRIME is None:
+            syngular.FINGERPRINT_PRIME = sympy.randprime(2 ** 30, 2 ** 31 - 1)
+        fingerprint = getattr(self, '_fingerprint', None)
+        if fingerprint is None or not self._is_current_fingerprint(fingerprint):
+            found, fingerprint = ideal_intern_table.lookup(self._intern_key, 'fingerprint')
+            if not found or not self._is_current_fingerprint(fingerprint):
+                fingerprint = self._get_fingerprint()
+                ideal_intern_table.store(self._intern_key, 'fingerprint', fingerprint)
+            self._fingerprint = fingerprint
+        return fingerprint
+
+    def _is_current_fingerprint(self, fingerprint):
+        return fingerprint.prime is None or fingerprint.prime == syngular.FINGERPRINT_PRIME or str(fingerprint.prime) == str(self.ring.field)
+
+    def _get_fingerprint(self):
+        characteristic = str(self.ring.field)
+        if type(self.ring) is not Ring or not characteristic.isdigit():
+            return Fingerprint(None, None, None)
+        prime = syngular.FINGERPRINT_PRIME if characteristic == '0' else int(characteristic)
+        singular_commands = ["option(redSB);",
+                             f"ring r = {prime}, {str(self.ring)[len(f'{self.ring.field}, '):]};",
+                             f"ideal i = {self};",
+                             "ideal gb = std(i);",
+                             "short=0;",
+                             "print(gb);",
+                             "print(\"hilbert\");",
+                             "print(hilb(gb, 1));",
+                             "$"]
+        try:
+            output = execute_singular_command(singular_commands)
+        except SingularException:  # e.g. the prime divides a denominator
+            return Fingerprint(None, None, None)
+        groebner_basis, hilbert = output.split("\nhilbert\n")
+        return Fingerprint(prime, tuple(line.replace(",", "") for line in groebner_basis.split("\n")),
+                           tuple(map(int, hilbert.replace(" ", "").split(","))))
+
+    def save(self, path):
+        """Saves the ideal, its ring and all computed invariants to path, see syngular.save_ideals."""
+        save_ideals(path, [self])
+
+    @classmethod
+    def load(cls, path):
+        """Loads an ideal saved with Ideal.save, restoring its computed invariants without calling Singular."""
+        ideal, = load_ideals(path, cls=cls)
+        return ideal
+
     def __hash__(self):
+        if self.fingerprint.groebner_basis is not None:
+            return hash(self.fingerprint) + hash(self.ring)
         return hash(", ".join(self.reduced_groebner_basis)) + hash(self.ring)
 
     def __eq__(self, other):
+        if not isinstance(other, Ideal):
+            return NotImplemented
+        if (self.fingerprint.groebner_basis is not None and other.fingerprint.groebner_basis is not None and
+           self.fingerprint.prime == other.fingerprint.prime and self.fingerprint != other.fingerprint):
+            return False  # definitely different
         return self.reduced_groebner_basis == other.reduced_groebner_basis
 
     def squash(self):
@@ -70,6 +180,8 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
 
     @property
     def dim(self):
+        if self._dim is None:
+            _, self._dim = ideal_intern_table.lookup(self._intern_key, 'dim')
         if self._dim is None:
             singular_commands = [f"ring r = {self.ring};",
                                  f"ideal gb = {','.join(self.groebner_basis)};",
@@ -79,11 +191,13 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
                                  "$"]
             output = execute_singular_command(singular_commands)
             self._dim = int(output)
+            ideal_intern_table.store(self._intern_key, 'dim', self._dim)
         return self._dim
 
     @dim.setter
     def dim(self, val):
         self._dim = val
+        self._assigned_invariants.add('dim')
 
     @property
     def dims(self):
@@ -114,7 +228,7 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
                 break
         return tuple(lst)
 
-    @functools.cached_property
+    @interned_cached_property
     def indepSet(self):
         singular_commands = [f"ring r = {self.ring};",
                              f"ideal gb = {','.join(self.groebner_basis)};",
@@ -125,6 +239,9 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
 
     @property
     def indepSets(self):
+        if self._indepSets is None:
+            found, indepSets = ideal_intern_table.lookup(self._intern_key, 'indepSets')
+            self._indepSets = list(indepSets) if found else None  # own copy, as it may be extended after learning
         if self._indepSets is None:
             singular_commands = [f"ring r = {self.ring};",
                                  # f"ideal gb = {','.join(self.groebner_basis)};",   # this breaks singular variety construction, especially with mpcs
@@ -137,11 +254,13 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
                 return [self.indepSet]
             indepSets = [tuple(map(int, line.replace(" ", "").split(","))) for line in output.split("\n") if ":" not in line]
             self._indepSets = indepSets
+            ideal_intern_table.store(self._intern_key, 'indepSets', indepSets)
         return self._indepSets
 
     @indepSets.setter
     def indepSets(self, val):
         self._indepSets = val
+        self._assigned_invariants.add('indepSets')
 
     def get_groebner_basis(self, reduced=False, algorithm=['groebner', 'slimgb'][1]):
         singular_commands = [f"ring r = {self.ring};",
@@ -157,15 +276,70 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         output = [line.replace(",", "") for line in output.split("\n")]
         return output
 
-    @functools.cached_property
+    @interned_cached_property
     def groebner_basis(self):
+        if self._is_lex_convertible:
+            return self.lex_groebner_basis.basis
         return self.get_groebner_basis(reduced=True, algorithm='groebner')
 
-    @functools.cached_property
+    @interned_cached_property
     def reduced_groebner_basis(self):
+        if self._is_lex_convertible:
+            return self.lex_groebner_basis.basis
         return self.get_groebner_basis(reduced=True, algorithm='groebner')
 
-    @functools.cached_property
+    @property
+    def _is_lex_convertible(self):
+        return type(self.ring) is Ring and self.ring.ordering == 'lp' and syngular.DEGBOUND == 0
+
+    @property
+    def lex_groebner_basis(self):
+        """Reduced lp Groebner basis, computed according to syngular.LEX_GROEBNER_STRATEGY and cached per strategy.
+        Returns a LexGroebnerBasis namedtuple (basis, strategy, timings), where strategy is the one actually used and timings are in seconds."""
+        strategy = syngular.LEX_GROEBNER_STRATEGY
+        if strategy not in self._lex_groebner_bases:
+            name = f'lex_groebner_basis_{strategy}'
+            found, lex_groebner_basis = ideal_intern_table.lookup(self._intern_key, name)
+            if not found:
+                lex_groebner_basis = self.get_lex_groebner_basis(strategy)
+                ideal_intern_table.store(self._intern_key, name, lex_groebner_basis)
+            self._lex_groebner_bases[strategy] = lex_groebner_basis
+        return self._lex_groebner_bases[strategy]
+
+    def get_lex_groebner_basis(self, strategy='fglm'):
+        """With strategy 'direct' computes the lp basis from scratch, otherwise computes a dp basis first and converts it,
+        with FGLM if the ideal is zero-dimensional (and strategy is 'fglm'), with the Groebner walk otherwise."""
+        if strategy not in ('direct', 'fglm', 'walk'):
+            raise ValueError(f"Unknown lex Groebner basis strategy {strategy}.")
+        if not self._is_lex_convertible:
+            raise ValueError("Lex Groebner basis conversion requires a (non-quotient) ring with lp ordering and no degree bound.")
+        dp_ring = copy(self.ring)
+        dp_ring.ordering = 'dp'
+        singular_commands = ["LIB \"grwalk.lib\";",
+                             "option(redSB); option(noredefine);",
+                             "system(\"--ticks-per-sec\", 1000);",
+                             f"ring rdp = {dp_ring};",
+                             f"ideal i = {self};",
+                             "int t = rtimer;",
+                             "ideal gb = std(i);" if strategy != 'direct' else "ideal gb = i;",
+                             "int dp_time = rtimer - t;",
+                             "int d = dim(gb);",
+                             f"ring r = {self.ring};",
+                             "short=0;",
+                             "t = rtimer;",
+                             "ideal lex;",
+                             f"if (\"{strategy}\" == \"direct\") {{ lex = groebner(imap(rdp, i)); print(\"direct\"); }}",
+                             f"else {{ if (d == 0 && \"{strategy}\" == \"fglm\") {{ lex = fglm(rdp, gb); print(\"fglm\"); }}",
+                             "else { if (d == -1) { lex = imap(rdp, gb); } else { lex = std(fwalk(imap(rdp, gb))); } print(\"walk\"); } }",
+                             "print(dp_time); print(rtimer - t);",
+                             "print(lex);",
+                             "$"]
+        output = execute_singular_command(singular_commands).split("\n")
+        strategy, dp_time, conversion_time, basis = output[0], int(output[1]) / 1000, int(output[2]) / 1000, output[3:]
+        timings = {strategy: conversion_time} if strategy == 'direct' else {'dp': dp_time, strategy: conversion_time}
+        return LexGroebnerBasis([line.replace(",", "") for line in basis], strategy, timings)
+
+    @interned_cached_property
     def leadGBmonomials(self):
         """Gives the leading monomials of the Groebner basis polynomials."""
         singular_commands = [f"ring r = {self.ring};",
@@ -178,7 +352,7 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         output = [line.replace(",", "") for line in output.split("\n")]
         return output
 
-    @functools.cached_property
+    @interned_cached_property
     def minbase(self):
         singular_commands = [f"ring r = {self.ring};",
                              f"ideal i = {self};",
@@ -189,7 +363,7 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         output = [line.replace(",", "") for line in output.split("\n")]
         return output
 
-    @functools.cached_property
+    @interned_cached_property
     def radical(self):
         """Returns the radical of the ideal."""
         singular_commands = ["LIB \"primdec.lib\";",
@@ -204,34 +378,153 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         cls, ring = self.__class__, self.ring
         return cls(ring, output)
 
-    @functools.cached_property
-    def primary_decomposition(self):
+    @classmethod
+    def _from_singular_output(cls, ring, generators):
+        """Instantiates an ideal from generators printed by Singular itself, skipping their validation."""
+        ideal_intern_table.register(intern_key(ring, ",".join(generators) if len(generators) > 0 else '0'))
+        return cls(ring, generators)
+
+    def _decompose(self, procedure):
+        """Runs a primdec.lib procedure returning a list of ideals, or of lists of ideals, and parses the output."""
         singular_commands = ["LIB \"primdec.lib\";",
                              f"ring r = {self.ring};",
                              f"ideal i = {self};",
-                             # f"ideal gb = {','.join(self.groebner_basis)};",
-                             "def pr = primdecGTZ(i);",   # options: GTZ / SY
+                             f"def pr = {procedure}(i);",
                              "short=0;",
                              "print(pr);",
                              "$"]
         output = execute_singular_command(singular_commands)
-        output = [line.replace(",", "") for line in output.split("\n")]
+        components = parse_singular_list(output)
+        cls, ring = self.__class__, self.ring
+        if components != [] and isinstance(components[0][0], list):
+            return [tuple(cls._from_singular_output(ring, generators) for generators in component) for component in components]
+        return [cls._from_singular_output(ring, generators) for generators in components]
 
-        def clean_up(string):
-            string = re.sub(r"_\[\d+\]=", "", string)
-            string = re.sub(r"\[\d+\]:", "|", string)
-            return string.replace(" ", "")
+    @interned_cached_property
+    def primary_decomposition(self):
+        return self._decompose("primdecGTZ")   # options: GTZ / SY
 
-        primary_decomposed = ",".join(list(map(clean_up, output))).replace("|,", "|").replace(",|", "|").replace("|,", "|").split("||")
-        primary_decomposed = list(filter(lambda x: x != '', primary_decomposed))
-        primary_decomposed = [entry.split("|") for entry in primary_decomposed]
-        primary_decomposed = [(entry[0].split(","), entry[1].split(",")) for entry in primary_decomposed]
+    @interned_cached_property
+    def minimal_associated_primes(self):
+        return self._decompose("minAssGTZ")
 
-        cls, ring = self.__class__, self.ring
-        for i, (primary, prime) in enumerate(primary_decomposed):
-            primary_decomposed[i] = (cls(ring, primary), cls(ring, prime))
+    def _split(self, factor):
+        """Splits self = (self : factor^∞) ∩ (self + factor^s), with s the saturation index. Unit ideals are dropped."""
+        singular_commands = ["LIB \"elim.lib\";",
+                             f"ring r = {self.ring};",
+                             f"ideal i = {self};",
+                             f"poly f = {factor};",
+                             f"list k_and_s = {'sat' if Singular_version <= Version('4.3.1') else 'sat_with_exp'}(i, f);",
+                             "ideal j = i + f^k_and_s[2];",
+                             "short=0;",
+                             "print(k_and_s[2]);",
+                             "print(\"saturation\"); print(dim(std(k_and_s[1]))); print(k_and_s[1]);",
+                             "print(\"sum\"); print(dim(std(j))); print(j);",
+                             "$"]
+        output = execute_singular_command(singular_commands)
+        index, output = output.split("\nsaturation\n")
+        if int(index) == 0:
+            return [self]
+        branches = []
+        for branch in output.split("\nsum\n"):
+            dim, generators = branch.split("\n", 1)
+            if int(dim) != -1:
+                branches += [self.__class__._from_singular_output(self.ring, [line.replace(",", "") for line in generators.split("\n")])]
+        return branches
+
+    def _factorised_generators(self):
+        """Distinct irreducible factors of each reducible generator, sorted by number of factors."""
+        singular_commands = [f"ring r = {self.ring};",
+                             f"ideal i = {self};",
+                             "short=0;",
+                             "for (int k=1; k<=size(i); k=k+1)",
+                             "{",
+                             "  print(\"generator\");",
+                             "  print(factorize(i[k], 1));",
+                             "}",
+                             "$"]
+        output = execute_singular_command(singular_commands)
+        factorisations = [[line.replace(",", "") for line in entry.split("\n") if line != ""] for entry in output.split("generator\n")[1:]]
+        return sorted([factorisation for factorisation in factorisations if len(factorisation) > 1], key=len)
+
+    def _branches(self, cores, radical=False):
+        """Splits the ideal into independent branches by the factors of its generators.
+        If radical is False, the branches intersect to self, I = (I : f^∞) ∩ (I + f^s), and splitting stops once there are enough branches for cores.
+        If radical is True, only their radicals do, V(I) = ∪ V(I + f) for the factors f of the generator with the most factors."""
+        factorisations = self._factorised_generators()
+        if factorisations == []:
+            return [self]
+        if radical:
+            return [self + self.__class__._from_singular_output(self.ring, [factor]) for factor in factorisations[-1]]
+        factors = []
+        for factor in flatten(factorisations):
+            if factor not in factors:
+                factors += [factor]
+        branches = [self]
+        for factor in factors:
+            if len(branches) >= cores:
+                break
+            with concurrent.futures.ThreadPoolExecutor(max_workers=cores) as executor:
+                branches = flatten(list(executor.map(lambda branch: branch._split(factor), branches)))
+        return branches
+
+    def primary_decomposition_iter(self, cores=None):
+        """Parallel primary decomposition, streaming (primary, prime) pairs as they are found.
+        The ideal is first split into branches by the factors of its generators, I = (I : f^∞) ∩ (I + f^s),
+        then each branch is decomposed with primdecGTZ in a pool of cores workers.
+        Components of different branches may share the same prime or be redundant, see parallel_primary_decomposition.
+        Closing the generator early (e.g. breaking out of a for loop) cancels the pending branches and terminates the Singular processes of the running ones,
+        without waiting for them: their worker threads may still be winding down when close() returns."""
+        cores = default_cores() if cores is None else cores
+        yield from self._stream_branches(self._branches(cores), "primdecGTZ", cores)
 
-        return primary_decomposed
+    @staticmethod
+    def _stream_branches(branches, command, cores):
+        """Yields the entries of branch._decompose(command) for each branch, as the branches complete in a pool of cores threads.
+        When the generator is closed, the pool is shut down without waiting and the running Singular processes are terminated."""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=cores)
+        processes = [SingularProcesses() for _ in branches]
+        futures = [executor.submit(branch_processes.run, branch._decompose, command) for branch, branch_processes in zip(branches, processes)]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            for branch_processes in processes:
+                branch_processes.terminate()
+
+    def parallel_primary_decomposition(self, cores=None):
+        """Collects primary_decomposition_iter, merging components with the same prime by intersecting their primary ideals."""
+        components = []
+        for primary, prime in self.primary_decomposition_iter(cores=cores):
+            for i, (other_primary, other_prime) in enumerate(components):
+                if prime == other_prime:
+                    components[i] = (other_primary & primary, other_prime)
+                    break
+            else:
+                components += [(primary, prime)]
+        return components
+
+    def minimal_associated_primes_iter(self, cores=None):
+        """Parallel minimal associated primes, streamed as they are found. The variety is split as V(I) = ∪ V(I + f) for the irreducible factors f
+        of a reducible generator, and each branch runs minAssGTZ in a pool of cores workers. Duplicate primes are skipped, but a prime may still
+        contain a prime from another branch, see parallel_minimal_associated_primes.
+        As for primary_decomposition_iter, closing the generator early terminates the running Singular processes without waiting for their threads."""
+        cores = default_cores() if cores is None else cores
+        seen = []
+        stream = self._stream_branches(self._branches(cores, radical=True), "minAssGTZ", cores)
+        try:
+            for prime in stream:
+                if prime not in seen:
+                    seen += [prime]
+                    yield prime
+        finally:
+            stream.close()
+
+    def parallel_minimal_associated_primes(self, cores=None):
+        """Collects minimal_associated_primes_iter, discarding the primes which contain another one."""
+        primes = list(self.minimal_associated_primes_iter(cores=cores))
+        return [prime for prime in primes if not any(other != prime and other in prime for other in primes)]
 
     def eliminate(self, var_range):
         singular_commands = [f"ring r1 = {self.ring};",
@@ -308,11 +601,15 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         cls, ring = self.__class__, self.ring
         if n == 0:
             return cls(ring, ['1'])
-        elif n % 2 == 0:
-            root_2_res = self ** (n // 2)
-            return root_2_res * root_2_res
-        else:
-            return self * (self ** (n - 1))
+        elif n == 1:
+            return cls(ring, list(self.generators))
+        singular_commands = [f"ring r = {self.ring};",
+                             f"ideal i = {self};",
+                             f"ideal k = i ^ {n};",
+                             "print(k);",
+                             "$"]
+        output = execute_singular_command(singular_commands)
+        return cls._from_singular_output(ring, [line.replace(",", "") for line in output.split("\n")])
 
     def __and__(self, other):
         """Intersection of Ideals = Union of Varieties - This uses Python's set intersection operator '&'."""
@@ -328,29 +625,119 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
         return cls(ring, output)
 
     @staticmethod
-    def intersection(*args):
-        """Intersection of Ideals - wrapper around & operator for chained intersection."""
-        if len(args) == 1:
-            return args[0]
-        res = args[0] & args[1]
-        for arg in args[2:]:
-            res = res & arg
-        return res
+    def intersection(*args, cores=None):
+        """Intersection of many Ideals, see Ideal.combine."""
+        return Ideal.combine("intersection", args, cores=cores)
+
+    @staticmethod
+    def sum(*args, cores=None):
+        """Sum of many Ideals, see Ideal.combine."""
+        return Ideal.combine("sum", args, cores=cores)
+
+    @staticmethod
+    def product(*args, cores=None):
+        """Product of many Ideals, see Ideal.combine."""
+        return Ideal.combine("product", args, cores=cores)
+
+    @staticmethod
+    def combine(operation, ideals, cores=None):
+        """N-ary intersection, sum or product of ideals in a common ring.
+        With cores 1 the whole expression is computed in a single Singular script, otherwise (default_cores() if None) by a pairwise tree reduction:
+        at each level adjacent pairs are combined in parallel, by up to cores Singular processes, until a single ideal is left."""
+        ideals = list(ideals)
+        if len(ideals) == 0:
+            raise ValueError("Need at least one ideal to combine.")
+        cores = default_cores() if cores is None else cores
+        if cores == 1 or len(ideals) <= 2:
+            return ideals[0] if len(ideals) == 1 else Ideal._combine(operation, ideals)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=cores) as executor:
+            while len(ideals) > 1:
+                pairs = [ideals[i:i + 2] for i in range(0, len(ideals), 2)]
+                ideals = list(executor.map(lambda pair: pair[0] if len(pair) == 1 else Ideal._combine(operation, pair), pairs))
+        return ideals[0]
+
+    @staticmethod
+    def _combine(operation, ideals):
+        if len({ideal.ring for ideal in ideals}) != 1:
+            raise ValueError("Ideals must belong to the same ring.")
+        names = [f"i{k}" for k in range(len(ideals))]
+        expression = {"intersection": f"intersect({', '.join(names)})",
+                      "sum": " + ".join(names),
+                      "product": " * ".join(names)}[operation]
+        cls, ring = ideals[0].__class__, ideals[0].ring
+        singular_commands = ([f"ring r = {ring};"] +
+                             [f"ideal {name} = {ideal};" for name, ideal in zip(names, ideals)] +
+                             [f"ideal k = {expression};",
+                              "print(k);",
+                              "$"])
+        output = execute_singular_command(singular_commands)
+        return cls._from_singular_output(ring, [line.replace(",", "") for line in output.split("\n")])
 
     def saturation(self, other):
         """Saturation of ideals (self : other^∞), returns both saturation ideal and saturation index."""
-        singular_commands = ["LIB \"elim.lib\";"
-                             f"ring r = {self.ring};",
-                             f"ideal i = {self};",
-                             f"ideal j = {other};",
-                             f"list k_and_s = {'sat' if Singular_version <= Version('4.3.1') else 'sat_with_exp'}(i, j);",
-                             "print(k_and_s[1]);",
-                             "print(\"sat index\"); print(k_and_s[2]);",
-                             "$"]
-        output = execute_singular_command(singular_commands)
+        saturation = self.multi_saturation([other])
+        return saturation.ideal, saturation.indices[0]
+
+    def multi_saturation(self, others, method="auto"):
+        """Iterated saturation ((self : others[0]^∞) : others[1]^∞) ... in a single Singular session.
+        Each entry of others can be a polynomial or an ideal. With method 'quotient' each step uses iterated quotients (sat_with_exp),
+        with method 'rabinowitsch' the elimination of t from self + <1 - t * f> (only for polynomials, not in quotient rings).
+        Method 'auto' uses Rabinowitsch for polynomials with more than one term, and quotients for monomials and ideals.
+        Returns a MultiSaturation namedtuple (ideal, indices, timings, intermediates), where intermediates are the reduced
+        standard bases after each step (the last one being ideal) and timings are the wall-clock seconds of each step."""
+        if method not in ("auto", "quotient", "rabinowitsch"):
+            raise ValueError(f"Unknown saturation method {method}.")
         cls, ring = self.__class__, self.ring
-        return (cls(ring, [entry.replace(',', '') for entry in output.split("sat index\n")[0].split("\n") if entry]),
-                int(output.split("sat index\n")[1]))
+        if len(others) == 0:
+            return MultiSaturation(self, [], [], [])
+        singular_commands = ([f"ring r = {self.ring};",
+                              f"ideal I = {self};"] +
+                             self._multi_saturation_commands(others, method) +
+                             ["$"])
+        indices, timings, bases = self._parse_multi_saturation_output(execute_singular_command(singular_commands))
+        intermediates = []
+        for basis in bases:
+            intermediate = cls._from_singular_output(ring, basis)
+            ideal_intern_table.store(intermediate._intern_key, 'groebner_basis', basis)
+            ideal_intern_table.store(intermediate._intern_key, 'reduced_groebner_basis', basis)
+            intermediates += [intermediate]
+        return MultiSaturation(intermediates[-1], indices, timings, intermediates)
+
+    def _multi_saturation_commands(self, others, method):
+        """Singular commands saturating the ideal I of the current ring r by each of others in turn, printing index, timing and basis."""
+        if method == "rabinowitsch" and isinstance(self.ring, QuotientRing):
+            raise ValueError("Rabinowitsch saturation is not available in quotient rings.")
+        sat = 'sat' if Singular_version <= Version('4.3.1') else 'sat_with_exp'
+        singular_commands = ["LIB \"elim.lib\";",
+                             "option(redSB);",
+                             "short=0;",
+                             "system(\"--ticks-per-sec\", 1000);",
+                             singular_proc_rabinowitsch_saturation,
+                             "list J_and_s;",
+                             "int t;"]
+        for k, other in enumerate(others):
+            rabinowitsch = {"auto": f"size(F{k}) == 1 && size(F{k}[1]) > 1" if not isinstance(self.ring, QuotientRing) else "0",
+                            "quotient": "0", "rabinowitsch": f"size(F{k}) == 1"}[method]
+            singular_commands += [f"ideal F{k} = {other};",
+                                  "t = rtimer;",
+                                  f"if ({rabinowitsch}) {{ J_and_s = rabinowitsch_saturation(I, F{k}[1]); }}",
+                                  f"else {{ J_and_s = {sat}(I, F{k}); }}",
+                                  "I = std(J_and_s[1]);",
+                                  "print(\"saturation step\");",
+                                  "print(J_and_s[2]);",
+                                  "print(rtimer - t);",
+                                  "print(I);"]
+        return singular_commands
+
+    @staticmethod
+    def _parse_multi_saturation_output(output):
+        indices, timings, bases = [], [], []
+        for step in output.split("saturation step\n")[1:]:
+            lines = [line for line in step.split("\n") if line != ""]
+            indices += [int(lines[0])]
+            timings += [int(lines[1]) / 1000]
+            bases += [[line.replace(",", "") for line in lines[2:]]]
+        return indices, timings, bases
 
     def __floordiv__(self, other):
         """Saturation of ideals (self : other^∞), returns only the ideal."""
@@ -430,13 +817,18 @@ class Ideal(Ideal_Algorithms, Variety_of_Ideal, object):
             delattr(self, cached_property)
         self._dim = None
         self._indepSets = None
+        self._fingerprint = None
+        self._lex_groebner_bases = {}
+        self._assigned_invariants = set()
 
     def generators_eval(self, **kwargs):
         return [eval(generator.replace("^", "**"), kwargs) for generator in self.generators]
 
     @property
     def is_unit_ideal(self):
-        return self == Ideal(self.ring, ('1', ))
+        if self.fingerprint.groebner_basis is not None and self.fingerprint.groebner_basis != ('1', ):
+            return False
+        return self.reduced_groebner_basis == ['1']
 
 
 def reduce(poly, ideal):
@@ -463,3 +855,22 @@ def monomial_to_exponents(variables, monomial):
                 exp = 1
             exps[variables.index(ientry)] += exp
     return exps
+
+
+def parse_singular_list(output):
+    """Parses the print out of a Singular list of ideals, possibly nested (e.g. from primdecGTZ), into nested lists of generator strings."""
+    root = []
+    stack = [(-1, root)]
+    for line in output.split("\n"):
+        indent = len(line) - len(line.lstrip(" "))
+        line = line.strip().rstrip(",")
+        if line == "":
+            continue
+        while stack[-1][0] >= indent:
+            stack.pop()
+        if re.fullmatch(r"\[\d+\]:", line):
+            stack[-1][1].append([])
+            stack.append((indent, stack[-1][1][-1]))
+        else:
+            stack[-1][1].append(re.sub(r"^_\[\d+\]=", "", line))
+    return root
@@ -3,13 +3,57 @@ import re
 
 from random import randint
 from copy import deepcopy
-from packaging.version import Version
 from pycoretools import mapThreads, TemporarySetting, default_cores
 
-from .tools import execute_singular_command, Singular_version
+from .tools import execute_singular_command
 from .ring import Ring
 from .field import Field
 from .polynomial import Polynomial
+from .interning import interned_cached_property
+
+
+class RationalParametrisation:
+    """Dependent variables as rational functions of the independent ones, formulas = {variable: (numerator, denominator)}.
+    The formulas are compiled once per field into a single Python function of the independent values."""
+
+    def __init__(self, independent, formulas):
+        self.independent = tuple(map(str, independent))
+        self.formulas = dict(formulas)
+        self._evaluators = {}
+
+    def __repr__(self):
+        return f"RationalParametrisation({self.independent}, {self.formulas})"
+
+    def __getstate__(self):
+        return {"independent": self.independent, "formulas": self.formulas}
+
+    def __setstate__(self, state):
+        self.__init__(state["independent"], state["formulas"])
+
+    def evaluator(self, field):
+        """Function of the independent values returning the numerators and denominators of the formulas, with coefficients in field."""
+        if str(field) not in self._evaluators:
+            constants, expressions = [], []
+            for numerator, denominator in self.formulas.values():
+                for polynomial in (Polynomial(numerator, field), Polynomial(denominator, field)):
+                    terms = []
+                    for coeff, monomial in polynomial.coeffs_and_monomials:
+                        constants += [coeff]
+                        terms += [f"C[{len(constants) - 1}]" + "".join(f"*{variable}**{exponent}" for variable, exponent in monomial.items())]
+                    expressions += [" + ".join(terms) if terms != [] else "0"]
+            namespace = {"C": constants}
+            exec(f"def evaluate({', '.join(self.independent)}):\n    return ({', '.join(expressions)}, )", namespace)
+            self._evaluators[str(field)] = namespace["evaluate"]
+        return self._evaluators[str(field)]
+
+    def __call__(self, field, independent_values):
+        """The values of the dependent variables at the given independent values (in field).
+        Raises ZeroDivisionError on vanishing denominators, or for p-adics on denominators divisible by p (which would lose digits)."""
+        values = self.evaluator(field)(*[independent_values[variable] for variable in self.independent])
+        denominators = values[1::2]
+        if any(denominator == 0 or (field.name == "padic" and denominator.n > 0) for denominator in denominators):
+            raise ZeroDivisionError(f"Vanishing denominator in the rational parametrisation at {independent_values}.")
+        return {variable: numerator / denominator for variable, numerator, denominator in zip(self.formulas, values[0::2], denominators)}
 
 
 class Ideal_Algorithms:
@@ -47,6 +91,59 @@ class Ideal_Algorithms:
         I_extended = Ideal(r2, generators)
         return I_extended
 
+    singular_commands_RATPAR = r"""
+        ring r = {r};
+        ideal i = {ideal};
+        // to F(U)[X \ U]
+        ring r2 = {r2};
+        short=0;
+        ideal i = imap(r, i);
+        option(redSB);
+        ideal R = std(i);
+        print(size(R));
+        for (int k = 1; k <= size(R); k++)
+        {{
+            poly g = R[k];
+            if (deg(g) == 1 && deg(leadmonom(g)) == 1 && deg(g - leadcoef(g) * leadmonom(g)) <= 0)
+            {{
+                number n = -leadcoef(g - leadcoef(g) * leadmonom(g)) / leadcoef(g);
+                print(leadmonom(g)); print(numerator(n)); print(denominator(n));
+                kill n;
+            }}
+            else {{ print("nonlinear"); }}
+            kill g;
+        }}
+        $
+    """
+
+    def rational_parametrisation_over(self, U):
+        r"""The solution of the extension to K(U)[X \ U] as rational functions of U, if its reduced lp Groebner basis is linear in each of X \ U, else None."""
+        U = tuple(map(str, U))
+        XqU = tuple(str(entry) for entry in self.ring.variables if str(entry) not in U)
+        r2 = Ring((sympy.symbols('0'), ) + tuple(map(sympy.Symbol, U)), tuple(map(sympy.Symbol, XqU)), 'lp')
+        output = execute_singular_command(self.singular_commands_RATPAR.format(**{"ideal": self, "r": self.ring, "r2": r2})).split("\n")
+        if int(output[0]) != len(XqU) or "nonlinear" in output:
+            return None
+        formulas = {output[i]: tuple(re.sub(r"^\((.*)\)$", r"\1", entry) for entry in output[i + 1:i + 3]) for i in range(1, 3 * len(XqU) + 1, 3)}
+        if set(formulas) != set(XqU):
+            return None
+        return RationalParametrisation(U, {variable: formulas[variable] for variable in XqU})
+
+    @interned_cached_property
+    def rational_parametrisation(self):
+        """A RationalParametrisation of the variety (of its components of maximal dimension) by one of its independent sets of maximal dimension, or None.
+        Only ideals in (non-quotient) rings over Q are considered."""
+        if type(self.ring) is not Ring or str(self.ring.field) != "0":
+            return None
+        indepSets = self.indepSets
+        dimension = max(indepSet.count(1) for indepSet in indepSets)
+        for indepSet in indepSets:
+            if indepSet.count(1) == dimension:
+                parametrisation = self.rational_parametrisation_over([variable for variable, independent in zip(self.ring.variables, indepSet) if independent])
+                if parametrisation is not None:
+                    return parametrisation
+        return None
+
     singular_commands_EXTCONT1 = r"""
         LIB "polylib.lib";
         // K(U)[X \ U]
@@ -89,27 +186,15 @@ class Ideal_Algorithms:
         return ['1'] + f_polys_factors
 
     singular_commands_EXTCONT2 = """
-        LIB "polylib.lib";
-        // option(redSB);
         ring r2 = {r2};
         ideal G = {extended_ideal};
         ring r = {r};
-        ideal Iec = imap(r2, G);
-        list factors = {f_polys_factors};
-        list Iec_and_s;
-        int s = 0;
-        for (int i_=1; i_<=size(factors); i_=i_+1)
-        {{
-            Iec_and_s = {sat}(Iec, ideal(factors[i_]));
-            Iec = Iec_and_s[1];
-            s = max(s, Iec_and_s[2]);
-        }}
-        print("saturation index:"); print(s);
-        print("extended-contracted ideal:"); print(minbase(Iec));
+        ideal I = imap(r2, G);
     """
 
-    def extension_contraction(self, U, ordering="lp"):
-        """Computes extension-contraction of self to localization define by indepSet U. Returns a tuple: (saturation index, extended-contracted ideal)."""
+    def extension_contraction(self, U, ordering="lp", method="auto"):
+        """Computes extension-contraction of self to localization define by indepSet U. Returns a tuple: (saturation index, extended-contracted ideal).
+        The saturation by the factors of the f-polynomial is performed as in multi_saturation, with the given method."""
         r = self.ring
         X = r.variables
         XqU = tuple(entry for entry in X if entry not in U)
@@ -121,11 +206,14 @@ class Ideal_Algorithms:
             r2 = Ring((sympy.symbols('0'), ) + U, XqU, 'dp')
         else:
             raise ValueError
-        string = execute_singular_command(self.singular_commands_EXTCONT2.format(**{
-            "extended_ideal": self.extension(U, ordering), "f_polys_factors": ','.join(self.extension_contraction_fpoly(U, ordering)),
-            "r": r, "r2": r2, "sat": "sat" if Singular_version <= Version('4.3.1') else 'sat_with_exp'}))
+        singular_commands = ([self.singular_commands_EXTCONT2.format(**{"extended_ideal": self.extension(U, ordering), "r": r, "r2": r2})] +
+                             self._multi_saturation_commands(self.extension_contraction_fpoly(U, ordering), method) +
+                             ["print(\"extended-contracted ideal:\"); print(minbase(I));"])
+        string = execute_singular_command(singular_commands)
+        string, minbase = string.split("extended-contracted ideal:\n")
+        indices, _, _ = self._parse_multi_saturation_output(string)
         Ideal = self.__class__
-        return int(string.split("\n")[1]), Ideal(r, [entry.replace(",", "") for entry in string.split("\n")[3:]])
+        return max(indices), Ideal(r, [entry.replace(",", "") for entry in minbase.split("\n")])
 
     def primeTestDLP(self, verbose=False, timeout_fpoly=10, timeout_dim=600,
                      seminumerical_dim_computation=False, nbr_points=100,
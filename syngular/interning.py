@@ -0,0 +1,144 @@
+import functools
+import hashlib
+import threading
+import syngular
+
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "currsize", "maxsize", "nbytes", "maxbytes"])
+
+
+def intern_key(ring, generators):
+    """Digest identifying an ideal definition, i.e. the ring (including qring and degBound) and the generators as sent to Singular."""
+    string = f"{ring}\n{generators}"
+    return hashlib.blake2b(string.encode("utf-8"), digest_size=16).digest()
+
+
+def approximate_nbytes(value):
+    """Rough memory footprint of a cached value, dominated by the length of the polynomial strings it holds."""
+    if isinstance(value, str):
+        return len(value)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        return 8 * len(value) + sum(map(approximate_nbytes, value))
+    elif isinstance(value, dict):
+        return sum(approximate_nbytes(key) + approximate_nbytes(val) for key, val in value.items())
+    elif hasattr(value, "generators"):  # Ideal
+        return approximate_nbytes(value.generators)
+    else:
+        return 8
+
+
+class _FrozenList(tuple):
+    """Immutable copy of a list held by the intern table, handed out as a new list at each lookup."""
+
+
+class InternTable(object):
+    """Process-wide, thread-safe LRU table mapping ideal definitions to a shared bundle of computed invariants. Lists are stored as immutable copies.
+    The bounds are read from syngular.IDEAL_CACHE_MAXSIZE (number of ideals) and syngular.IDEAL_CACHE_MAXBYTES at each insertion."""
+
+    def __init__(self):
+        self._bundles = OrderedDict()
+        self._nbytes = {}
+        self._total_nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def enabled(self):
+        return syngular.IDEAL_CACHE_MAXSIZE != 0
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._bundles
+
+    def __len__(self):
+        return len(self._bundles)
+
+    def register(self, key):
+        """Makes sure a (possibly empty) bundle exists for key, marking it as most recently used."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if key in self._bundles:
+                self._bundles.move_to_end(key)
+            else:
+                self._bundles[key] = {}
+                self._nbytes[key] = 0
+                self._evict()
+
+    def lookup(self, key, name):
+        """Returns (True, value) if the invariant 'name' is known for key, (False, None) otherwise."""
+        with self._lock:
+            bundle = self._bundles.get(key)
+            if bundle is not None and name in bundle:
+                self._bundles.move_to_end(key)
+                self.hits += 1
+                value = bundle[name]
+                return True, list(value) if isinstance(value, _FrozenList) else value
+            self.misses += 1
+            return False, None
+
+    def store(self, key, name, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.register(key)
+            if key not in self._bundles:  # evicted straight away, e.g. maxbytes too small
+                return
+            bundle = self._bundles[key]
+            if isinstance(value, list):  # a copy, so that in-place changes to a caller's list do not reach other equal ideals
+                value = _FrozenList(value)
+            nbytes = approximate_nbytes(value) - (approximate_nbytes(bundle[name]) if name in bundle else 0)
+            bundle[name] = value
+            self._nbytes[key] += nbytes
+            self._total_nbytes += nbytes
+            self._evict()
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._bundles:
+                del self._bundles[key]
+                self._total_nbytes -= self._nbytes.pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._bundles.clear()
+            self._nbytes.clear()
+            self._total_nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _evict(self):
+        maxsize, maxbytes = syngular.IDEAL_CACHE_MAXSIZE, syngular.IDEAL_CACHE_MAXBYTES
+        while self._bundles and ((maxsize is not None and len(self._bundles) > maxsize) or
+                                 (maxbytes is not None and self._total_nbytes > maxbytes)):
+            key, _ = self._bundles.popitem(last=False)
+            self._total_nbytes -= self._nbytes.pop(key)
+            self.evictions += 1
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, len(self._bundles),
+                             syngular.IDEAL_CACHE_MAXSIZE, self._total_nbytes, syngular.IDEAL_CACHE_MAXBYTES)
+
+
+ideal_intern_table = InternTable()
+
+
+class interned_cached_property(functools.cached_property):
+    """A functools.cached_property whose value is also shared, via the intern table, among all ideals with the same definition.
+    The instance needs an '_intern_key' attribute. Lists are shared as immutable copies, and each instance gets its own list."""
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.attrname in cache:
+            return cache[self.attrname]
+        key = instance._intern_key
+        found, val = ideal_intern_table.lookup(key, self.attrname)
+        if not found:
+            val = self.func(instance)
+            ideal_intern_table.store(key, self.attrname, val)
+        cache[self.attrname] = val
+        return val
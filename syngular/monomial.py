@@ -18,10 +18,11 @@ def unicode_powers(string):
 
 
 def non_unicode_powers(string):
-    """Convert superscript digits back into ^ followed by normal digits."""
-    return re.sub(r"[⁰¹²³⁴⁵⁶⁷⁸⁹]+",
-                  lambda m: "^" + "".join(str(list(unicode_powers_dict.values()).index(c)) for c in m.group(0)),
-                  string)
+    """Convert superscript digits back into ^ followed by normal digits, with negative powers (superscript minus) in brackets."""
+    def power(match):
+        digits = "".join(str(list(unicode_powers_dict.values()).index(c)) for c in match.group(2))
+        return f"^(-{digits})" if match.group(1) else f"^{digits}"
+    return re.sub(r"(⁻?)([⁰¹²³⁴⁵⁶⁷⁸⁹]+)", power, string)
 
 
 def preserve_class_binary_op(func):
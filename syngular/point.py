@@ -1,7 +1,11 @@
+import ast
+import functools
+import numpy
 import sympy
 import re
 
 from copy import deepcopy
+from sympy.printing.str import StrPrinter
 
 from .ideal import Ideal
 from .monomial import non_unicode_powers
@@ -10,14 +14,51 @@ from .monomial import non_unicode_powers
 class RingPoint(dict):
     """Represents a numerical or semi-numerical point on a variety within the space defiend by the ring.
     Generalizes the idea of a phase space point from particle physics.
+    Points share their ring and field by reference (also when copied), and cache their hash until they are mutated.
     """
 
+    __slots__ = ("ring", "field", "_hash")
+
     def __init__(self, ring, field, seed=None, val=None, ):
         if val is None:
             super().__init__(ring.random_point(field, seed=seed))
         else:
             super().__init__(val)
-        self.ring, self.field = ring, field
+        self.ring, self.field, self._hash = ring, field, None
+
+    # mutations invalidate the cached hash
+
+    def __setitem__(self, key, value):
+        self._hash = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._hash = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._hash = None
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._hash = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._hash = None
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._hash = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._hash = None
+        return super().popitem()
+
+    def clear(self):
+        self._hash = None
+        super().clear()
 
     @staticmethod
     def _parse(string):
@@ -31,7 +72,7 @@ class RingPoint(dict):
         return string
 
     def __call__(self, string):
-        return eval(self._parse(string), {}, self)
+        return eval(compiled_expression(string), {}, self)
 
     def univariate_slice(self, extra_approximate_constraints=(), indepSet=None, seed=None, verbose=False):
         t = sympy.symbols('t')
@@ -40,15 +81,36 @@ class RingPoint(dict):
         return self
 
     def subs(self, myDict):
+        """Substitutes into the symbolic values (e.g. t on a univariate slice) and casts them to the field; numerical values are left as they are."""
+        if all(isinstance(key, (str, sympy.Symbol)) and isinstance(value, (int, sympy.Number)) for key, value in myDict.items()):
+            replacements = {sympy.Symbol(key) if isinstance(key, str) else key: sympy.Integer(value) if isinstance(value, int) else value for key, value in myDict.items()}
+
+            def substitute(val):
+                return val.xreplace(replacements)  # plain symbol replacement, much faster than subs
+        else:
+            def substitute(val):
+                return val.subs(myDict)
         for key, val in self.items():
-            self[key] = self.field(val.subs(myDict))
+            if isinstance(val, sympy.Basic):
+                self[key] = self.field(substitute(val))
         return self
 
     def copy(self):
-        return deepcopy(self)
+        """A shallow copy: values (field elements or sympy expressions) are immutable, ring and field are shared."""
+        return RingPoint(self.ring, self.field, val=self)
+
+    __copy__ = copy
+
+    def __deepcopy__(self, memo):
+        return RingPoint(self.ring, self.field, val={key: deepcopy(value, memo) for key, value in self.items()})
+
+    def __reduce__(self):
+        return (_ring_point, (self.ring, self.field, dict(self)))
 
     def __hash__(self):
-        return hash((frozenset(super().items()), self.ring, self.field))
+        if self._hash is None:
+            self._hash = hash(frozenset(super().items()))  # consistent with __eq__, which (as for dicts) compares the values only
+        return self._hash
 
     def singular_variety(self, directions_or_ideal=None, valuations=tuple(), seed=None, verbose=False):
         if isinstance(directions_or_ideal, Ideal):
@@ -59,3 +121,78 @@ class RingPoint(dict):
             directions = directions_or_ideal
         self.update(I.point_on_variety(field=self.field, directions=directions, valuations=valuations, seed=seed, verbose=verbose))
         return self
+
+
+def _ring_point(ring, field, values):
+    return RingPoint(ring, field, val=values)
+
+
+class _ConstantWrapper(ast.NodeTransformer):
+    """Wraps the integer literals in _constant(...), except in exponents, which stay Python ints."""
+
+    def visit_BinOp(self, node):
+        node.left = self.visit(node.left)
+        if not isinstance(node.op, ast.Pow):
+            node.right = self.visit(node.right)
+        return node
+
+    def visit_Constant(self, node):
+        if type(node.value) is int:
+            return ast.Call(ast.Name("_constant", ast.Load()), [node], [])
+        return node
+
+
+@functools.lru_cache(maxsize=4096)
+def compiled_expression(string, wrap_constants=False):
+    """The string expression parsed by RingPoint._parse and compiled to a code object, cached.
+    With wrap_constants, the integer literals (except exponents) are wrapped in _constant(...), as needed by ColumnarRingPoints."""
+    tree = ast.parse(RingPoint._parse(string), mode="eval")
+    if wrap_constants:
+        tree = ast.fix_missing_locations(_ConstantWrapper().visit(tree))
+    return compile(tree, "<expression>", "eval")
+
+
+class _FieldRationalPrinter(StrPrinter):
+    """Prints rationals as field divisions, not as float divisions of Python ints."""
+
+    def _print_Rational(self, expr):
+        return f"(_field({expr.p}) / _field({expr.q}))" if expr.q != 1 else str(expr.p)
+
+
+class CompiledExpressions(object):
+    """A list of string expressions compiled into a single Python function, optionally with common subexpressions
+    (as found by sympy.cse) computed once. Callable on a RingPoint (list of values), RingPoints (array of shape
+    (points, expressions)) or ColumnarRingPoints (list of columns)."""
+
+    def __init__(self, strings, cse=False):
+        self.strings, self.cse = tuple(strings), cse
+        parsed = [RingPoint._parse(string) for string in self.strings]
+        names = sorted(set(name for string in parsed for name in re.findall(r"[A-Za-z_]\w*", string)))
+        symbols = {name: sympy.Symbol(name) for name in names}
+        expressions = [sympy.parse_expr(string, local_dict=symbols) for string in parsed]
+        replacements, expressions = sympy.cse(expressions, symbols=sympy.numbered_symbols("_cse")) if cse else ([], expressions)
+        printer = _FieldRationalPrinter()
+        self.source = "\n".join(["def _evaluate(_field, _point):"] +
+                                [f"    {name} = _point['{name}']" for name in names] +
+                                [f"    {symbol} = {printer.doprint(expression)}" for symbol, expression in replacements] +
+                                [f"    return [{', '.join(printer.doprint(expression) for expression in expressions)}]"])
+        namespace = {}
+        exec(compile(self.source, "<compiled expressions>", "exec"), namespace)
+        self._evaluate = namespace["_evaluate"]
+
+    def __call__(self, point):
+        from .points import RingPoints, ColumnarRingPoints
+        if isinstance(point, ColumnarRingPoints):
+            return [point._broadcast(value) for value in self._evaluate(point._constant, point.columns)]
+        if isinstance(point, RingPoints):
+            return numpy.array([self._evaluate(entry.field, entry) for entry in point])
+        return self._evaluate(point.field, point)
+
+    def __repr__(self):
+        return f"CompiledExpressions({list(self.strings)}, cse={self.cse})"
+
+
+@functools.lru_cache(maxsize=256)
+def compiled_expressions(strings, cse=False):
+    """The CompiledExpressions of a tuple of strings, cached."""
+    return CompiledExpressions(strings, cse=cse)
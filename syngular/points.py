@@ -1,5 +1,8 @@
 import numpy
 
+from fractions import Fraction
+from pyadic import ModP
+
 
 class RingPoints(list):
 
@@ -26,3 +29,217 @@ class RingPoints(list):
 
     def __hash__(self):
         return hash(tuple(self))
+
+    def columnar(self):
+        """The points as ColumnarRingPoints (one array of values per variable)."""
+        return ColumnarRingPoints.from_points(self)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Struct-of-arrays points
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+class ModPArray(object):
+    """Residues modulo a prime p < 2^31 in an int64 array (products of two residues fit), with vectorized field arithmetic.
+    Operands can be ModPArrays, ModPs, ints or Fractions; a 0-dimensional ModPArray acts as a constant."""
+
+    __array_priority__ = 1000  # numpy defers the binary operators to ModPArray
+
+    def __init__(self, residues, p):
+        self.residues, self.p = numpy.asarray(residues, dtype=numpy.int64) % p, p
+
+    @classmethod
+    def from_values(cls, values, p):
+        return cls(numpy.fromiter((int(value) for value in values), dtype=numpy.int64), p)
+
+    def _residues(self, other):
+        if isinstance(other, ModPArray):
+            if other.p != self.p:
+                raise ValueError(f"Mismatched characteristics {self.p} and {other.p}.")
+            return other.residues
+        if isinstance(other, (int, numpy.integer, Fraction, ModP)):
+            return int(ModP(other, self.p))
+        if isinstance(other, numpy.ndarray):
+            return other.astype(numpy.int64) % self.p if other.dtype != object else numpy.vectorize(lambda entry: int(ModP(entry, self.p)), otypes=[numpy.int64])(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else ModPArray(self.residues + other, self.p)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else ModPArray(self.residues - other, self.p)
+
+    def __rsub__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else ModPArray(other - self.residues, self.p)
+
+    def __mul__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else ModPArray(self.residues * other, self.p)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, ModPArray):
+            other = self._residues(other)
+            if other is NotImplemented:
+                return other
+            other = ModPArray(other, self.p)
+        return self * other._inv()
+
+    def __rtruediv__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else ModPArray(other, self.p) * self._inv()
+
+    def __neg__(self):
+        return ModPArray(-self.residues, self.p)
+
+    def __pos__(self):
+        return self
+
+    def __pow__(self, n):
+        assert isinstance(n, (int, numpy.integer)) or n.is_integer()
+        n = int(n)
+        if n < 0:
+            return self._inv() ** -n
+        result, power = ModPArray(numpy.ones_like(self.residues), self.p), self.residues
+        while n > 0:
+            if n & 1:
+                result = ModPArray(result.residues * power, self.p)
+            power, n = power * power % self.p, n >> 1
+        return result
+
+    def _inv(self):
+        if numpy.any(self.residues == 0):
+            raise ZeroDivisionError("Division by zero modulo p.")
+        return self ** (self.p - 2)
+
+    def __eq__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else self.residues == other
+
+    def __ne__(self, other):
+        other = self._residues(other)
+        return other if other is NotImplemented else self.residues != other
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self.residues)
+
+    @property
+    def shape(self):
+        return self.residues.shape
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, numpy.integer)):
+            return ModP(int(self.residues[index]), self.p)
+        return ModPArray(self.residues[index], self.p)
+
+    def __iter__(self):
+        return (ModP(int(residue), self.p) for residue in self.residues)
+
+    def __array__(self, dtype=None, copy=None):
+        array = numpy.empty(self.residues.shape, dtype=object)
+        array.flat[:] = [ModP(int(residue), self.p) for residue in self.residues.flat]
+        return array
+
+    def tolist(self):
+        return list(self)
+
+    def __repr__(self):
+        return f"ModPArray({self.residues!r}, {self.p})"
+
+
+class ColumnarRingPoints(object):
+    """Points sharing a ring and a field, stored as one column of values per ring variable:
+    a ModPArray over finite fields with p < 2^31, a numpy object array of field values otherwise.
+    Expressions are evaluated once on the columns instead of once per point."""
+
+    def __init__(self, ring, field, columns):
+        self.ring, self.field = ring, field
+        self.variables = tuple(map(str, ring.variables))
+        self.columns = {variable: self._column(columns[variable]) for variable in self.variables}
+
+    @property
+    def _is_int64(self):
+        return self.field.name == "finite field" and self.field.characteristic < 2 ** 31
+
+    def _column(self, values):
+        if self._is_int64:
+            return values if isinstance(values, ModPArray) else ModPArray.from_values(values, self.field.characteristic)
+        if isinstance(values, numpy.ndarray) and values.dtype == object:
+            return values
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = list(values)
+        return column
+
+    @classmethod
+    def from_points(cls, points, ring=None, field=None):
+        """From an iterable of RingPoints over a common ring and field, which must be given if there are no points."""
+        points = list(points)
+        if points == [] and (ring is None or field is None):
+            raise ValueError("The ring and field are needed to build ColumnarRingPoints from no points.")
+        ring = points[0].ring if ring is None else ring
+        field = points[0].field if field is None else field
+        if any(str(point.ring) != str(ring) or point.field != field for point in points):
+            raise ValueError(f"All points must be in {ring} over {field}.")
+        return cls(ring, field, {str(variable): [point[str(variable)] for point in points] for variable in ring.variables})
+
+    @classmethod
+    def concatenate(cls, many_points):
+        """Concatenates ColumnarRingPoints in a common ring over a common field (with a common prime)."""
+        many_points = list(many_points)
+        if many_points == []:
+            raise ValueError("Need at least one ColumnarRingPoints to concatenate.")
+        first = many_points[0]
+        if any(str(points.ring) != str(first.ring) or points.field != first.field for points in many_points):
+            raise ValueError(f"All points must be in {first.ring} over {first.field}.")
+        if first._is_int64:
+            columns = {variable: ModPArray(numpy.concatenate([points.columns[variable].residues for points in many_points]), first.field.characteristic)
+                       for variable in first.variables}
+        else:
+            columns = {variable: numpy.concatenate([points.columns[variable] for points in many_points]) for variable in first.variables}
+        return cls(first.ring, first.field, columns)
+
+    def __len__(self):
+        return len(self.columns[self.variables[0]])
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, numpy.integer)):
+            from .point import RingPoint
+            return RingPoint(self.ring, self.field, val={variable: self.columns[variable][index] for variable in self.variables})
+        return ColumnarRingPoints(self.ring, self.field, {variable: self.columns[variable][index] for variable in self.variables})
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __call__(self, string_expr):
+        """Evaluates the expression on all points at once; returns a column (ModPArray or numpy object array)."""
+        from .point import compiled_expression
+        return self._broadcast(eval(compiled_expression(string_expr, wrap_constants=True), {"_constant": self._constant}, self.columns))
+
+    def _broadcast(self, value):
+        """The value as a column, e.g. for constant expressions."""
+        return value if numpy.shape(value) == (len(self), ) else self._column([self.field(0)] * len(self)) + value
+
+    def _constant(self, n):
+        """A field constant broadcasting against the columns."""
+        if self._is_int64:
+            return ModPArray(n, self.field.characteristic)
+        constant = numpy.empty((), dtype=object)
+        constant[()] = self.field(n)
+        return constant
+
+    def to_ring_points(self):
+        from .point import RingPoint
+        return RingPoints([RingPoint(self.ring, self.field, val=values) for values in
+                           (dict(zip(self.variables, row)) for row in zip(*(self.columns[variable] for variable in self.variables)))])
+
+    def __repr__(self):
+        return f"ColumnarRingPoints({self.ring}, {self.field}, {len(self)} points)"
@@ -294,6 +294,13 @@ class Polynomial(object):
     def __call__(self, *args, **kwargs):
         return self.subs(*args, **kwargs)
 
+    def diff(self, variable):
+        """Partial derivative with respect to variable."""
+        variable = str(variable)
+        coeffs_and_monomials = [(coeff * monomial[variable], Monomial({key: exp - (key == variable) for key, exp in monomial.items() if key != variable or exp > 1}))
+                                for coeff, monomial in self.coeffs_and_monomials if variable in monomial]
+        return Polynomial(coeffs_and_monomials, self.field) if coeffs_and_monomials != [] else Polynomial(0, self.field)
+
     def __len__(self):
         return len(self.coeffs_and_monomials)
 
@@ -411,6 +418,76 @@ class Polynomial(object):
             return self * (self ** (n - 1))
 
 
+class EvaluationPlan(object):
+    """Straight-line program evaluating many Polynomials at the same point. The monomials of all polynomials are merged into a DAG:
+    each power of a variable is computed once (by squaring), and each product of powers once per prefix in a fixed variable order,
+    so monomials sharing factors share multiplications. Callable on a point (list of values), RingPoints (array of shape
+    (points, polynomials)) or ColumnarRingPoints (list of columns)."""
+
+    def __init__(self, polynomials):
+        self.polynomials = tuple(polynomials)
+        self.variables = tuple(sorted({variable for polynomial in self.polynomials for monomial in polynomial.monomials for variable in monomial}))
+        order = {variable: i for i, variable in enumerate(self.variables)}
+        lines, nodes = [], {}
+
+        def node(key, expression):
+            if key not in nodes:
+                nodes[key] = f"_v{len(lines)}"
+                lines.append(f"    {nodes[key]} = {expression}")
+            return nodes[key]
+
+        def power(variable, exponent):
+            if exponent == 1:
+                return node((variable, 1), f"_point[{variable!r}]")
+            if (variable, exponent) not in nodes:
+                node((variable, exponent), f"{power(variable, exponent // 2)} * {power(variable, exponent - exponent // 2)}")
+            return nodes[(variable, exponent)]
+
+        def product(factors):
+            if len(factors) == 1:
+                return power(*factors[0])
+            if factors not in nodes:
+                node(factors, f"{product(factors[:-1])} * {power(*factors[-1])}")
+            return nodes[factors]
+
+        self.coeffs, values = [], []
+        for polynomial in self.polynomials:
+            terms = []
+            for coeff, monomial in polynomial.coeffs_and_monomials:
+                self.coeffs += [coeff]
+                if len(monomial) == 0:
+                    terms += [f"_c[{len(self.coeffs) - 1}]"]
+                else:
+                    monomial_node = product(tuple(sorted(monomial.items(), key=lambda item: order[item[0]])))
+                    terms += [monomial_node if coeff == 1 else f"_c[{len(self.coeffs) - 1}] * {monomial_node}"]
+            values += [" + ".join(terms)]
+        self.multiplications = sum(line.count("*") for line in lines) + sum(value.count("*") for value in values)
+        self.source = "\n".join(["def _evaluate(_c, _point):"] + lines + [f"    return [{', '.join(values)}]"])
+        namespace = {}
+        exec(compile(self.source, "<evaluation plan>", "exec"), namespace)
+        self._evaluate = namespace["_evaluate"]
+
+    def __call__(self, point):
+        from .points import RingPoints, ColumnarRingPoints
+        if isinstance(point, ColumnarRingPoints):
+            return [point._broadcast(value) for value in self._evaluate(self.coeffs, point.columns)]
+        if isinstance(point, RingPoints):
+            return numpy.array([self._evaluate(self.coeffs, entry) for entry in point])
+        return self._evaluate(self.coeffs, {str(key): value for key, value in point.items()})
+
+    def __len__(self):
+        return len(self.polynomials)
+
+    def __repr__(self):
+        return f"EvaluationPlan({len(self)} polynomials, {self.multiplications} multiplications)"
+
+
+@functools.lru_cache(maxsize=256)
+def evaluation_plan(polynomials, field):
+    """The EvaluationPlan of a tuple of polynomials given as strings (e.g. Ideal.generators or Ideal.groebner_basis) over the field, cached."""
+    return EvaluationPlan([Polynomial(polynomial, field) for polynomial in polynomials])
+
+
 def remove_outer_parentheses_if_product_like(s, allowed_sign_predecessors=",[(<⟨"):
     m = re.fullmatch(r"\s*([+-]?)\(([^()]*)\)\s*", s)
     if m is None:
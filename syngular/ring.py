@@ -1,8 +1,13 @@
+import functools
+import multiprocessing
 import sympy
 import syngular
 
-from pycoretools import flatten
+from pycoretools import default_cores
 
+from .field import Field
+from .polynomial import Polynomial
+from .settings import TemporarySetting
 from .tools import execute_singular_command
 
 
@@ -93,12 +98,17 @@ class Ring(object):
         return RingPoint(self, field, val=point_val)
 
     def univariate_slice(ring, field, extra_approximate_constraints=(), indepSet=None, seed=None, verbose=False):
-        from .polynomial import Polynomial
+        """A random line var = point1[var] + t * direction[var] in the ring, with point1 on the approximate constraints (valuation one)
+        and the line within the variety of the quotient ring, as a picklable UnivariateSlice callable on t.
+        Only the coordinates with indepSet 1 (default: all) move along the line. The shifted system is computed once per ring and constraints."""
         from .point import RingPoint
         from .ideal import Ideal
         from .qring import QRing
+        if field.characteristic == 0:
+            raise NotImplementedError("Univariate slices are implemented over finite fields and p-adics.")
         if indepSet is None:
             indepSet = (1, ) * len(ring.variables)
+        system = ring._shifted_system(extra_approximate_constraints)
         j = Ideal(ring, extra_approximate_constraints)
         p = j.point_on_variety(
             field=field, seed=seed,
@@ -106,43 +116,110 @@ class Ring(object):
             valuations=(1, ) * len(extra_approximate_constraints)
         )
         point1 = RingPoint(ring, field, val=p)
-        # print('approx gens:', [point1(gen) for gen in extra_approximate_constraints])
-        xs = tuple(sympy.symbols([f"x{var}" for var in ring.variables]))
-        t = sympy.symbols('t')
-        point2partial = {str(x): 0 for i, x in enumerate(xs) if indepSet[i] == 0}
-        if isinstance(ring, QRing):
-            equations = [sympy.poly(sympy.poly(generator).subs({var: var + t * x for var, x in zip(ring.variables, xs)}).subs(point1).subs(point2partial).expand(),
-                                    modulus=field.characteristic ** field.digits)
-                         for generator in ring.ideal.generators]
-            equations = [entry for entry in flatten([sympy.poly(eq, t).all_coeffs() for eq in equations]) if entry != 0]
-            if verbose:
-                print("Built q-ring equations:")
-                print("[" + ",\n ".join(map(str, equations)) + "]")
-        else:
-            equations = []
-
-        equations_approximate = [sympy.poly(
-            sympy.poly(constraint).subs({var: var + t * x for var, x in zip(ring.variables, xs)}).subs(point1).subs(point2partial).expand(),
-            modulus=field.characteristic ** field.digits) for constraint in extra_approximate_constraints
-        ]
-        # print(equations_approximate)
-        equations_approximate = [entry for entry in flatten([sympy.poly(eq, t).all_coeffs() for eq in equations_approximate]) if entry != 0]
-        # print(equations_approximate)
-
-        ring2 = Ring(field.characteristic, tuple(x for i, x in enumerate(xs) if indepSet[i] == 1), 'dp')
-        ideal2 = Ideal(ring2, list(map(str, equations + equations_approximate)))
-        # print(ideal2, ideal2.dim)
+        equations = system.equations(point1, field, indepSet)
+        if verbose:
+            print("Built shifted equations:")
+            print("[" + ",\n ".join(equations) + "]")
+        ring2 = Ring(field.characteristic, tuple(x for x, moves in zip(system.xs, indepSet) if moves == 1), 'dp')
+        ideal2 = Ideal(ring2, equations)
         point2 = ideal2.point_on_variety(field, directions=(), seed=None if seed is None else seed + 1, verbose=verbose)
         # Should check whether the ideal is the origin
-        point2 = point2partial | point2
+        point2 = {x: field(0) for x, moves in zip(system.xs, indepSet) if moves == 0} | point2
+        univariate_slice = UnivariateSlice(point1, {str(var): point2[x] for var, x in zip(ring.variables, system.xs)})
         if verbose:
             print("Built shift with line coefficients:")
-            print(point1)
-            print(point2)
-
-        def univariate_slice(t):
-            return {key1: point2[key2] * t + point1[key1] for i, (key1, key2) in enumerate(zip(map(str, ring.variables), map(str, xs)))}
-
+            print(univariate_slice)
         if isinstance(ring, QRing):
             assert all([Polynomial(generator, field).subs(univariate_slice(field.random())) == 0 for generator in ring.ideal.generators])
         return univariate_slice
+
+    def univariate_slices(ring, field, seeds, extra_approximate_constraints=(), indepSet=None, cores=None, verbose=False):
+        """Independent univariate slices, one per seed, computed in cores worker processes (default_cores() if None, serially if 1)."""
+        seeds = list(seeds)
+        cores = min(default_cores() if cores is None else cores, max(len(seeds), 1))
+        ring._shifted_system(extra_approximate_constraints)  # computed once, before forking the workers
+        tasks = [(ring, field, extra_approximate_constraints, indepSet, seed, verbose) for seed in seeds]
+        if cores == 1:
+            return list(map(_univariate_slice_for_seed, tasks))
+        with multiprocessing.get_context("fork").Pool(cores) as pool:
+            return pool.map(_univariate_slice_for_seed, tasks)
+
+    def _shifted_system(ring, extra_approximate_constraints=()):
+        from .qring import QRing
+        generators = tuple(ring.ideal.generators) if isinstance(ring, QRing) else ()
+        constraints = tuple(str(sympy.expand(constraint)) if isinstance(constraint, sympy.core.Basic) else constraint
+                            for constraint in extra_approximate_constraints)
+        return shifted_system(tuple(map(str, ring.variables)), generators + constraints)
+
+
+def _univariate_slice_for_seed(arguments):
+    """A univariate slice in a worker process of univariate_slices; nested speculative pools are disabled (workers are daemonic)."""
+    ring, field, extra_approximate_constraints, indepSet, seed, verbose = arguments
+    with TemporarySetting("syngular", "POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS", None):
+        return ring.univariate_slice(field, extra_approximate_constraints=extra_approximate_constraints, indepSet=indepSet, seed=seed, verbose=verbose)
+
+
+class UnivariateSlice(object):
+    """The line var = point[var] + t * direction[var], callable on t (numbers or symbols). Picklable, unlike a closure."""
+
+    def __init__(self, point, direction):
+        self.point, self.direction = dict(point), dict(direction)
+
+    def __call__(self, t):
+        return {var: self.direction[var] * t + self.point[var] for var in self.point}
+
+    def __repr__(self):
+        return f"UnivariateSlice({self.point}, {self.direction})"
+
+
+class ShiftedSystem(object):
+    """The generators g(var + t * xvar), expanded once over Q in native Polynomial arithmetic. Each coefficient of a power of t is stored as a sum over
+    monomials in the xvar's of coefficients given as (rational, monomial in the variables) terms, such that a numerical point only needs evaluating these."""
+
+    def __init__(self, variables, generators):
+        self.variables, self.generators = variables, generators
+        self.xs = tuple(f"x{var}" for var in variables)
+        Q = Field("rational", 0, 0)
+        t, shifts = "tslice", {var: Polynomial(f"{var}+tslice*{x}", Q) for var, x in zip(variables, self.xs)}
+        self.terms = []
+        for generator in generators:
+            by_power = {}
+            for coeff, monomial in Polynomial(generator, Q).subs(shifts).coeffs_and_monomials:
+                x_monomial = tuple((x, exponent) for x, exponent in monomial.items() if x in self.xs)
+                var_monomial = tuple((var, exponent) for var, exponent in monomial.items() if var in variables)
+                by_power.setdefault(dict(monomial.items()).get(t, 0), {}).setdefault(x_monomial, []).append((coeff, var_monomial))
+            self.terms += [list(by_power[power].items()) for power in sorted(by_power)]
+        self._field_terms = {}
+
+    def __repr__(self):
+        return f"ShiftedSystem({self.variables}, {self.generators})"
+
+    def equations(self, point, field, indepSet):
+        """The non-vanishing coefficients of the powers of t at the given point, as Singular strings in the xvar's with indepSet 1."""
+        if str(field) not in self._field_terms:
+            self._field_terms[str(field)] = [[(x_monomial, [(field(coeff), var_monomial) for coeff, var_monomial in coeffs]) for x_monomial, coeffs in equation]
+                                             for equation in self.terms]
+        fixed = {x for x, moves in zip(self.xs, indepSet) if moves == 0}
+        equations = []
+        for equation in self._field_terms[str(field)]:
+            string = ""
+            for x_monomial, coeffs in equation:
+                if any(x in fixed for x, _ in x_monomial):
+                    continue
+                value = field(0)
+                for coeff, var_monomial in coeffs:
+                    term = coeff
+                    for var, exponent in var_monomial:
+                        term = term * point[var] ** exponent
+                    value = value + term
+                if value != 0:
+                    string += "+" + "*".join([str(int(value))] + [f"{x}^{exponent}" for x, exponent in x_monomial])
+            if string != "":
+                equations += [string[1:]]
+        return equations
+
+
+@functools.lru_cache(maxsize=32)
+def shifted_system(variables, generators):
+    """The ShiftedSystem of the generators (tuple of strings) in the variables (tuple of strings), cached."""
+    return ShiftedSystem(variables, generators)
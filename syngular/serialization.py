@@ -0,0 +1,504 @@
+import json
+import mpmath
+import numpy
+import os
+import pathlib
+import re
+import warnings
+
+from .interning import ideal_intern_table
+
+
+FORMAT = "syngular-ideals"
+FORMAT_VERSION = 2  # 2: adds minimal_associated_primes, lex_groebner_bases, multiplication_matrices and rational_parametrisation
+SUPPORTED_FORMAT_VERSIONS = (1, 2)
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Polynomial strings <-> coefficient strings and exponent arrays
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+def _split_top_level(string, separators):
+    """Splits string at the separators which are not within parentheses, nor the sign of a floating point exponent (e.g. 1.2e-05).
+    Separators in '+-' are kept as the first character of the following chunk."""
+    chunks, chunk, depth = [], "", 0
+    for char in string:
+        if char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth -= 1
+        if (depth == 0 and char in separators and chunk != "" and
+           not (char in "+-" and chunk[-1] in "eE" and len(chunk) > 1 and (chunk[-2].isdigit() or chunk[-2] == "."))):
+            chunks += [chunk]
+            chunk = char if char in "+-" else ""
+        else:
+            chunk += char
+    return chunks + [chunk]
+
+
+def poly_to_terms(polynomial, variables):
+    """Splits a polynomial string, as printed by Singular with short=0, into signed coefficient strings and an array of exponents.
+    Returns None if the string can not be faithfully represented, i.e. if terms_to_poly would not return it unchanged."""
+    variables_index = {variable: i for i, variable in enumerate(variables)}
+    coeffs, exps = [], []
+    for term in _split_top_level(polynomial, "+-"):
+        term_exps = [0] * len(variables)
+        coeff = term[0] if term[:1] in ("+", "-") else ""
+        factors = _split_top_level(term[len(coeff):], "*")
+        for j, factor in enumerate(factors):
+            base, _, exp = factor.partition("^")
+            if base in variables_index and (exp == "" or exp.isdigit()):
+                term_exps[variables_index[base]] += int(exp) if exp != "" else 1
+            elif j == 0 and not any(name in variables_index for name in re.findall(r"[a-zA-Z_]\w*", factor)):
+                coeff += factor
+            else:
+                return None
+        coeffs += [coeff]
+        exps += [term_exps]
+    if terms_to_poly(coeffs, exps, variables) != polynomial:
+        return None
+    return coeffs, exps
+
+
+def terms_to_poly(coeffs, exps, variables):
+    """Inverse of poly_to_terms."""
+    terms = []
+    for coeff, term_exps in zip(coeffs, exps):
+        monomial = "*".join(variable if exp == 1 else f"{variable}^{exp}" for variable, exp in zip(variables, term_exps) if exp != 0)
+        if coeff in ("", "+", "-") or monomial == "":
+            terms += [coeff + monomial]
+        else:
+            terms += [f"{coeff}*{monomial}"]
+    return "".join(terms)
+
+
+def _min_uint_dtype(max_value):
+    for dtype in (numpy.uint8, numpy.uint16, numpy.uint32, numpy.uint64):
+        if max_value <= numpy.iinfo(dtype).max:
+            return dtype
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Writer
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+class _IdealsWriter(object):
+
+    def __init__(self):
+        self.rings, self.ring_index = [], {}
+        self.ideals, self.ideal_index = [], {}
+        self.terms = {}  # ring index -> (coeffs, exps, polynomial term offsets)
+
+    def add_ring(self, ring):
+        from .qring import QuotientRing
+        key = str(ring)
+        if key not in self.ring_index:
+            field = ring.field
+            if isinstance(field, tuple):
+                field = {"tuple": list(map(str, field))}
+            elif isinstance(field, int):
+                field = {"int": field}
+            else:
+                field = {"str": str(field)}
+            spec = {"field": field, "variables": list(map(str, ring.variables)),
+                    "ordering": ring.ordering if isinstance(ring.ordering, str) else list(ring.ordering), "qring": None}
+            if isinstance(ring, QuotientRing):
+                spec["base"] = self.add_ring(ring.ideal.ring)
+                spec["qring"] = self.add_ideal(ring.ideal)
+            self.ring_index[key] = len(self.rings)
+            self.rings += [spec]
+            self.terms[self.ring_index[key]] = ([], [], [0])
+        return self.ring_index[key]
+
+    def add_polys(self, ring_index, polys):
+        polys = list(map(str, polys))
+        variables = self.rings[ring_index]["variables"]
+        encoded = [poly_to_terms(poly, variables) for poly in polys]
+        if any(entry is None for entry in encoded):
+            return {"strings": polys}
+        coeffs, exps, offsets = self.terms[ring_index]
+        start = len(offsets) - 1
+        for poly_coeffs, poly_exps in encoded:
+            coeffs += poly_coeffs
+            exps += poly_exps
+            offsets += [offsets[-1] + len(poly_coeffs)]
+        return {"ring": ring_index, "polys": [start, len(offsets) - 1]}
+
+    def add_ideal(self, ideal):
+        if id(ideal) in self.ideal_index:
+            return self.ideal_index[id(ideal)]
+        ring_index = self.add_ring(ideal.ring)
+        entry = {"ring": ring_index}
+        self.ideal_index[id(ideal)] = len(self.ideals)
+        self.ideals += [entry]
+        entry["generators"] = self.add_polys(ring_index, ideal.generators)
+        invariants = {}
+        for name in ideal._get_cached_properties_names():
+            value = ideal.__dict__[name]
+            if name in ("groebner_basis", "reduced_groebner_basis", "leadGBmonomials", "minbase"):
+                invariants[name] = self.add_polys(ring_index, value)
+            elif name == "indepSet":
+                invariants[name] = list(value)
+            elif name == "radical":
+                invariants[name] = self.add_ideal(value)
+            elif name == "primary_decomposition":
+                invariants[name] = [[self.add_ideal(primary), self.add_ideal(prime)] for primary, prime in value]
+            elif name == "minimal_associated_primes":
+                invariants[name] = [self.add_ideal(prime) for prime in value]
+            elif name == "multiplication_matrices":
+                invariants[name] = {"basis": value.basis, "matrices": value.matrices}
+            elif name == "rational_parametrisation":
+                invariants[name] = None if value is None else {"independent": list(value.independent), "formulas": value.formulas}
+            else:
+                warnings.warn(f"The cached property {name} of {ideal} is not saved, it will be recomputed after loading.")
+        lex_groebner_bases = getattr(ideal, "_lex_groebner_bases", {})
+        if lex_groebner_bases != {}:
+            invariants["lex_groebner_bases"] = {strategy: {"basis": self.add_polys(ring_index, value.basis), "strategy": value.strategy, "timings": value.timings}
+                                                for strategy, value in lex_groebner_bases.items()}
+        assigned_invariants = getattr(ideal, "_assigned_invariants", set())  # guessed or learnt values are not saved, as they would be shared once loaded
+        if ideal._dim is not None and "dim" not in assigned_invariants:
+            invariants["dim"] = ideal._dim
+        if ideal._indepSets is not None and "indepSets" not in assigned_invariants:
+            invariants["indepSets"] = list(map(list, ideal._indepSets))
+        fingerprint = getattr(ideal, "_fingerprint", None)
+        if fingerprint is not None:
+            invariants["fingerprint"] = {"prime": fingerprint.prime, "hilbert": None if fingerprint.hilbert is None else list(fingerprint.hilbert),
+                                         "groebner_basis": None if fingerprint.groebner_basis is None else self.add_polys(ring_index, fingerprint.groebner_basis)}
+        entry["invariants"] = invariants
+        return self.ideal_index[id(ideal)]
+
+    def arrays(self):
+        arrays = {}
+        for ring_index, (coeffs, exps, offsets) in self.terms.items():
+            nvars = len(self.rings[ring_index]["variables"])
+            exps = numpy.array(exps, dtype=numpy.uint64).reshape(-1, nvars)
+            arrays[f"exponents_{ring_index}"] = exps.astype(_min_uint_dtype(int(exps.max()) if exps.size > 0 else 0))
+            encoded_coeffs = [coeff.encode("utf-8") for coeff in coeffs]
+            arrays[f"coefficients_{ring_index}"] = numpy.frombuffer(b"".join(encoded_coeffs), dtype=numpy.uint8)
+            arrays[f"coefficient_offsets_{ring_index}"] = numpy.cumsum([0] + list(map(len, encoded_coeffs)), dtype=numpy.int64)
+            arrays[f"term_offsets_{ring_index}"] = numpy.array(offsets, dtype=numpy.int64)
+        return arrays
+
+
+def save_ideals(path, ideals):
+    """Saves ideals, together with their rings and all computed invariants (groebner bases, including the lex ones of each strategy, dim, indepSets,
+    primary decomposition, minimal associated primes, multiplication matrices, rational parametrisation, fingerprint),
+    to a single uncompressed numpy .npz file. Polynomials are stored as exponent arrays and coefficient strings."""
+    writer = _IdealsWriter()
+    indices = [writer.add_ideal(ideal) for ideal in ideals]
+    header = {"format": FORMAT, "version": FORMAT_VERSION, "rings": writer.rings, "ideals": writer.ideals, "saved": indices}
+    header = numpy.frombuffer(json.dumps(header).encode("utf-8"), dtype=numpy.uint8)
+    with open(path, "wb") as file:
+        numpy.savez(file, header=header, **writer.arrays())
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Reader
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+class _IdealsReader(object):
+
+    def __init__(self, header, arrays, cls):
+        self.header, self.arrays, self.cls = header, arrays, cls
+        self.rings, self.ideals = {}, {}
+
+    def ring(self, ring_index):
+        from .ring import Ring
+        from .qring import QuotientRing
+        if ring_index not in self.rings:
+            spec = self.header["rings"][ring_index]
+            field = spec["field"]
+            field = tuple(field["tuple"]) if "tuple" in field else field["int"] if "int" in field else field["str"]
+            ordering = spec["ordering"] if isinstance(spec["ordering"], str) else tuple(spec["ordering"])
+            if spec["qring"] is None:
+                self.rings[ring_index] = Ring(field, tuple(spec["variables"]), ordering)
+            else:
+                self.rings[ring_index] = QuotientRing(self.ring(spec["base"]), self.ideal(spec["qring"]))
+        return self.rings[ring_index]
+
+    def polys(self, entry):
+        if "strings" in entry:
+            return list(entry["strings"])
+        ring_index = entry["ring"]
+        variables = self.header["rings"][ring_index]["variables"]
+        exps = self.arrays[f"exponents_{ring_index}"]
+        coeffs = self.arrays[f"coefficients_{ring_index}"].tobytes()
+        coeff_offsets = self.arrays[f"coefficient_offsets_{ring_index}"]
+        term_offsets = self.arrays[f"term_offsets_{ring_index}"]
+        polys = []
+        for i in range(*entry["polys"]):
+            start, stop = term_offsets[i], term_offsets[i + 1]
+            poly_coeffs = [coeffs[coeff_offsets[j]:coeff_offsets[j + 1]].decode("utf-8") for j in range(start, stop)]
+            polys += [terms_to_poly(poly_coeffs, exps[start:stop].tolist(), variables)]
+        return polys
+
+    def ideal(self, ideal_index):
+        from .ideal import Fingerprint, LexGroebnerBasis
+        from .ideal_algorithms import RationalParametrisation
+        from .variety import MultiplicationMatrices
+        if ideal_index not in self.ideals:
+            entry = self.header["ideals"][ideal_index]
+            ring = self.ring(entry["ring"])
+            invariants = {}
+            for name, value in entry["invariants"].items():
+                if name in ("groebner_basis", "reduced_groebner_basis", "leadGBmonomials", "minbase"):
+                    invariants[name] = self.polys(value)
+                elif name == "indepSet":
+                    invariants[name] = tuple(value)
+                elif name == "radical":
+                    invariants[name] = self.ideal(value)
+                elif name == "primary_decomposition":
+                    invariants[name] = [(self.ideal(primary), self.ideal(prime)) for primary, prime in value]
+                elif name == "minimal_associated_primes":
+                    invariants[name] = [self.ideal(prime) for prime in value]
+                elif name == "multiplication_matrices":
+                    invariants[name] = MultiplicationMatrices(value["basis"], value["matrices"])
+                elif name == "rational_parametrisation":
+                    invariants[name] = None if value is None else RationalParametrisation(value["independent"], {variable: tuple(formula) for variable, formula in value["formulas"].items()})
+                elif name == "lex_groebner_bases":
+                    invariants.update({f"lex_groebner_basis_{strategy}": LexGroebnerBasis(self.polys(entry["basis"]), entry["strategy"], entry["timings"])
+                                       for strategy, entry in value.items()})
+                elif name == "dim":
+                    invariants[name] = value
+                elif name == "indepSets":
+                    invariants[name] = list(map(tuple, value))
+                elif name == "fingerprint":
+                    invariants[name] = Fingerprint(value["prime"], None if value["groebner_basis"] is None else tuple(self.polys(value["groebner_basis"])),
+                                                   None if value["hilbert"] is None else tuple(value["hilbert"]))
+            ideal = self.cls.__new__(self.cls)  # invariants go in the intern table first, so that __init__ skips the validation
+            ideal.ring, ideal.generators = ring, self.polys(entry["generators"])
+            key = ideal._intern_key
+            for name, value in invariants.items():
+                ideal_intern_table.store(key, name, value)
+            ideal.__init__(ring, ideal.generators)
+            for name, value in invariants.items():
+                if name in ("dim", "indepSets", "fingerprint"):
+                    setattr(ideal, f"_{name}", value)
+                elif name.startswith("lex_groebner_basis_"):
+                    ideal._lex_groebner_bases[name[len("lex_groebner_basis_"):]] = value
+                else:
+                    ideal.__dict__[name] = value
+            self.ideals[ideal_index] = ideal
+        return self.ideals[ideal_index]
+
+
+def load_ideals(path, cls=None):
+    """Loads the ideals saved with save_ideals. Computed invariants are restored, and shared through the intern table, without calling Singular."""
+    if cls is None:
+        from .ideal import Ideal as cls
+    with numpy.load(path, allow_pickle=False) as npz:
+        arrays = {name: npz[name] for name in npz.files}
+    header = json.loads(arrays.pop("header").tobytes().decode("utf-8"))
+    if header.get("format") != FORMAT:
+        raise ValueError(f"{path} is not a saved syngular ideal file.")
+    if header.get("version") not in SUPPORTED_FORMAT_VERSIONS:
+        raise ValueError(f"Unsupported syngular ideal file version {header.get('version')}, expected one of {SUPPORTED_FORMAT_VERSIONS}.")
+    reader = _IdealsReader(header, arrays, cls)
+    return [reader.ideal(index) for index in header["saved"]]
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Point sets
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+POINTS_FORMAT = "syngular-points"
+POINTS_FORMAT_VERSION = 1
+
+
+def _to_limbs(integers, limbs):
+    """Non-negative integers as rows of little-endian 64-bit limbs."""
+    integers = numpy.array(list(integers), dtype=object)
+    rows = numpy.empty((len(integers), limbs), dtype=numpy.uint64)
+    for j in range(limbs):
+        rows[:, j] = (integers >> (64 * j)) & (2 ** 64 - 1)
+    return rows
+
+
+def _from_limbs(rows):
+    """Inverse of _to_limbs, as an object array of Python ints."""
+    integers = numpy.zeros(len(rows), dtype=object)
+    for j in reversed(range(rows.shape[1])):
+        integers = (integers << 64) | rows[:, j].astype(object)
+    return integers
+
+
+def _point_record_layout(field):
+    """Number of 64-bit limbs of the large integers, and of uint64 words per value, of the field's fixed-width records."""
+    if field.name == "finite field":
+        return 0, 1
+    if field.name == "padic":
+        limbs = -(-(field.characteristic ** field.digits).bit_length() // 64)
+        return limbs, 2 + limbs  # valuation, precision, unit
+    if field.name == "mpc":
+        limbs = -(-mpmath.libmp.dps_to_prec(field.digits) // 64) + 1
+        return limbs, 2 * (2 + limbs)  # sign, exponent, mantissa of real and imaginary parts
+    raise NotImplementedError(f"Point sets over {field} are not supported.")
+
+
+def _encode_points_column(values, field, limbs, width):
+    from .points import ModPArray
+    if field.name == "finite field":
+        residues = values.residues if isinstance(values, ModPArray) else [int(value) for value in values]
+        return numpy.array(residues, dtype=numpy.uint64).reshape(-1, 1)
+    values = list(values)
+    rows = numpy.empty((len(values), width), dtype=numpy.uint64)
+    if field.name == "padic":
+        values = [field(value) for value in values]
+        rows[:, 0] = numpy.array([value.n for value in values], dtype=numpy.int64).view(numpy.uint64)
+        rows[:, 1] = [value.k for value in values]
+        rows[:, 2:] = _to_limbs((value.num for value in values), limbs)
+        return rows
+    for offset, part in ((0, "real"), (2 + limbs, "imag")):
+        signs, exponents, mantissas = [], [], []
+        for value in values:
+            sign, mantissa, exponent, bc = getattr(mpmath.mpc(value), part)._mpf_
+            if bc < 0:
+                raise ValueError(f"Can not store the non-finite value {value}.")
+            shift = max(bc - 64 * limbs, 0)  # rounds down mantissas wider than the record
+            signs, exponents, mantissas = signs + [sign], exponents + [exponent + shift], mantissas + [int(mantissa) >> shift]
+        rows[:, offset] = signs
+        rows[:, offset + 1] = numpy.array(exponents, dtype=numpy.int64).view(numpy.uint64)
+        rows[:, offset + 2:offset + 2 + limbs] = _to_limbs(mantissas, limbs)
+    return rows
+
+
+def _decode_points_column(rows, field, limbs):
+    from .points import ModPArray
+    from pyadic import ModP, PAdic
+    column = numpy.empty(len(rows), dtype=object)
+    if field.name == "finite field":
+        if field.characteristic < 2 ** 31:
+            return ModPArray(rows[:, 0].astype(numpy.int64), field.characteristic)
+        column[:] = [ModP(int(residue), field.characteristic) for residue in rows[:, 0]]
+    elif field.name == "padic":
+        valuations, precisions, units = rows[:, 0].view(numpy.int64), rows[:, 1], _from_limbs(rows[:, 2:])
+        column[:] = [PAdic(int(unit), field.characteristic, int(k), int(n)) for n, k, unit in zip(valuations, precisions, units)]
+    else:
+        parts = []
+        for offset in (0, 2 + limbs):
+            signs, exponents, mantissas = rows[:, offset], rows[:, offset + 1].view(numpy.int64), _from_limbs(rows[:, offset + 2:offset + 2 + limbs])
+            parts += [[mpmath.mpf((-int(mantissa) if sign else int(mantissa), int(exponent))) for sign, exponent, mantissa in zip(signs, exponents, mantissas)]]
+        column[:] = [mpmath.mpc(real, imag) for real, imag in zip(*parts)]
+    return column
+
+
+class PointStore(object):
+    """Columnar on-disk point set: a directory with a JSON header, the ring (saved with save_ideals) and one raw uint64 file per variable.
+    Each value is a fixed-width record: the residue over finite fields; valuation, precision and unit (in 64-bit limbs) over p-adics;
+    sign, exponent and mantissa limbs of the real and imaginary parts over mpc. Points can be appended, and are read lazily in slices
+    through numpy memory maps, such that worker processes can share a precomputed sample without copying it."""
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self.refresh()
+        self._ring = None
+
+    @classmethod
+    def create(cls, path, ring, field):
+        """A new, empty point store for points in the ring over the field."""
+        path = pathlib.Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        if (path / "header.json").exists():
+            raise FileExistsError(f"{path} already contains a point store.")
+        limbs, width = _point_record_layout(field)
+        save_ideals(path / "ring.npz", [ring.zero_ideal()])
+        variables = list(map(str, ring.variables))
+        for i in range(len(variables)):
+            (path / f"column_{i}.u64").touch()
+        header = {"format": POINTS_FORMAT, "version": POINTS_FORMAT_VERSION, "variables": variables, "length": 0,
+                  "field": [field.name, field.characteristic, field.digits], "limbs": limbs, "width": width}
+        cls._write_header(path, header)
+        return cls(path)
+
+    @staticmethod
+    def _write_header(path, header):
+        temporary = path / "header.json.tmp"
+        temporary.write_text(json.dumps(header))
+        os.replace(temporary, path / "header.json")  # readers see either the old or the new length
+
+    def refresh(self):
+        """Re-reads the header, e.g. to see points appended by another process."""
+        header = json.loads((self.path / "header.json").read_text())
+        if header.get("format") != POINTS_FORMAT:
+            raise ValueError(f"{self.path} is not a syngular point store.")
+        if header.get("version") != POINTS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported syngular point store version {header.get('version')}, expected {POINTS_FORMAT_VERSION}.")
+        self.header = header
+        if getattr(self, "field", None) is None:
+            from .field import Field
+            self.field = Field(*header["field"])  # constructed once, since mpc fields set the global mpmath precision
+
+    @property
+    def variables(self):
+        return tuple(self.header["variables"])
+
+    @property
+    def ring(self):
+        if self._ring is None:
+            self._ring = load_ideals(self.path / "ring.npz")[0].ring
+        return self._ring
+
+    def __len__(self):
+        return self.header["length"]
+
+    def __getstate__(self):
+        return {"path": self.path, "header": self.header, "field": self.field, "_ring": None}
+
+    def append(self, points):
+        """Appends points, given as ColumnarRingPoints or as an iterable of RingPoints (or dicts) over the store's field."""
+        from .points import ColumnarRingPoints
+        field, limbs, width = self.field, self.header["limbs"], self.header["width"]
+        if isinstance(points, ColumnarRingPoints):
+            columns, length = [points.columns[variable] for variable in self.variables], len(points)
+        else:
+            points = list(points)
+            columns, length = [[point[variable] for point in points] for variable in self.variables], len(points)
+        rows = [_encode_points_column(column, field, limbs, width) for column in columns]
+        for i, column_rows in enumerate(rows):
+            with open(self.path / f"column_{i}.u64", "ab") as file:
+                file.write(numpy.ascontiguousarray(column_rows, dtype=numpy.uint64).tobytes())
+        self.header["length"] += length
+        self._write_header(self.path, self.header)
+
+    def _memmap(self, i):
+        return numpy.memmap(self.path / f"column_{i}.u64", dtype=numpy.uint64, mode="r", shape=(len(self), self.header["width"]))
+
+    def columns(self, index=slice(None)):
+        """The decoded columns of the points selected by index (a slice, an integer array or a boolean mask)."""
+        if len(self) == 0:
+            return {variable: _decode_points_column(numpy.empty((0, self.header["width"]), dtype=numpy.uint64), self.field, self.header["limbs"])
+                    for variable in self.variables}
+        return {variable: _decode_points_column(numpy.asarray(self._memmap(i)[index]), self.field, self.header["limbs"])
+                for i, variable in enumerate(self.variables)}
+
+    def __getitem__(self, index):
+        """A RingPoint for an integer index, ColumnarRingPoints otherwise."""
+        from .points import ColumnarRingPoints
+        if isinstance(index, (int, numpy.integer)):
+            index = range(len(self))[index]
+            return ColumnarRingPoints(self.ring, self.field, self.columns(slice(index, index + 1)))[0]
+        return ColumnarRingPoints(self.ring, self.field, self.columns(index))
+
+    def chunks(self, size):
+        """Iterates over the points in ColumnarRingPoints of at most size points, reading one chunk at a time."""
+        for start in range(0, len(self), size):
+            yield self[start:start + size]
+
+    def __repr__(self):
+        return f"PointStore({str(self.path)!r}, {len(self)} points over {self.field})"
+
+
+def save_points(path, points):
+    """Saves points (ColumnarRingPoints, or RingPoints over a common ring and field) to a new PointStore, which is returned."""
+    from .points import ColumnarRingPoints
+    store = PointStore.create(path, points.ring if isinstance(points, ColumnarRingPoints) else points[0].ring, points.field)
+    store.append(points)
+    return store
+
+
+def load_points(path):
+    """Opens the PointStore at path; points are read lazily, e.g. store[1000:2000]."""
+    return PointStore(path)
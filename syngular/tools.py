@@ -1,13 +1,50 @@
+import contextvars
 import re
 import subprocess
 import syngular
 import random
+import threading
 import warnings
 
 from pathlib import Path
 from packaging.version import Version, InvalidVersion
 
 
+_singular_processes = contextvars.ContextVar("singular_processes", default=None)
+
+
+class SingularProcesses(object):
+    """The Singular subprocesses started by execute_singular_command within run(...), such that another thread can terminate them,
+    e.g. once their result is no longer needed. After terminate(), new Singular calls within run(...) are terminated as soon as they start."""
+
+    def __init__(self):
+        self._processes, self._lock, self.terminated = set(), threading.Lock(), False
+
+    def run(self, func, *args, **kwargs):
+        token = _singular_processes.set(self)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _singular_processes.reset(token)
+
+    def add(self, process):
+        with self._lock:
+            self._processes.add(process)
+            if self.terminated:
+                process.terminate()
+
+    def discard(self, process):
+        with self._lock:
+            self._processes.discard(process)
+
+    def terminate(self):
+        with self._lock:
+            self.terminated = True
+            for process in self._processes:
+                if process.poll() is None:
+                    process.terminate()  # timeout forwards the signal to Singular
+
+
 def execute_singular_command(singular_command, timeout='default', verbose=False):
     if timeout == 'default':
         timeout = syngular.TIMEOUT
@@ -25,6 +62,9 @@ def execute_singular_command(singular_command, timeout='default', verbose=False)
     else:
         test = subprocess.Popen(["timeout", "--verbose", str(timeout), "Singular", "--quiet", "--execute", singular_command],
                                 stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    processes = _singular_processes.get()
+    if processes is not None:
+        processes.add(test)
     try:
         output, stderr = test.communicate()
     except KeyboardInterrupt:
@@ -34,6 +74,11 @@ def execute_singular_command(singular_command, timeout='default', verbose=False)
             import signal
             os.kill(test.pid, signal.SIGTERM)
         raise KeyboardInterrupt
+    finally:
+        if processes is not None:
+            processes.discard(test)
+    if processes is not None and processes.terminated:
+        raise SingularException("The Singular process was terminated.")
     output = output.decode("utf-8")
     if stderr is not None:
         stderr = stderr.decode("utf-8")
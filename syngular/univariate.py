@@ -0,0 +1,191 @@
+import mpmath
+import numpy
+import random
+
+from collections import namedtuple
+
+
+CertifiedRoot = namedtuple("CertifiedRoot", ["root", "radius"])
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Dense univariate polynomials over Fp
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+# Coefficients are stored in increasing degree, in int64 arrays when products of two residues fit, in object arrays otherwise.
+
+
+def _dtype(prime):
+    return numpy.int64 if prime < 2 ** 31 else object
+
+
+def _strip(a):
+    """Removes vanishing leading (i.e. highest degree) coefficients."""
+    nonzero = numpy.nonzero(a)[0]
+    return a[:nonzero[-1] + 1] if len(nonzero) > 0 else a[:0]
+
+
+def _monic(a, prime):
+    return a * pow(int(a[-1]), -1, prime) % prime
+
+
+def _divmod(a, b, prime):
+    """Quotient and remainder of a by monic b."""
+    a, d = a.copy(), len(b) - 1
+    quotient = numpy.zeros(max(len(a) - d, 0), dtype=a.dtype)
+    for k in range(len(a) - 1, d - 1, -1):
+        quotient[k - d] = a[k]
+        a[k - d:k + 1] = (a[k - d:k + 1] - a[k] * b) % prime
+    return quotient, _strip(a[:d])
+
+
+def _gcd(a, b, prime):
+    """Monic greatest common divisor."""
+    a, b = _strip(a), _strip(b)
+    while len(b) > 0:
+        b = _monic(b, prime)
+        a, b = b, _divmod(a, b, prime)[1]
+    return _monic(a, prime) if len(a) > 0 else a
+
+
+def _mulmod(a, b, f, prime):
+    """Rowwise a * b mod f, for batches of residues a, b of shape (n, d) and monic moduli f of shape (n, d + 1)."""
+    n, d = a.shape
+    c = numpy.zeros((n, max(2 * d - 1, 1)), dtype=a.dtype)
+    for i in range(d):
+        c[:, i:i + d] = (c[:, i:i + d] + a[:, i, None] * b) % prime
+    for k in range(2 * d - 2, d - 1, -1):
+        c[:, k - d:k] = (c[:, k - d:k] - c[:, k, None] * f[:, :d]) % prime
+    return c[:, :d]
+
+
+def _powmod(a, exponent, f, prime):
+    """Rowwise a ^ exponent mod f, by repeated squaring."""
+    result = numpy.zeros_like(a)
+    result[:, 0] = 1
+    while exponent > 0:
+        if exponent & 1:
+            result = _mulmod(result, a, f, prime)
+        a = _mulmod(a, a, f, prime)
+        exponent >>= 1
+    return result
+
+
+def _x_mod(f, prime):
+    """The residue of x modulo each row of the monic moduli f."""
+    n, d = f.shape[0], f.shape[1] - 1
+    if d == 1:
+        return -f[:, :1] % prime
+    x = numpy.zeros((n, d), dtype=f.dtype)
+    x[:, 1] = 1
+    return x
+
+
+def _split_linear(h, prime, rng):
+    """Roots of a monic product of distinct linear factors, by Cantor–Zassenhaus equal-degree splitting."""
+    if len(h) == 2:
+        return [int(-h[0] % prime)]
+    if prime == 2:  # h = x^2 + x
+        return [0, 1]
+    while True:
+        shifted = numpy.zeros((1, len(h) - 1), dtype=h.dtype)
+        shifted[0, 0], shifted[0, 1] = rng.randrange(prime), 1
+        power = _powmod(shifted, (prime - 1) // 2, h[None, :], prime)[0]
+        power[0] = (power[0] - 1) % prime
+        g = _gcd(h, power, prime)
+        if 1 < len(g) < len(h):
+            return _split_linear(g, prime, rng) + _split_linear(_divmod(h, g, prime)[0], prime, rng)
+
+
+def finite_field_roots_batch(polynomials, prime, seed=None):
+    """Distinct roots in Fp of each polynomial, given as coefficients in increasing degree.
+    Computes h = gcd(f, x^p - x), the product of the distinct linear factors, then splits h with Cantor–Zassenhaus.
+    The repeated squaring for x^p mod f is vectorized across polynomials of equal degree. Vanishing polynomials have roots None."""
+    rng = random.Random(seed)
+    dtype = _dtype(prime)
+    polynomials = [_strip(numpy.array([int(coeff) % prime for coeff in polynomial], dtype=dtype)) for polynomial in polynomials]
+    results = [None if len(polynomial) == 0 else [] for polynomial in polynomials]
+    by_degree = {}
+    for i, polynomial in enumerate(polynomials):
+        if len(polynomial) > 1:
+            by_degree.setdefault(len(polynomial) - 1, []).append(i)
+    for degree, indices in by_degree.items():
+        f = numpy.array([_monic(polynomials[i], prime) for i in indices], dtype=dtype)
+        x_to_the_p = _powmod(_x_mod(f, prime), prime, f, prime)
+        for i, monic, residue in zip(indices, f, x_to_the_p):
+            residue = residue.copy()
+            if degree == 1:
+                residue[0] = (residue[0] + monic[0]) % prime  # x^p - x mod (x + a)
+            else:
+                residue[1] = (residue[1] - 1) % prime
+            h = _gcd(monic, residue, prime) if len(_strip(residue)) > 0 else monic
+            results[i] = sorted(_split_linear(h, prime, rng)) if len(h) > 1 else []
+    return results
+
+
+def finite_field_roots(polynomial, prime, seed=None):
+    """Distinct roots in Fp of a polynomial given as coefficients in increasing degree, see finite_field_roots_batch."""
+    return finite_field_roots_batch([polynomial], prime, seed=seed)[0]
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+# Univariate polynomials over C
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+
+def complex_roots(polynomial, digits=None, certified=False):
+    """Roots of a polynomial with (mpmath) complex coefficients in increasing degree, to the given number of digits (default mpmath.mp.dps).
+    The roots are found in double precision from the companion matrix, then refined with Newton's iteration in mpmath, doubling the working precision
+    at each step until the target is reached. Each root comes with an inclusion radius deg * |f(z) / f'(z)|, which is guaranteed to contain a root;
+    if the radii are not below 10^-digits (relative), or the inclusion disks overlap, falls back to mpmath.polyroots.
+    If certified is True, returns a list of CertifiedRoot(root, radius)."""
+    digits = mpmath.mp.dps if digits is None else digits
+    coeffs = list(polynomial)
+    while len(coeffs) > 0 and coeffs[-1] == 0:
+        coeffs.pop()
+    if len(coeffs) < 2:
+        return []
+    descending = [mpmath.mpc(coeff) for coeff in reversed(coeffs)]
+    degree = len(descending) - 1
+    with mpmath.workdps(digits + 10):
+        if degree == 1:
+            return [CertifiedRoot(-descending[1] / descending[0], 0)] if certified else [-descending[1] / descending[0]]
+        certified_roots = _newton_refined_roots(descending, degree, digits)
+        if certified_roots is None:
+            roots, error = mpmath.polyroots(descending, maxsteps=100 + 10 * degree, extraprec=10 * digits, error=True)
+            certified_roots = [CertifiedRoot(mpmath.mpc(root), error) for root in roots]
+    return certified_roots if certified else [certified_root.root for certified_root in certified_roots]
+
+
+def _newton_refined_roots(descending, degree, digits):
+    """Certified Newton refinement of double precision roots, or None if certification fails."""
+    double = numpy.array([complex(coeff) for coeff in descending])
+    if not numpy.all(numpy.isfinite(double)) or double[0] == 0:
+        return None
+    tollerance = mpmath.mpf(10) ** -digits
+    target_prec = mpmath.mp.prec
+    certified_roots = []
+    for root in numpy.roots(double):
+        z, prec = mpmath.mpc(root), 53
+        for _ in range(int(mpmath.log(target_prec, 2)) + 10):
+            prec = min(2 * prec, target_prec)
+            with mpmath.workprec(prec):
+                value, derivative = mpmath.polyval(descending, z, derivative=True)
+                if derivative == 0:
+                    return None
+                step = value / derivative
+                z = z - step
+            if prec == target_prec and abs(step) <= tollerance * max(1, abs(z)):
+                break
+        value, derivative = mpmath.polyval(descending, z, derivative=True)
+        if derivative == 0:
+            return None
+        radius = degree * abs(value / derivative)
+        if radius > tollerance * max(1, abs(z)):
+            return None
+        certified_roots += [CertifiedRoot(z, radius)]
+    for i, (z1, r1) in enumerate(certified_roots):  # disjoint inclusion disks contain distinct roots
+        for z2, r2 in certified_roots[i + 1:]:
+            if abs(z1 - z2) <= r1 + r2:
+                return None
+    return certified_roots
@@ -1,23 +1,35 @@
 import functools
+import inspect
+import itertools
+import math
 import mpmath
+import multiprocessing
 import numpy
+import os
+import queue
 import random
 import re
 import sympy
 import syngular
+import traceback
 import warnings
 
+from collections import Counter, namedtuple
 from copy import copy, deepcopy
 from packaging import version
+from pycoretools import default_cores
 
 from pyadic import ModP
 
 from mpmath.libmp.libhyper import NoConvergence
 
-from .tools import RootNotInFieldError, RootPrecisionError
+from .tools import execute_singular_command, RootNotInFieldError, RootPrecisionError
 from .field import Field
-from .polynomial import Monomial, Polynomial
+from .polynomial import Monomial, Polynomial, evaluation_plan
 from .settings import TemporarySetting, with_other_cas_compatible_str
+from .interning import ideal_intern_table, interned_cached_property
+from .univariate import complex_roots, finite_field_roots
+from .homotopy import compiled_system, monodromy_groups, parameter_homotopy, random_slice, track_paths, track_slice_paths
 
 if version.parse(sympy.__version__) < version.parse('1.14'):
     # See sympy issue #23861, fixed in sympy pull request #27650
@@ -26,12 +38,154 @@ if version.parse(sympy.__version__) < version.parse('1.14'):
     equation = sympy.sympify(f"x - 1.{'0' * (mpmath.mp.dps - 10)}1")
     sympy.nroots(equation, n=mpmath.mp.dps, maxsteps=500)
 
+MultiplicationMatrices = namedtuple("MultiplicationMatrices", ["basis", "matrices"])
+
+
+class WitnessSet(namedtuple("WitnessSet", ["dimension", "equations", "variables", "slice", "points"])):
+    """Points (complex128 arrays) of a pure-dimensional part of a variety cut by a random linear space slice = (A, b) of codimension dimension.
+    equations are random (Gaussian integer) combinations of the ideal generators, as many as the codimension, whose variety contains that part as a component."""
+
+    @property
+    def degree(self):
+        return len(self.points)
+
+
+RETRYABLE_EXCEPTIONS = (RootNotInFieldError, RootPrecisionError, NoConvergence, AssertionError)
+
+
+class RetryStatistics:
+    """Counts of point_on_variety attempts and of failed ones (by exception name), per ideal and field.
+    The failure rate sizes speculative batches, see POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS."""
+
+    def __init__(self):
+        self.attempts = 0
+        self.failures = Counter()
+
+    def __repr__(self):
+        return f"RetryStatistics(attempts={self.attempts}, failures={dict(self.failures)}, failure_rate={self.failure_rate:.3f})"
+
+    def record(self, exception=None):
+        self.attempts += 1
+        if exception is not None:
+            self.failures[type(exception).__name__] += 1
+
+    @property
+    def failure_rate(self):
+        """Estimated probability that an attempt fails (Laplace's rule of succession)."""
+        return (sum(self.failures.values()) + 1) / (self.attempts + 2)
+
+    def suggested_attempts(self, success_probability=0.95, max_attempts=None):
+        """Number of simultaneous attempts such that at least one succeeds with the given probability, at most max_attempts (default: the number of cores)."""
+        max_attempts = default_cores() if max_attempts is None else max_attempts
+        attempts = math.ceil(math.log(1 - success_probability) / math.log(self.failure_rate))
+        return max(1, min(attempts, max_attempts))
+
+
+def retry_statistics(ideal, field):
+    """The RetryStatistics of point_on_variety on ideal over field."""
+    if not hasattr(ideal, "_retry_statistics"):
+        ideal._retry_statistics = {}
+    return ideal._retry_statistics.setdefault(str(field), RetryStatistics())
+
+
+def _is_retryable(exception, indepSet):
+    """Whether a point_on_variety failure is worth retrying with another seed. Errors raised by multiprocessing itself
+    (e.g. the AssertionError of a pool opened in a daemonic worker) are not, whatever their type."""
+    if not isinstance(exception, (*RETRYABLE_EXCEPTIONS, *((TimeoutError, ) if indepSet == "guess" else ()))):
+        return False
+    frames = traceback.extract_tb(exception.__traceback__)
+    return not (frames and frames[-1].filename.startswith(os.path.dirname(multiprocessing.__file__)))
+
+
+def _point_on_variety_attempt(arguments):
+    """Single point_on_variety attempt in a worker process, returning (point, None) or (None, exception) for retryable failures.
+    Nested speculative pools are disabled (workers are daemonic)."""
+    ideal, field, kwargs = arguments
+    point_on_variety = with_other_cas_compatible_str(inspect.unwrap(type(ideal).point_on_variety))
+    try:
+        with TemporarySetting("syngular", "POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS", None):
+            return point_on_variety(ideal, field, **kwargs), None
+    except Exception as e:
+        if not _is_retryable(e, kwargs['indepSet']):
+            raise
+        return None, e
+
+
+def speculative_point_on_variety(ideal, field, attempts, max_tries, kwargs):
+    """Runs up to max_tries point_on_variety attempts with independent seeds, 'attempts' at a time in a pool of worker processes.
+    Returns the first successful point and terminates the outstanding attempts; which attempt wins depends on timing."""
+    if max_tries < 1:
+        raise ValueError(f"max_tries must be positive, got {max_tries}.")
+    statistics = retry_statistics(ideal, field)
+    rng = random.Random(kwargs['seed'])
+    tasks = ((ideal, field, kwargs | {'seed': rng.randrange(2 ** 32)}) for _ in range(max_tries))
+    error = None
+    with multiprocessing.get_context("fork").Pool(attempts) as pool:  # leaving the context terminates the workers
+        for point, error in pool.imap_unordered(_point_on_variety_attempt, tasks):
+            statistics.record(error)
+            if error is None:
+                return point
+            if kwargs['verbose']:
+                print(f"Caught {type(error).__name__}({error}) in a speculative attempt, {statistics}.")
+    raise type(error)(f"Could not find a solution in {field} after {max_tries} attempts. {error}")
+
+
+def _stream_point(arguments):
+    """A point_on_variety in a worker process of point_stream; nested speculative pools are disabled (workers are daemonic)."""
+    ideal, field, kwargs = arguments
+    with TemporarySetting("syngular", "POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS", None):
+        return ideal.point_on_variety(field, **kwargs)
+
+
+def point_stream(ideal, field, number=None, in_flight=None, cores=None, seed=None, **kwargs):
+    """Generator of RingPoints on the variety of ideal over field, from point_on_variety (with its retries) with independent seeds,
+    computed in cores worker processes (default_cores() if None, lazily in-process if 1) and yielded as they complete.
+    At most in_flight computations (default 2 * cores) are outstanding, so memory stays bounded if the consumer is slower than the workers.
+    Yields number points, or indefinitely if None; closing the generator (e.g. breaking out of a for loop) terminates the outstanding work.
+    Keyword arguments (directions, valuations, indepSet, method, ...) are passed to point_on_variety."""
+    from .point import RingPoint
+    cores = default_cores() if cores is None else cores
+    in_flight = 2 * cores if in_flight is None else in_flight
+    rng = random.Random(seed)
+    tasks = (kwargs | {'seed': rng.randrange(2 ** 32)} for _ in (range(number) if number is not None else itertools.count()))
+    if cores == 1:
+        for task in tasks:
+            yield RingPoint(ideal.ring, field, val=ideal.point_on_variety(field, **task))
+        return
+    results = queue.Queue()
+
+    def submit(task):
+        pool.apply_async(_stream_point, ((ideal, field, task), ), callback=lambda point: results.put((point, None)),
+                         error_callback=lambda error: results.put((None, error)))
+
+    pool = multiprocessing.get_context("fork").Pool(cores)
+    try:
+        outstanding = 0
+        for task in itertools.islice(tasks, in_flight):
+            submit(task)
+            outstanding += 1
+        while outstanding > 0:
+            point, error = results.get()
+            outstanding -= 1
+            if error is not None:
+                raise error
+            task = next(tasks, None)
+            if task is not None:  # resubmitted before yielding, so the workers stay busy while the consumer works
+                submit(task)
+                outstanding += 1
+            yield RingPoint(ideal.ring, field, val=point)
+    finally:
+        pool.terminate()
+
 
 def retry_to_find_root(max_tries=100):
+    if max_tries < 1:
+        raise ValueError(f"max_tries must be positive, got {max_tries}.")
+
     def retry_to_find_root_decorator(func):
         @functools.wraps(func)
         def wrapper(self, field, base_point={}, directions=None, valuations=tuple(), indepSetNbr=None, indepSet='guess',
-                    seed=None, verbose=False, directions_analytic_check=False):
+                    seed=None, verbose=False, directions_analytic_check=False, method='lex', sampler=None):
 
             if indepSetNbr is not None and indepSet == 'guess':
                 indepSet = indepSetNbr
@@ -55,27 +209,37 @@ def retry_to_find_root(max_tries=100):
             elif indepSet in ('force guess', 'force-guess'):
                 indepSet = 'guess'
 
+            kwargs = dict(base_point=base_point, directions=directions, valuations=valuations, indepSet=indepSet, seed=seed,
+                          verbose=verbose, directions_analytic_check=directions_analytic_check, method=method, sampler=sampler)
             if base_point != {} and indepSet not in [None, 'guess']:
-                return func(self, field, base_point=base_point, directions=directions, valuations=valuations,
-                            indepSet=indepSet, seed=seed, verbose=verbose, directions_analytic_check=directions_analytic_check)
-            else:
-                for try_nbr in range(max_tries):
-                    try:
-                        res = func(self, field, base_point=base_point, directions=directions, valuations=valuations,
-                                   indepSet=indepSet, seed=seed, verbose=verbose, directions_analytic_check=directions_analytic_check)
-                        break
-                    except (RootNotInFieldError, RootPrecisionError, NoConvergence, AssertionError,
-                            *((TimeoutError, ) if indepSet == "guess" else ())) as e:
-                        if try_nbr != max_tries - 1:
-                            if verbose:
-                                print(f"Caught {type(e).__name__}({e}) at try number {try_nbr}, retrying...")
-                            if seed is not None:  # maintain pseudo-randomness, but change seed, else retring has no effect.
-                                random.seed(seed)
-                                seed += random.randint(10 ** 5, 10**6)
-                            continue
-                        else:
-                            raise type(e)(f"Could not find a solution in {field} after {max_tries} attempts. {e}")
-                return res
+                return func(self, field, **kwargs)
+
+            attempts = syngular.POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS
+            if attempts == 'auto':
+                attempts = retry_statistics(self, field).suggested_attempts()
+            if attempts is not None and attempts > 1 and not multiprocessing.current_process().daemon:  # daemonic workers cannot fork a pool
+                return speculative_point_on_variety(self, field, attempts, max_tries, kwargs)
+
+            statistics = retry_statistics(self, field)
+            for try_nbr in range(max_tries):
+                try:
+                    res = func(self, field, **kwargs)
+                    statistics.record()
+                    break
+                except Exception as e:
+                    if not _is_retryable(e, indepSet):
+                        raise
+                    statistics.record(e)
+                    if try_nbr != max_tries - 1:
+                        if verbose:
+                            print(f"Caught {type(e).__name__}({e}) at try number {try_nbr}, retrying...")
+                        if kwargs['seed'] is not None:  # maintain pseudo-randomness, but change seed, else retring has no effect.
+                            random.seed(kwargs['seed'])
+                            kwargs['seed'] += random.randint(10 ** 5, 10**6)
+                        continue
+                    else:
+                        raise type(e)(f"Could not find a solution in {field} after {max_tries} attempts. {e}")
+            return res
         return wrapper
     return retry_to_find_root_decorator
 
@@ -85,14 +249,22 @@ class Variety_of_Ideal:
     @with_other_cas_compatible_str
     @retry_to_find_root(max_tries=100)
     def point_on_variety(self, field, base_point={}, directions=None, valuations=tuple(), indepSet='guess',
-                         seed=None, verbose=False, directions_analytic_check=False):
+                         seed=None, verbose=False, directions_analytic_check=False, method='lex', sampler=None):
         """Generate a representative point on or close to the variety associated to this ideal.
         The point is 'valuations' away from the exact variety, in the directions specified by 'directions'.
         If 'directions' are not provided, pick the first n=codim simplest generators from 'self'.
         If the ideal is not prime, an irreducible branch will be picked at random.
-        If independent sets are too hard to compute, they will be guessed, you can provide codim_upper_bound to help."""
+        If independent sets are too hard to compute, they will be guessed, you can provide codim_upper_bound to help.
+        The zero-dimensional slices are solved by back-substitution in a lex Groebner basis (method='lex'),
+        or all at once from the eigenvectors of multiplication matrices in a dp basis (method='eigen').
+        Over mpc, method='homotopy' instead tracks numerical homotopy paths to the isolated solutions of the directions (see syngular.homotopy).
+        For repeated calls, see variety_sampler, which passes itself as 'sampler' to reuse the parsed generators."""
+
+        if method not in ('lex', 'eigen', 'homotopy'):
+            raise ValueError(f"Unknown method {method}, expected 'lex', 'eigen' or 'homotopy'.")
+        if method == 'homotopy' and field.name != "mpc":
+            raise ValueError(f"method='homotopy' requires an mpc field, got {field}.")
 
-        from .ideal import Ideal
         from .qring import QuotientRing
 
         assert all([isinstance(valuation, str) or abs(valuation) >= 0 for valuation in valuations])
@@ -101,6 +273,22 @@ class Variety_of_Ideal:
 
         random.seed(seed)
 
+        # rational varieties: evaluate the cached parametrisation instead of solving a slice
+        if syngular.POINT_ON_VARIETY_RATIONAL_PARAMETRISATION and valuations == tuple() and method != 'homotopy' and original_self.rational_parametrisation is not None:
+            parametrisation = original_self.rational_parametrisation
+            if set(map(str, base_point)) in (set(), set(parametrisation.independent)):
+                if base_point == {}:
+                    independent_values = {variable: field.random() for variable in parametrisation.independent}
+                else:
+                    independent_values = {str(key): field(val) for key, val in base_point.items()}
+                try:
+                    point = independent_values | parametrisation(field, independent_values)
+                except ZeroDivisionError as e:
+                    raise AssertionError(e)
+                if verbose:
+                    print(f"Evaluated the rational parametrisation by {parametrisation.independent}.")
+                return {str(variable): point[str(variable)] for variable in self.ring.variables}
+
         # do not modify directions, in case re-try is triggered, better the input is identical
         directions = deepcopy(directions)
         # handle directions, i.e. the generators of the sub-ideal of maximal codimension
@@ -113,12 +301,7 @@ class Variety_of_Ideal:
             if field.name != "finite field":
                 if verbose:
                     print("Directions not provided, obtaining them from ideal generators.")
-                for poly in sorted(self.generators, key=lambda x: len(x)):
-                    if Ideal(self.ring, directions + [poly, ]).codim > Ideal(self.ring, directions).codim:
-                        directions += [poly, ]
-                    if len(directions) == self.codim:
-                        break
-                assert Ideal(self.ring, directions).codim == self.codim
+                directions = self._default_directions()
                 if verbose:
                     print(f"Selected directions: {directions}")
         elif directions_analytic_check:
@@ -205,7 +388,18 @@ class Variety_of_Ideal:
         if depSymbols == ():
             return base_point
 
-        oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=verbose, iteration=0)
+        # mixed precision: the directions solved at the base point in double precision (numpy), refined by Newton steps to the field's digits
+        if field.name == "mpc" and syngular.POINT_ON_VARIETY_MIXED_PRECISION and method != 'homotopy':
+            point = self._mixed_precision_point(field, directions, valuations, base_point, depSymbols, verbose=verbose)
+            if point is not None:
+                return point
+            if verbose:
+                print("No refined double precision point, falling back to the full precision computation.")
+
+        if method == 'homotopy':
+            return self._homotopy_point(field, directions, valuations, base_point, depSymbols, verbose=verbose)
+
+        oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=verbose, iteration=0, sampler=sampler)
 
         # print(repr(oSemiNumericalIdeal))
 
@@ -218,9 +412,12 @@ class Variety_of_Ideal:
 
             syngular.DEGBOUND = 0
 
+            if method == 'eigen':  # also learns the dimension, without computing a lex basis
+                multiplication_matrices = oSemiNumericalIdeal.multiplication_matrices
+
             # and oSemiNumericalIdeal.dim == -1:  # this is the ideal generated by '1'
             # check it explicitly, unless the .dim property is reverted to use grobner_basis instead of std
-            if prime is None and oSemiNumericalIdeal.groebner_basis == ['1']:
+            if prime is None and (oSemiNumericalIdeal.dim == -1 if method == 'eigen' else oSemiNumericalIdeal.groebner_basis == ['1']):
                 raise RootPrecisionError
 
             # determines dimension of original ideal in the full ring from that of the semi-numerical slice
@@ -245,10 +442,32 @@ class Variety_of_Ideal:
                 else:
                     raise AssertionError(f"The dimension of the semi-numerical ideal was {oSemiNumericalIdeal.dim} instead of zero: no solutions exist.")
 
-            root_dicts = lex_groebner_solve(oSemiNumericalIdeal.groebner_basis, prime=prime)
-            if verbose:
-                print(f"Found {len(root_dicts)} roots: {root_dicts}")
-            check_solutions(oSemiNumericalIdeal.groebner_basis, root_dicts, field)  # they may be stricter then wanted for mpc.
+            if method == 'eigen':
+                root_dicts = eigen_solve(multiplication_matrices, oSemiNumericalIdeal.ring.variables, prime=prime)
+                equations = oSemiNumericalIdeal.generators
+                if verbose:
+                    print(f"Found {len(root_dicts)} roots: {root_dicts}")
+                check_solutions(equations, root_dicts, field)  # they may be stricter then wanted for mpc.
+            else:
+                if verbose and oSemiNumericalIdeal._is_lex_convertible:
+                    lex_groebner_basis = oSemiNumericalIdeal.lex_groebner_basis
+                    print(f"Lex Groebner basis via {lex_groebner_basis.strategy}, timings: {lex_groebner_basis.timings}")
+                equations = oSemiNumericalIdeal.groebner_basis
+                # walk the solution tree lazily (a random branch first), stopping at the first root passing the check
+                root_dicts, failure = [], None
+                for root_dict in lex_groebner_solutions(equations, prime=prime, digits=field.digits if prime is None else None,
+                                                        rng=random.Random(random.random()) if syngular.POINT_ON_VARIETY_RANDOM_SOLUTION else None):
+                    try:
+                        check_solutions(equations, [root_dict], field)  # they may be stricter then wanted for mpc.
+                    except (RootPrecisionError, AssertionError) as e:
+                        failure = e
+                        continue
+                    root_dicts = [root_dict]
+                    break
+                if root_dicts == [] and failure is not None:
+                    raise failure
+                if verbose:
+                    print(f"Found root: {root_dicts}")
 
             try:
                 if not syngular.POINT_ON_VARIETY_RANDOM_SOLUTION:
@@ -257,9 +476,9 @@ class Variety_of_Ideal:
                     root_dict = random.sample(root_dicts, 1)[0]
             except (IndexError, ValueError):
                 if not field.is_algebraically_closed:
-                    raise RootNotInFieldError(f"Got root_dicts: {root_dicts}, for lex Groebner basis:\n{oSemiNumericalIdeal.groebner_basis}.")
+                    raise RootNotInFieldError(f"Got root_dicts: {root_dicts}, for equations:\n{equations}.")
                 else:
-                    raise IndexError(f"Got root_dicts: {root_dicts}, for lex Groebner basis:\n{oSemiNumericalIdeal.groebner_basis}.")
+                    raise IndexError(f"Got root_dicts: {root_dicts}, for equations:\n{equations}.")
             # root_dict = {key: root_dict[key] for key in root_dict.keys() if key not in indepSymbols}
 
             for key in root_dict.keys():
@@ -284,6 +503,16 @@ class Variety_of_Ideal:
                     if abs(num_poly) > abs(field.ε):
                         raise Exception(f"Invalid direction, {direction} was not in {self}. Numerical membership check failed.")
 
+            if iteration == 0 and field.name == "padic" and iterations > 1 and syngular.POINT_ON_VARIETY_HENSEL_LIFT:
+                lifted_point = hensel_lift(directions, valuations, base_point, depSymbols, field)
+                if lifted_point is not None:
+                    if verbose:
+                        print("Lifted the solution modulo p with Hensel/Newton steps.")
+                    base_point = lifted_point
+                    break
+                if verbose:
+                    print("Could not Hensel lift (non-square system or singular Jacobian), falling back to iterated slices.")
+
             if iteration < iterations - 1:
                 if prime is not None:
                     valuations = [valuation - 1 for valuation in valuations]
@@ -297,7 +526,7 @@ class Variety_of_Ideal:
                 if verbose:
                     print("New directions, valuations:", directions, valuations)
 
-                oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=False, iteration=iteration + 1)
+                oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=False, iteration=iteration + 1, sampler=sampler)
 
                 if len(oSemiNumericalIdeal.indepSets) == 1 and numpy.all(numpy.array(oSemiNumericalIdeal.indepSets) == 0):
                     continue
@@ -322,7 +551,7 @@ class Variety_of_Ideal:
                     if depSymbols == tuple():  # no more equations to solve, terminate early
                         break
 
-                    oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=False, iteration=iteration + 1)
+                    oSemiNumericalIdeal = self._semi_numerical_slice(field, directions, valuations, base_point, depSymbols, verbose=False, iteration=iteration + 1, sampler=sampler)
 
         for key, val in base_point.items():
             if val not in field:
@@ -333,10 +562,180 @@ class Variety_of_Ideal:
 
         return {str(key): val for key, val in base_point.items()}
 
+    def _default_directions(self):
+        """Generators of a sub-ideal of maximal codimension, picked greedily among the simplest generators."""
+        from .ideal import Ideal
+        directions = []
+        for poly in sorted(self.generators, key=lambda x: len(x)):
+            if Ideal(self.ring, directions + [poly, ]).codim > Ideal(self.ring, directions).codim:
+                directions += [poly, ]
+            if len(directions) == self.codim:
+                break
+        assert Ideal(self.ring, directions).codim == self.codim
+        return directions
+
+    def point_stream(self, field, number=None, in_flight=None, cores=None, seed=None, **kwargs):
+        """Generator of RingPoints on the variety, computed in worker processes and yielded as they complete, see point_stream."""
+        return point_stream(self, field, number=number, in_flight=in_flight, cores=cores, seed=seed, **kwargs)
+
+    def variety_sampler(self, field, directions=None, indepSet='guess', method='lex', verbose=False):
+        """A VarietySampler, generating points on the variety over field with the setup of point_on_variety computed once."""
+        return VarietySampler(self, field, directions=directions, indepSet=indepSet, method=method, verbose=verbose)
+
+    @interned_cached_property
+    def multiplication_matrices(self):
+        """Monomial basis of the quotient ring modulo a zero-dimensional ideal (kbase of a dp standard basis) and the matrices of
+        multiplication by each variable, M[r][c] being the coefficient of basis[r] in the normal form of variable * basis[c].
+        Also learns the dimension; if this is not zero, basis and matrices are None."""
+        from .ring import Ring
+        if type(self.ring) is not Ring:
+            raise NotImplementedError("Multiplication matrices are implemented for ideals in (non-quotient) rings.")
+        dp_ring = copy(self.ring)
+        dp_ring.ordering = 'dp'
+        singular_commands = ["option(redSB);",
+                             f"ring rdp = {dp_ring};",
+                             "short=0;",
+                             f"ideal i = {self};",
+                             "ideal gb = std(i);",
+                             "int d = dim(gb);",
+                             "print(d);",
+                             "if (d == 0) {",
+                             "ideal B = kbase(gb);",
+                             "print(string(B));",
+                             "for (int j = 1; j <= nvars(rdp); j++) { matrix M = coeffs(reduce(var(j) * B, gb), B); print(string(M)); kill M; }",
+                             "}",
+                             "$"]
+        output = execute_singular_command(singular_commands).split("\n")
+        self._dim = int(output[0])
+        ideal_intern_table.store(self._intern_key, 'dim', self._dim)
+        if self.dim != 0:
+            return MultiplicationMatrices(None, None)
+        basis = output[1].split(",")
+        matrices = [[row.split(",")[i * len(basis):(i + 1) * len(basis)] for i in range(len(basis))] for row in output[2:]]
+        return MultiplicationMatrices(basis, matrices)
+
+    def _homotopy_point(self, field, directions, valuations, base_point, depSymbols, verbose=False):
+        """Helper function for point_on_variety with method='homotopy'. Tracks the paths to the isolated solutions of the directions
+        at the base point in double precision, refines them by Newton steps, keeps those on the variety, and perturbs a random one by the valuations."""
+        if len(directions) != len(depSymbols):
+            raise ValueError(f"Homotopy continuation needs as many directions as dependent variables, got {len(directions)} and {len(depSymbols)}.")
+        independent_values = {key: val for key, val in base_point.items() if key not in depSymbols}
+        substitutions = {sympy.Symbol(key): complex(val) for key, val in independent_values.items()}
+        equations = [sympy.expand(sympy.sympify(str(direction).replace("^", "**")).subs(substitutions)) for direction in directions]
+        endpoints = track_paths(equations, depSymbols, cores=syngular.HOMOTOPY_CORES, seed=random.randrange(10 ** 9))
+        if verbose:
+            print(f"Tracked homotopy paths to {len(endpoints)} finite non-singular endpoints.")
+        points = [newton_refine(directions, (0, ) * len(directions), independent_values | {key: field(val) for key, val in zip(depSymbols, endpoint)}, depSymbols, field)
+                  for endpoint in endpoints]
+        points = [point for point in points if point is not None and _is_solution(self.generators, point, field)]
+        if points == []:
+            raise AssertionError("No homotopy path ended on the variety.")
+        point = points[0] if not syngular.POINT_ON_VARIETY_RANDOM_SOLUTION else random.choice(points)
+        if valuations != tuple():
+            point = newton_refine(directions, valuations, point, depSymbols, field)
+            if point is None:
+                raise RootPrecisionError("Newton steps did not converge to the perturbed point.")
+        return {str(key): val for key, val in point.items()}
+
+    def _mixed_precision_point(self, field, directions, valuations, base_point, depSymbols, verbose=False):
+        """Helper function for point_on_variety with syngular.POINT_ON_VARIETY_MIXED_PRECISION. Solves the directions at the base point in double precision
+        by a parameter homotopy (one path from a random start solution, see syngular.homotopy.ParameterHomotopy), refines the endpoint by Newton steps
+        at the field's digits, and accepts it if check_solutions passes on the generators, trying the other start solutions otherwise.
+        The point is then perturbed by the valuations. Returns None if the directions are not a square system in the dependent variables or if no path succeeds."""
+        if len(directions) != len(depSymbols):
+            return None
+        independent_values = {key: val for key, val in base_point.items() if key not in depSymbols}
+        homotopy = parameter_homotopy(tuple(map(str, directions)), tuple(depSymbols), tuple(independent_values))
+        start_solutions = random.sample(homotopy.start_solutions, len(homotopy.start_solutions))
+        for start_solution in start_solutions:
+            endpoint = homotopy([complex(val) for val in independent_values.values()], start_solution)
+            if endpoint is None:
+                continue
+            point = newton_refine(directions, (0, ) * len(directions), independent_values | {key: field(val) for key, val in zip(depSymbols, endpoint)}, depSymbols, field)
+            if point is None or not _is_solution(self.generators, point, field):
+                continue
+            if valuations != tuple():
+                point = newton_refine(directions, valuations, point, depSymbols, field)
+                if point is None:
+                    continue
+            if verbose:
+                print(f"Refined a double precision solution of the directions by Newton steps ({len(start_solutions)} start solutions).")
+            return {str(key): val for key, val in point.items()}
+        return None
+
+    @with_other_cas_compatible_str
+    def witness_sets(self, dimensions=None, cores=None, seed=None):
+        """Witness sets of the equidimensional parts of the variety, one per dimension (default: from self.dim down to 0), as {dimension: WitnessSet}.
+        Each is the set of non-singular isolated solutions of codim random combinations of the generators and dimension random linear equations,
+        found by total-degree homotopy continuation, which lie on the variety and at which the Jacobian of the generators has rank codim.
+        The latter removes points on higher dimensional components, as well as those on non-reduced components."""
+        from .ring import Ring
+        if type(self.ring) is not Ring or str(self.ring.field) != "0":
+            raise NotImplementedError("Witness sets are implemented for ideals in (non-quotient) rings of characteristic zero.")
+        rng = random.Random(seed)
+        cores = syngular.HOMOTOPY_CORES if cores is None else cores
+        variables = tuple(map(str, self.ring.variables))
+        symbols = sympy.symbols(variables)
+        generators = [sympy.sympify(str(generator).replace("^", "**")) for generator in self.generators]
+        evaluate, jacobian, degrees = compiled_system(tuple(map(str, generators)), variables)
+        witness_sets = {}
+        for dimension in (range(self.dim, -1, -1) if dimensions is None else dimensions):
+            codim = len(variables) - dimension
+            if codim > len(generators):
+                continue
+            # Gaussian integer coefficients keep the combinations exact, so their points can be refined to any precision
+            randomization = [[rng.randint(-10 ** 3, 10 ** 3) + rng.randint(-10 ** 3, 10 ** 3) * sympy.I for _ in generators] for _ in range(codim)]
+            equations = tuple(str(sympy.expand(sum(coefficient * generator for coefficient, generator in zip(row, generators)))) for row in randomization)
+            A, b = random_slice(dimension, variables, rng)
+            linear_equations = [str(sum(coefficient * symbol for coefficient, symbol in zip(row, symbols)) - constant) for row, constant in zip(A, b)]
+            points = []
+            for point in track_paths(equations + tuple(linear_equations), variables, cores=cores, seed=rng.random()):
+                scale = (1 + numpy.linalg.norm(point)) ** max(degrees, default=1)
+                if numpy.linalg.norm(evaluate(point)) > 1e-8 * scale:
+                    continue
+                if numpy.linalg.matrix_rank(jacobian(point), tol=1e-8 * scale) != codim:
+                    continue
+                if any(numpy.linalg.norm(point - other) <= 1e-8 * (1 + numpy.linalg.norm(point)) for other in points):
+                    continue
+                points += [point]
+            if points != []:
+                witness_sets[dimension] = WitnessSet(dimension, equations, variables, (A, b), points)
+        return witness_sets
+
+    def numerical_irreducible_decomposition(self, dimensions=None, cores=None, seed=None, max_loops=50, stable_loops=10):
+        """Irreducible components of the (reduced) variety, as WitnessSets whose degree is that of the component, ordered by decreasing dimension.
+        The witness points of each dimension are grouped by monodromy, see syngular.homotopy.monodromy_groups."""
+        rng = random.Random(seed)
+        cores = syngular.HOMOTOPY_CORES if cores is None else cores
+        components = []
+        for dimension, witness_set in self.witness_sets(dimensions=dimensions, cores=cores, seed=rng.random()).items():
+            groups = monodromy_groups(witness_set.equations, witness_set.variables, witness_set.slice, witness_set.points,
+                                      cores=cores, seed=rng.random(), max_loops=max_loops, stable_loops=stable_loops)
+            components += [witness_set._replace(points=[witness_set.points[i] for i in group]) for group in sorted(groups, key=len, reverse=True)]
+        return components
+
+    def point_on_component(self, component, field, seed=None, max_tries=10):
+        """A point on the irreducible component (a WitnessSet) of the variety, with values in field (mpc).
+        A random witness point is moved to a random linear slice, then refined by Newton steps to the field's digits."""
+        if field.name != "mpc":
+            raise ValueError(f"Points on components are computed over mpc fields, got {field}.")
+        rng = random.Random(seed)
+        for _ in range(max_tries):
+            end_slice = random_slice(component.dimension, component.variables, rng)
+            start_point = component.points[rng.randrange(len(component.points))]
+            endpoint = track_slice_paths(component.equations, component.variables, component.slice, end_slice, [start_point], seed=rng.random())[0]
+            if endpoint is None:
+                continue
+            point = {key: field(complex(value)) for key, value in zip(component.variables, endpoint)}
+            point = newton_refine(component.equations, (0, ) * len(component.equations), point, component.variables, field)
+            if point is not None and _is_solution([sympy.expand(sympy.sympify(str(generator).replace("^", "**"))) for generator in self.generators], point, field):
+                return point
+        raise RootPrecisionError(f"Could not find a point on the component after {max_tries} attempts.")
+
     @with_other_cas_compatible_str
-    def _semi_numerical_slice(self, field, directions, valuations, base_point, depSymbols, verbose=False, iteration=0):
+    def _semi_numerical_slice(self, field, directions, valuations, base_point, depSymbols, verbose=False, iteration=0, sampler=None):
         """Helper function for point_on_variety. Uses the values in 'base_point' to return a new ideal of lower dimension.
-        The potentially perturbed slice of the origial ideal 'self'."""
+        The potentially perturbed slice of the origial ideal 'self'. A VarietySampler, if given, provides the parsed and split generators."""
 
         from .ideal import Ideal
         from .ring import Ring
@@ -351,8 +750,11 @@ class Variety_of_Ideal:
         else:
             generators = copy(self.generators)
 
-        generators = [Polynomial(generator, field=field) for generator in generators]
-        generators = [generator.subs(base_point, field=field) for generator in generators]
+        if sampler is not None and iteration == 0:
+            generators = [sampler.substitute(generator, base_point, depSymbols) for generator in generators]
+        else:
+            generators = [Polynomial(generator, field=field) if sampler is None else sampler.polynomial(generator) for generator in generators]
+            generators = [generator.subs(base_point, field=field) for generator in generators]
         generators = list(filter(lambda x: x != 0, generators))
 
         if field.characteristic == 0:
@@ -373,6 +775,160 @@ class Variety_of_Ideal:
         return oZeroDimIdeal
 
 
+class VarietySampler:
+    """Setup of point_on_variety computed once for an (ideal, field): the directions, whether independent sets are computed or guessed
+    (with the 3 seconds trial), and the generators parsed as Polynomials over the field and split by monomials in the dependent variables.
+    Each point then only costs the evaluation of the coefficients at the base point and the solution of the slice."""
+
+    def __init__(self, ideal, field, directions=None, indepSet='guess', method='lex', verbose=False):
+        self.ideal, self.field, self.method, self.verbose = ideal, field, method, verbose
+        if indepSet == 'guess':
+            with TemporarySetting("syngular", "TIMEOUT", 3):
+                try:
+                    ideal.indepSets
+                    indepSet = None
+                except TimeoutError:
+                    indepSet = 'force guess'
+        self.indepSet = indepSet
+        if field.name == "finite field":
+            directions = []
+        elif directions is None or len(directions) == 0:
+            directions = ideal._default_directions()
+        self.directions = [str(sympy.expand(direction)) if isinstance(direction, sympy.core.Basic) else direction for direction in directions]
+        self._polynomials, self._splits = {}, {}
+
+    def __repr__(self):
+        return f"VarietySampler({self.ideal!r}, {self.field!r}, directions={self.directions}, indepSet={self.indepSet!r}, method={self.method!r})"
+
+    def point(self, base_point={}, valuations=tuple(), seed=None):
+        """A point on the variety, see Ideal.point_on_variety."""
+        return self.ideal.point_on_variety(self.field, base_point=base_point, directions=self.directions, valuations=valuations, indepSet=self.indepSet,
+                                           seed=seed, verbose=self.verbose, method=self.method, sampler=self)
+
+    def points(self, number, seed=None):
+        """A list of number independent points on the variety."""
+        rng = random.Random(seed)
+        return [self.point(seed=None if seed is None else rng.randrange(2 ** 32)) for _ in range(number)]
+
+    def polynomial(self, generator):
+        """The generator parsed as a Polynomial over the field, cached."""
+        if generator not in self._polynomials:
+            self._polynomials[generator] = Polynomial(generator, self.field)
+        return self._polynomials[generator]
+
+    def substitute(self, generator, base_point, depSymbols):
+        """generator.subs(base_point) for a base point assigning values to all variables but depSymbols, computed from the cached
+        split of the generator as a sum over monomials in depSymbols with coefficients monomials in the other variables."""
+        key = (generator, tuple(depSymbols))
+        if key not in self._splits:
+            split = {}
+            for coeff, monomial in self.polynomial(generator).coeffs_and_monomials:
+                dependent = Monomial({variable: exponent for variable, exponent in monomial.items() if variable in depSymbols})
+                independent = tuple((variable, exponent) for variable, exponent in monomial.items() if variable not in depSymbols)
+                split.setdefault(dependent, []).append((coeff, independent))
+            self._splits[key] = list(split.items())
+        coeffs_and_monomials = []
+        for dependent, terms in self._splits[key]:
+            value = self.field(0)
+            for coeff, independent in terms:
+                term = coeff
+                for variable, exponent in independent:
+                    term = term * base_point[variable] ** exponent
+                value = value + term
+            if value != 0:
+                coeffs_and_monomials += [(value, dependent)]
+        return Polynomial(coeffs_and_monomials, self.field) if coeffs_and_monomials != [] else Polynomial(0, self.field)
+
+
+def hensel_lift(directions, valuations, base_point, depSymbols, field):
+    """Lifts a point known modulo p to O(p^digits) by multivariate Newton steps, such that each direction evaluates to p^valuation times a random unit.
+    The values of depSymbols in base_point are the solutions modulo p, as Polynomials of the form root + p * depSymbol.
+    Returns the lifted point, or None if the system is not square, valuations are not integers, or the Jacobian is singular modulo p."""
+    if len(directions) != len(depSymbols) or not all(isinstance(valuation, int) for valuation in valuations):
+        return None
+    prime, digits = field.characteristic, field.digits
+    independent_values = {key: val for key, val in base_point.items() if key not in depSymbols}
+    point = independent_values | {key: field(int(_constant_term(base_point[key].subs({depSymbol: 0 for depSymbol in depSymbols}))))
+                                  for key in depSymbols}
+    equations = [Polynomial(direction, field).subs(independent_values) for direction in directions]
+    jacobian = [[equation.diff(depSymbol) for depSymbol in depSymbols] for equation in equations]
+    targets = [field(prime ** valuation * (random.randrange(1, prime) + prime * random.randrange(prime ** max(digits - 1, 0))))
+               for valuation in valuations]
+    for _ in range(int(numpy.log2(max(digits, 1))) + 3):
+        values = {key: point[key] for key in depSymbols}
+        residuals = [_constant_term(equation.subs(values)) - target for equation, target in zip(equations, targets)]
+        if all(residual == 0 for residual in residuals):
+            return point
+        steps = padic_linear_solve([[_constant_term(entry.subs(values)) for entry in row] for row in jacobian], residuals)
+        if steps is None:
+            return None
+        for key, step in zip(depSymbols, steps):
+            point[key] = point[key] - step
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def compiled_mpmath_system(equations, variables, unknowns):
+    """mpmath functions of the values of the variables evaluating the equations (strings) and their Jacobian w.r.t. the unknowns, compiled once."""
+    symbols = tuple(map(sympy.Symbol, variables))
+    expressions = [sympy.sympify(equation.replace("^", "**")) for equation in equations]
+    return (sympy.lambdify(symbols, expressions, "mpmath"),
+            sympy.lambdify(symbols, [[sympy.diff(expression, sympy.Symbol(unknown)) for unknown in unknowns] for expression in expressions], "mpmath"))
+
+
+def newton_refine(equations, targets, point, unknowns, field, max_steps=None):
+    """Refines an approximate complex point such that each equation evaluates to the corresponding target, to the precision of field.
+    Uses Newton steps of minimal norm, Δ = J^H (J J^H)^-1 (F - targets), so the system may be under-determined (more unknowns than equations);
+    the values of the other variables are kept fixed. Returns the refined point, or None if it does not converge or the Jacobian is rank deficient."""
+    if len(equations) == 0 or len(equations) > len(unknowns):
+        return None
+    residual_function, jacobian_function = compiled_mpmath_system(tuple(map(str, equations)), tuple(map(str, point.keys())), tuple(map(str, unknowns)))
+    targets = [field(target) for target in targets]
+    point = {key: field(val) for key, val in point.items()}
+    tollerance = field.tollerance
+    max_steps = int(mpmath.log(field.digits, 2)) + 8 if max_steps is None else max_steps
+    for _ in range(max_steps):
+        residuals = mpmath.matrix([value - target for value, target in zip(residual_function(*point.values()), targets)])
+        if mpmath.norm(residuals) <= tollerance:
+            return point
+        jacobian = mpmath.matrix(jacobian_function(*point.values()))
+        try:
+            steps = jacobian.H * mpmath.lu_solve(jacobian * jacobian.H, residuals)
+        except ZeroDivisionError:
+            return None
+        for unknown, step in zip(unknowns, steps):
+            point[unknown] -= step
+    return None
+
+
+def _is_solution(equations, point, field):
+    try:
+        check_solutions(equations, [point], field)
+    except (RootPrecisionError, AssertionError):
+        return False
+    return True
+
+
+def _constant_term(polynomial):
+    return sum([coeff for coeff, monomial in polynomial.coeffs_and_monomials if monomial == Monomial("")], polynomial.field(0))
+
+
+def padic_linear_solve(matrix, vector):
+    """Solves matrix * x = vector over the p-adic integers by Gaussian elimination with unit pivots, or returns None if matrix is singular modulo p."""
+    size = len(vector)
+    rows = [list(row) + [entry] for row, entry in zip(matrix, vector)]
+    for column in range(size):
+        pivot = next((i for i in range(column, size) if rows[i][column] != 0 and rows[i][column].n == 0), None)
+        if pivot is None:
+            return None
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for i in range(size):
+            if i != column and rows[i][column] != 0:
+                factor = rows[i][column] / rows[column][column]
+                rows[i] = [a - factor * b for a, b in zip(rows[i], rows[column])]
+    return [rows[i][size] / rows[i][i] for i in range(size)]
+
+
 def update_point_dict(base_point_dict, new_vals_dict, field):
     for key in base_point_dict:
         if key in new_vals_dict and base_point_dict[key] == key:
@@ -389,82 +945,156 @@ def update_point_dict(base_point_dict, new_vals_dict, field):
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
 
 
-def univariate_floating_point_solver(equation, root_dict):
-    """Returns all possible solutions of 'equation' over arbitrary precision complex numbers."""
+def univariate_floating_point_roots(equation, root_dict, digits=None):
+    """Returns the symbol left in 'equation' after substituting 'root_dict', and its roots over arbitrary precision complex numbers, accurate to 'digits' (default mpmath.mp.dps)."""
+    digits = mpmath.mp.dps if digits is None else digits
     equation = sympy.sympify(equation).subs(root_dict)
     free_symbols = list(equation.free_symbols)
     assert len(free_symbols) == 1
     symbol = free_symbols[0]
-    solutions = list(map(mpmath.mpc, sympy.nroots(equation, n=300, maxsteps=500)))  # mpmath.polyroots is faster, but the parsing is more complicated
-    return update_root_dict(symbol, solutions, root_dict)
+    coeffs_dict = sympy.collect(sympy.expand(equation), symbol, evaluate=False)
+    coeffs = [0] * (max(sympy.degree(monomial, symbol) for monomial in coeffs_dict) + 1)
+    for monomial, coeff in coeffs_dict.items():
+        coeffs[sympy.degree(monomial, symbol)] = mpmath.mpc(sympy.N(coeff, digits + 10))
+    return symbol, complex_roots(coeffs, digits=digits)
 
 
-def univariate_finite_field_solver(equation, root_dict, prime):
-    """Returns all possible solutions of 'equation' over a finite field of cardinality 'prime'.
+def univariate_finite_field_roots(equation, root_dict, prime):
+    """Returns the symbol left in 'equation' after substituting 'root_dict', and its roots over a finite field of cardinality 'prime'.
        If already satisfied returns True, if no solution exists returns False."""
-    equation = sympy.sympify(equation).subs(root_dict)
-    if isinstance(equation, sympy.core.numbers.Integer) and equation % prime == 0:
-        return True
-    free_symbols = list(equation.free_symbols)
-    if len(free_symbols) < 1:
-        return False
-    if len(free_symbols) > 1:
+    equation = Polynomial(str(equation), Field("finite field", prime, 1)).subs(root_dict)
+    variables = equation.variables
+    if len(variables) > 1:
         raise Exception("Too many free parameters.")
-    symbol = free_symbols[0]
-    equation = sympy.poly(equation, modulus=prime)
-    if equation == 0:
+    coeffs = [0] * (max(sum(monomial.exps) for monomial in equation.monomials) + 1)
+    for coeff, monomial in equation.coeffs_and_monomials:
+        coeffs[sum(monomial.exps)] += int(coeff)
+    roots = finite_field_roots(coeffs, prime)
+    if roots is None:
         return True
-    pre_factor, factors = sympy.factor_list(sympy.factor(equation, modulus=prime))
-    factors = [factor[0] for factor in factors]
-    if pre_factor % prime == 0:
-        return True
-    linear_factors = [factor for factor in factors if sympy.diff(factor, symbol) == 1]
-    if linear_factors == []:
+    if len(variables) < 1 or roots == []:
         return False
-    solutions = [ModP(int(sympy.solve(factor)[0]), prime) for factor in linear_factors]
-    return update_root_dict(symbol, solutions, root_dict)
+    return sympy.Symbol(variables.pop()), [ModP(root, prime) for root in roots]
+
+
+def univariate_floating_point_solver(equation, root_dict, digits=None):
+    """Returns all possible solutions of 'equation' over arbitrary precision complex numbers, accurate to 'digits' (default mpmath.mp.dps)."""
+    return update_root_dict(*univariate_floating_point_roots(equation, root_dict, digits=digits), root_dict)
+
+
+def univariate_finite_field_solver(equation, root_dict, prime):
+    """Returns all possible solutions of 'equation' over a finite field of cardinality 'prime'.
+       If already satisfied returns True, if no solution exists returns False."""
+    roots = univariate_finite_field_roots(equation, root_dict, prime)
+    return roots if roots in (True, False) else update_root_dict(*roots, root_dict)
 
 
 def update_root_dict(symbol, solutions, root_dict):
-    """Given solutions and root_dict returns updated root_dicts."""
-    root_dicts = [deepcopy(root_dict)]
-    root_dicts[0].update({symbol: solutions[0]})
-    for solution in solutions[1:]:
-        new_root_dict = deepcopy(root_dict)
-        new_root_dict.update({symbol: solution})
-        root_dicts.append(new_root_dict)
-    return root_dicts
+    """Given solutions and root_dict returns updated root_dicts. The values are shared with root_dict, not copied."""
+    return [{**root_dict, symbol: solution} for solution in solutions]
+
+
+def lex_groebner_solutions(equations, prime=None, digits=None, rng=None):
+    """Lazily yields the variety of a zero dimensional ideal in lexicographic groebner basis form, one dictionary at a time,
+       by a depth-first walk of the solution tree: each equation is solved only on the branch being explored.
+       If 'rng' (a random.Random) is given, the roots at each level are visited in random order, so the first solution is a random branch."""
+    equations = list(equations)
+
+    def walk(level, root_dict):
+        if level == len(equations):
+            yield root_dict
+            return
+        if prime is None:
+            roots = univariate_floating_point_roots(equations[level], root_dict, digits=digits)
+        else:
+            roots = univariate_finite_field_roots(equations[level], root_dict, prime)
+        if roots is True:
+            yield from walk(level + 1, root_dict)
+        elif roots is not False:
+            symbol, solutions = roots
+            for solution in (solutions if rng is None else rng.sample(solutions, len(solutions))):
+                yield from walk(level + 1, {**root_dict, symbol: solution})
+
+    yield from walk(0, {})
 
 
-def lex_groebner_solve(equations, prime=None):
+def lex_groebner_solve(equations, prime=None, digits=None):
     """Returns the variety corresponding to a given zero dimensional ideal in lexicographic groebner basis form.
-       The variety take the form of a list of dictionaries for the possible values of the variables."""
-    root_dicts = [{}]
-    for equation in equations:
-        temp_dicts = []
-        for i, root_dict in enumerate(root_dicts):
+       The variety take the form of a list of dictionaries for the possible values of the variables.
+       Over the complex numbers (prime is None), the roots are accurate to 'digits' (default mpmath.mp.dps)."""
+    return list(lex_groebner_solutions(equations, prime=prime, digits=digits))
+
+
+def eigen_solve(multiplication_matrices, variables, prime=None, max_tries=3):
+    """Returns the variety of a zero-dimensional ideal, as a list of dictionaries, from its multiplication matrices (Stickelberger).
+       For each point p, the vector of basis monomials at p is a common left eigenvector of all matrices, with eigenvalues the coordinates of p.
+       The eigenvectors are obtained from a random linear combination of the matrices, in mpmath if prime is None, over Fp otherwise."""
+    if prime is None:
+        matrices = [mpmath.matrix([[_parse_singular_complex(entry) for entry in row] for row in matrix]) for matrix in multiplication_matrices.matrices]
+        left_eigenvectors = _mpmath_left_eigenvectors
+    else:
+        from sympy.polys.matrices import DomainMatrix
+        domain = sympy.GF(prime)
+        matrices = [DomainMatrix([[domain(int(entry)) for entry in row] for row in matrix], (len(matrix), len(matrix)), domain)
+                    for matrix in multiplication_matrices.matrices]
+        left_eigenvectors = functools.partial(_finite_field_left_eigenvectors, prime=prime)
+    for _ in range(max_tries):
+        combination = sum([random.randint(1, 10 ** 6) * matrix for matrix in matrices[1:]], matrices[0])
+        eigenvectors = left_eigenvectors(combination)
+        if eigenvectors is not None:
+            break
+    else:
+        raise RootNotInFieldError("Could not separate the points with a random linear combination of the multiplication matrices.")
+    root_dicts = []
+    for eigenvector in eigenvectors:
+        root_dict = {}
+        for variable, matrix in zip(variables, matrices):
             if prime is None:
-                sols = univariate_floating_point_solver(equation, root_dict)
-            else:
-                sols = univariate_finite_field_solver(equation, root_dict, prime)
-            if sols is True:
-                temp_dicts += [root_dict]
-            elif sols is False:
-                continue
+                image = eigenvector * matrix
+                k = max(range(len(eigenvector)), key=lambda k: abs(eigenvector[k]))
+                root_dict[variable] = image[k] / eigenvector[k]
             else:
-                temp_dicts += sols
-        else:
-            root_dicts = temp_dicts
+                image = (eigenvector * matrix).to_Matrix()
+                k = next(k for k in range(eigenvector.shape[1]) if eigenvector[0, k].element != 0)
+                root_dict[variable] = ModP(int(image[0, k]) * pow(int(eigenvector[0, k].element), -1, prime) % prime, prime)
+        root_dicts += [root_dict]
     return root_dicts
 
 
+def _parse_singular_complex(entry):
+    re_part, im_part = sympy.sympify(entry).as_real_imag()
+    return mpmath.mpc(mpmath.mpf(str(re_part)), mpmath.mpf(str(im_part)))
+
+
+def _mpmath_left_eigenvectors(matrix):
+    _, left = mpmath.eig(matrix, left=True, right=False)
+    return [left[i, :] for i in range(left.rows)]
+
+
+def _finite_field_left_eigenvectors(matrix, prime):
+    """Left eigenvectors for the eigenvalues in Fp, or None if an eigenspace is not one dimensional."""
+    from sympy.polys.matrices import DomainMatrix
+    domain = matrix.domain
+    eigenvalues = finite_field_roots([int(coeff) for coeff in reversed(matrix.charpoly())], prime)
+    eigenvectors = []
+    for eigenvalue in eigenvalues:
+        nullspace = (matrix.transpose() - DomainMatrix.eye(matrix.shape[0], domain) * domain(eigenvalue)).nullspace()
+        if nullspace.shape[0] != 1:
+            return None
+        eigenvectors += [nullspace]
+    return eigenvectors
+
+
 def check_solutions(equations, root_dicts, field):
     """Checks that all solutions in root_dicts solve the equations."""
     field = field if field.name not in ["padic", "Qp"] else Field("finite field", field.characteristic, 1)
+    plan = evaluation_plan(tuple(map(str, equations)), field)
     for root_dict in root_dicts:
-        check = [Polynomial(equation, field).subs(root_dict) for equation in equations]
-        assert all([len(entry) == 1 for entry in check])  # check these are elements of the field
-        if not all([abs(entry.coeffs[0]) <= field.tollerance for entry in check]):
+        try:
+            check = plan(root_dict)
+        except KeyError:  # not all variables have values
+            raise AssertionError
+        if not all([abs(entry) <= field.tollerance for entry in check]):
             if field.characteristic == 0:
                 raise RootPrecisionError
             else:
@@ -0,0 +1,33 @@
+import numpy
+import pytest
+
+from syngular.homotopy import ParameterHomotopy, monodromy_groups, track_paths
+
+
+@pytest.mark.parametrize("cores", [1, 2])
+def test_track_paths_to_isolated_solutions(cores):
+    endpoints = track_paths(["x^2+y^2-5", "x*y-2"], ["x", "y"], cores=cores, seed=1)
+    solutions = sorted([tuple(numpy.round(endpoint.real, 10)) for endpoint in endpoints])
+    assert solutions == [(-2, -1), (-1, -2), (1, 2), (2, 1)]
+    assert max(abs(abs(endpoint.imag)).max() for endpoint in endpoints) < 1e-10
+
+
+def test_track_paths_discards_solutions_at_infinity():
+    endpoints = track_paths(["x*y-1", "x*y+x-3"], ["x", "y"], seed=1)  # Bezout bound 4, one finite solution
+    assert len(endpoints) == 1 and numpy.allclose(endpoints[0], [2, 0.5])
+
+
+def test_parameter_homotopy():
+    homotopy = ParameterHomotopy(["x^2+y^2-a", "x*y-b"], ["x", "y"], ["a", "b"])
+    assert len(homotopy.start_solutions) == 4
+    endpoints = [homotopy([5, 2], start_solution) for start_solution in homotopy.start_solutions]
+    solutions = sorted([tuple(numpy.round(endpoint.real, 10)) for endpoint in endpoints])
+    assert solutions == [(-2, -1), (-1, -2), (1, 2), (2, 1)]
+
+
+def test_monodromy_groups_of_reducible_curve():
+    equations, variables = ("(x^2+y^2-1)*(x-y)", ), ("x", "y")
+    witness_slice = (numpy.array([[1.1 + 0.3j, -0.7 + 0.2j]]), numpy.array([0.4 - 0.9j]))
+    points = track_paths(equations + ("(1.1+0.3j)*x+(-0.7+0.2j)*y-(0.4-0.9j)", ), variables, seed=1)
+    groups = monodromy_groups(equations, variables, witness_slice, points, seed=1)
+    assert sorted(map(len, groups)) == [1, 2]
@@ -1,3 +1,4 @@
+import functools
 import pytest
 import sympy
 import numpy
@@ -45,6 +46,10 @@ def test_ideal_mul_and_power():
     R = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['1'])
     assert I ** 2 == I * I == J
     assert I ** 0 == J ** 0 == R
+    I1 = I ** 1
+    assert I1 == I and I1 is not I
+    I1.generators.append('x1^3')
+    assert I.generators == ['x1', 'x2']
 
 
 def test_primary_decomposition():
@@ -71,6 +76,16 @@ def test_primary_intersection():
     assert I == Ideal.intersection(*(I, ))
 
 
+@pytest.mark.parametrize("cores", [1, None, 3])
+def test_nary_intersection_sum_and_product(cores):
+    ring = Ring('0', ('x1', 'x2', 'x3'), 'dp')
+    ideals = [Ideal(ring, [f'x1-{k}', f'x2-{k}']) for k in range(7)]
+    assert Ideal.intersection(*ideals, cores=cores) == functools.reduce(lambda i, j: i & j, ideals)
+    assert Ideal.sum(*ideals[:2], Ideal(ring, ['x3']), cores=cores) == Ideal(ring, ['1'])
+    assert Ideal.product(*ideals[:4], cores=cores) == ideals[0] * ideals[1] * ideals[2] * ideals[3]
+    assert Ideal.product(*[ideals[0]] * 5, cores=cores) == ideals[0] ** 5
+
+
 def test_eliminate():
     I = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['x1', 'x2'])
     J = Ideal(Ring('0', ('x1', ), 'dp'), ['x1'])
@@ -187,6 +202,38 @@ def test_ideal_saturation():
     assert I.saturation_index(J) == 5
 
 
+@pytest.mark.parametrize("method", ["auto", "quotient", "rabinowitsch"])
+def test_ideal_multi_saturation(method):
+    r = Ring('0', ('x', 'y', ), 'dp')
+    I = Ideal(r, ('x^3*(y-1)^2', 'x^2*y*(y-1)'))
+    saturation = I.multi_saturation(['y-1', 'x'], method=method)
+    assert saturation.indices == [1, 3]
+    assert len(saturation.timings) == len(saturation.intermediates) == 2
+    assert saturation.intermediates[0] == Ideal(r, ['x^2*y', 'x^3'])
+    assert saturation.intermediates[0].groebner_basis == saturation.intermediates[0].get_groebner_basis(reduced=True, algorithm='groebner')
+    assert saturation.ideal.is_unit_ideal
+
+
+@pytest.mark.parametrize("strategy", ["direct", "fglm", "walk"])
+def test_lex_groebner_basis_strategies(strategy):
+    ring = Ring('0', ('x', 'y', 'z'), 'lp')
+    zero_dimensional = Ideal(ring, ['x^2+y*z-1', 'y^3-x*z+2', 'z^2-x-y'])
+    positive_dimensional = Ideal(ring, ['x^2-y*z', 'y^2-x*z'])
+    for ideal, expected_strategy in [(zero_dimensional, strategy), (positive_dimensional, 'walk' if strategy == 'fglm' else strategy)]:
+        lex_groebner_basis = ideal.get_lex_groebner_basis(strategy)
+        assert lex_groebner_basis.strategy == expected_strategy
+        assert expected_strategy in lex_groebner_basis.timings
+        assert lex_groebner_basis.basis == ideal.get_groebner_basis(reduced=True, algorithm='groebner')
+    Ideal.cache_clear()
+    for other_strategy in ["direct", "fglm", "walk"]:  # each strategy is cached on its own, also in the intern table
+        with TemporarySetting(syngular, 'LEX_GROEBNER_STRATEGY', other_strategy):
+            assert Ideal(ring, ['x-y', 'y-z', 'z^2-2']).lex_groebner_basis.strategy == other_strategy
+    with TemporarySetting(syngular, 'LEX_GROEBNER_STRATEGY', strategy):
+        assert zero_dimensional.lex_groebner_basis.strategy == strategy
+        assert Ideal(ring, ['x-y', 'y-z', 'z^2-2']).lex_groebner_basis.strategy == strategy
+        assert Ideal(ring, ['x-y', 'y-z', 'z^2-2']).groebner_basis == ['z^2-2', 'y-z', 'x-z']
+
+
 def test_ideal_operation_with_degbound_no_crash():
     with TemporarySetting(syngular, 'DEGBOUND', 10):
         t1, t2 = sympy.symbols('t1, t2')
@@ -194,3 +241,107 @@ def test_ideal_operation_with_degbound_no_crash():
         a = Ideal(ring, [-832384713 * t1 ** 4 * t2 ** 4, ])
         b = Ideal(ring, [-832384713 * t1 ** 4 * t2 ** 4, ])
         a * b
+
+
+def test_ideal_interning_shares_cached_properties():
+    Ideal.cache_clear()
+    I = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['x1^2*x2', 'x2^3'])
+    I.groebner_basis, I.dim
+    info = Ideal.cache_info()
+    J = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['x1^2*x2', 'x2^3'])
+    assert 'groebner_basis' not in J.__dict__ and J._dim is None
+    assert J.groebner_basis == I.groebner_basis and J.dim == I.dim == 1
+    assert Ideal.cache_info().hits == info.hits + 2
+    assert Ideal.cache_info().misses == info.misses
+
+
+def test_ideal_interning_does_not_share_mutations():
+    ring = Ring('0', ('x', 'y'), 'dp')
+    I = Ideal(ring, ['x^2', 'x^2+x*y', 'x*y'])
+    I.squash()
+    I.generators += ['y^3']
+    J = Ideal(ring, ['x^2', 'x^2+x*y', 'x*y'])
+    assert sorted(J.minbase) == ['x*y', 'x^2'] and isinstance(J.minbase, list)
+    J.groebner_basis.append('y^5')
+    assert 'y^5' not in Ideal(ring, ['x^2', 'x^2+x*y', 'x*y']).groebner_basis
+
+
+def test_ideal_interning_lru_eviction():
+    Ideal.cache_clear()
+    ring = Ring('0', ('x1', 'x2'), 'dp')
+    with TemporarySetting(syngular, 'IDEAL_CACHE_MAXSIZE', 2):
+        for generator in ['x1', 'x2', 'x1+x2']:
+            Ideal(ring, [generator]).dim
+        info = Ideal.cache_info()
+        assert info.currsize == 2 and info.evictions == 1 and info.maxsize == 2
+    with TemporarySetting(syngular, 'IDEAL_CACHE_MAXSIZE', 0):
+        Ideal.cache_clear()
+        Ideal(ring, ['x1']).dim
+        assert Ideal.cache_info().currsize == 0
+
+
+def test_ideal_fingerprint():
+    ring = Ring('0', ('x1', 'x2'), 'dp')
+    I = Ideal(ring, ['x1^2*x2', 'x2^3'])
+    J = Ideal(ring, ['x2^3', 'x1^2*x2+x2^3'])
+    K = Ideal(ring, ['x1^2*x2', 'x2^2'])
+    assert I.fingerprint == J.fingerprint and I.fingerprint.prime == syngular.FINGERPRINT_PRIME
+    assert hash(I) == hash(J)
+    assert I != K and 'reduced_groebner_basis' not in K.__dict__
+    assert I == J
+    assert not I.is_unit_ideal and Ideal(ring, ['x1', 'x1+1']).is_unit_ideal
+
+
+def test_ideal_fingerprint_not_available():
+    ring = Ring(('0', 'a'), ('x1', 'x2'), 'dp')
+    I = Ideal(ring, ['a*x1^2*x2', 'x2^3'])
+    assert I.fingerprint.groebner_basis is None
+    assert {I, I} == {I}
+
+
+def test_minimal_associated_primes():
+    ring = Ring('0', ('x1', 'x2', 'x3'), 'dp')
+    I = Ideal(ring, ['x1^2*x2*(x3-1)', 'x1*x3^2'])
+    primes = I.minimal_associated_primes
+    parallel_primes = I.parallel_minimal_associated_primes(cores=2)
+    assert set(primes) == set(parallel_primes)
+    assert Ideal.intersection(*primes) == I.radical
+
+
+def test_parallel_primary_decomposition():
+    ring = Ring('0', ('x1', 'x2', 'x3'), 'dp')
+    I = Ideal(ring, ['x1^2*x2*(x3-1)', 'x1*x3^2'])
+    components = I.parallel_primary_decomposition(cores=3)
+    assert Ideal.intersection(*[primary for primary, _ in components]) == I
+    assert {prime for _, prime in components} == {prime for _, prime in I.primary_decomposition}
+    assert len(list(I.primary_decomposition_iter(cores=1))) == len(I.primary_decomposition)
+
+
+def test_decomposition_iter_close_does_not_wait():
+    ring = Ring('0', ('x1', 'x2', 'x3'), 'dp')
+    I = Ideal(ring, ['x1^2*x2*(x3-1)', 'x1*x3^2'])
+    primes = I.minimal_associated_primes_iter(cores=2)
+    assert I in next(primes)
+    primes.close()
+
+
+def test_singular_processes_terminate():
+    import threading
+    import time
+    from syngular.tools import execute_singular_command, SingularProcesses
+    processes, errors = SingularProcesses(), []
+
+    def run():
+        try:
+            processes.run(execute_singular_command, 'int k; for (k=0; k<300000000; k++) {} print(k); $', timeout=60)
+        except SingularException as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    time.sleep(0.5)
+    start = time.time()
+    processes.terminate()
+    thread.join(5)
+    assert not thread.is_alive() and time.time() - start < 1
+    assert len(errors) == 1
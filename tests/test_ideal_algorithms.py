@@ -1,7 +1,8 @@
 import pytest
 import syngular
 
-from syngular import Ideal, Ring
+from pycoretools import TemporarySetting
+from syngular import Field, Ideal, Ring
 # from syngular.ideal_algorithms import Inconclusive
 
 
@@ -46,3 +47,19 @@ def test_test_primality_with_degree_bound():
     I = Ideal(r, generators)
     syngular.DEGBOUNDs = [4, 6, ]
     assert I.test_primality(verbose=True, iterated_degbound_computation=True, projection_number=192)
+
+
+def test_rational_parametrisation():
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    parametrisation = I.rational_parametrisation
+    assert len(parametrisation.independent) == I.dim and len(parametrisation.formulas) == I.codim
+    Fp = Field("finite field", 2 ** 31 - 1, 1)
+    independent_values = {variable: Fp.random() for variable in parametrisation.independent}
+    assert I.generators_eval(**independent_values, **parametrisation(Fp, independent_values)) == [0, 0, 0]
+    with TemporarySetting(syngular, "POINT_ON_VARIETY_RATIONAL_PARAMETRISATION", True):
+        point_dict = I.point_on_variety(Field("mpc", 0, 300))
+    assert max(abs(value) for value in I.generators_eval(**point_dict)) < 10 ** -280
+    assert Ideal(Ring('0', ('x', 'y'), 'dp'), ['x^2+y^2-1']).rational_parametrisation_over(('x', )) is None
+    assert Ideal(Ring('0', ('x', 'y'), 'dp'), ['x*y-1']).rational_parametrisation_over(('x', )).formulas == {'y': ('1', 'x')}
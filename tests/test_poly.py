@@ -5,6 +5,7 @@ import re
 import numpy
 
 from syngular import Monomial, Polynomial, Field, Ring, RingPoint, RingPoints, TemporarySetting, Q, Qi
+from syngular.polynomial import EvaluationPlan
 
 from fractions import Fraction
 
@@ -217,7 +218,25 @@ def test_poly_subs_partial_dict():
     assert Polynomial('2 x y', Q).subs({'x': 1, }) == Polynomial("2y", Field('rational', 0, 0))
 
 
+def test_poly_diff():
+    assert Polynomial('3*x^2*y+x*y^3-7*y+2', Q).diff('x') == Polynomial('6*x*y+y^3', Q)
+    assert Polynomial('3*x^2*y+x*y^3-7*y+2', Q).diff('y') == Polynomial('3*x^2+3*x*y^2-7', Q)
+    assert Polynomial('3*x^2*y+x*y^3-7*y+2', Q).diff('z') == 0
+
+
 def test_monom_power():
     assert Monomial("x y^2 z") ** 3 == Monomial("x^3 y^6 z^3")
     with pytest.raises(Exception, match="Monomial to negative power is a Rational Function."):
         Monomial("x y^2 z") ** -1
+
+
+def test_evaluation_plan():
+    field = Field("finite field", 2 ** 31 - 1, 1)
+    ring = Ring('0', ('x1', 'x2', 'x3'), 'dp')
+    polynomials = [Polynomial(string, field) for string in ("x1^3*x2+2*x1^3*x3-x2^2", "x1^3*x2*x3^5-7", "x2^4+x1^3*x2", "5")]
+    plan = EvaluationPlan(polynomials)
+    assert plan.multiplications < sum(sum(monomial.values()) for polynomial in polynomials for monomial in polynomial.monomials)
+    oPoints = RingPoints([RingPoint(ring, field, seed=seed) for seed in range(3)])
+    values = plan(oPoints)
+    assert all(list(row) == [polynomial.subs(oPoint).coeffs[0] for polynomial in polynomials] for row, oPoint in zip(values, oPoints))
+    assert [list(column) for column in plan(oPoints.columnar())] == [list(values[:, i]) for i in range(4)]
@@ -1,3 +1,4 @@
+import pickle
 import numpy
 import sympy
 
@@ -28,3 +29,13 @@ def test_qring_and_point_in_ring():
     field = Field('finite field', 2 ** 31 - 1, 1)
     point = q.random_point(field=field)
     assert all([Polynomial(generator, field)(point) == 0 for generator in i.generators])
+
+
+def test_qring_univariate_slices():
+    ring = Ring('0', ('a1', 'b1', 'c1', 'd1'), 'dp')
+    qring = QRing(ring, Ideal(ring, ['a1*d1-b1*c1']))
+    field = Field('finite field', 2 ** 31 - 1, 1)
+    slices = qring.univariate_slices(field, seeds=[0, 1], cores=2)
+    assert pickle.loads(pickle.dumps(slices[0]))(field(5)) == slices[0](field(5))
+    assert slices[0](field(5)) != slices[1](field(5))
+    assert all(Polynomial('a1*d1-b1*c1', field).subs(oSlice(field.random())) == 0 for oSlice in slices)
@@ -1,7 +1,10 @@
+import pickle
+import pytest
 import sympy
 
 from pyadic import ModP, PAdic
-from syngular import Field, Ring, RingPoint
+from syngular import Field, Ring, RingPoint, RingPoints
+from syngular.point import compiled_expressions
 
 
 Qp = Field("padic", 2 ** 31 - 1, 15)
@@ -38,3 +41,34 @@ def test_Fp_ring_slice():
     oSlice.univariate_slice()
     assert isinstance(oSlice("z"), sympy.Expr)
     assert oSlice("z").as_poly().degree() == 1
+
+
+@pytest.mark.parametrize("cse", [False, True])
+def test_compiled_expressions(cse):
+    ring = Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp')
+    oPoints = RingPoints([RingPoint(ring, Fp, seed=seed) for seed in range(3)])
+    expressions = ("-( 6 ( -1 + w) ( +1 + z) ( wb - zb + wb zb - X z zb))", "( wb - zb + wb zb - X z zb)^2/(1+z)", "z/2+1/3")
+    evaluator = compiled_expressions(expressions, cse=cse)
+    values = evaluator(oPoints)
+    assert all(list(values[:, i]) == list(oPoints(expression)) for i, expression in enumerate(expressions[:2]))
+    assert values[0, 2] == oPoints[0]["z"] / 2 + Fp(1) / 3
+    assert [list(column) for column in evaluator(oPoints.columnar())] == [list(values[:, i]) for i in range(3)]
+
+
+def test_ring_point_copy_hash_and_pickle():
+    ring = Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp')
+    oPoint = RingPoint(ring, Fp, seed=0)
+    oCopy = oPoint.copy()
+    assert oCopy == oPoint and hash(oCopy) == hash(oPoint) and oCopy.ring is oPoint.ring and oCopy.field is oPoint.field
+    oCopy["z"] = oCopy["z"] + 1
+    assert oCopy != oPoint and hash(oCopy) != hash(oPoint) and oCopy in {oCopy} and oPoint not in {oCopy}
+    oPickled = pickle.loads(pickle.dumps(oPoint))
+    assert isinstance(oPickled, RingPoint) and oPickled == oPoint and oPickled.field == Fp
+
+
+def test_Fp_ring_slice_subs():
+    ring = Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp')
+    oSlice = RingPoint(ring, Fp, seed=0).univariate_slice()
+    oPoint = oSlice.copy().subs({'t': 3})
+    assert all(isinstance(value, ModP) for value in oPoint.values()) and oPoint == oSlice.copy().subs({sympy.symbols('t'): Fp(3)})
+    assert isinstance(oSlice("z"), sympy.Expr)
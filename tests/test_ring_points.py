@@ -1,4 +1,7 @@
-from syngular import Field, Ring, RingPoint, RingPoints
+import pytest
+
+from syngular import Field, Ring, RingPoint, RingPoints, ColumnarRingPoints
+from syngular.point import compiled_expression
 
 
 Fp = Field("finite field", 2 ** 31 - 1, 1)
@@ -22,3 +25,37 @@ def test_ring_points_field():
     lPs = [RingPoint(ring, field=Fp, seed=seed) for seed in range(10)]
     lPs = RingPoints(lPs)
     assert lPs.field == lPs[0].field
+
+
+@pytest.mark.parametrize("field", [Fp, Field("padic", 2 ** 31 - 1, 3)])
+def test_columnar_ring_points(field):
+    lPs = RingPoints([RingPoint(ring, field=field, seed=seed) for seed in range(10)])
+    lCPs = lPs.columnar()
+    expr = "-( 6 ( -1 + w) ( +1 + z) ( wb - zb + wb zb - X z zb))/(3*z^2)"
+    assert all(lCPs(expr) == lPs(expr))
+    assert list(lCPs("2")) == [field(2)] * 10
+    assert list(ColumnarRingPoints.concatenate([lCPs[:3], lCPs[3:]])("z*w")) == list(lPs("z*w"))
+    assert lCPs.to_ring_points() == lPs and lCPs[4] == lPs[4]
+
+
+@pytest.mark.parametrize("expr", ["z^(2)", "z**(2)", "z^(-1)", "z^-2", "z^(1+1)", "z⁻¹", "3/z⁻²*w", "z²+zb³"])
+def test_columnar_ring_points_powers(expr):
+    lPs = RingPoints([RingPoint(ring, field=Fp, seed=seed) for seed in range(10)])
+    assert list(lPs.columnar()(expr)) == list(lPs(expr))
+    assert eval(compiled_expression(expr, wrap_constants=True), {"_constant": Fp}, dict(lPs[0])) == lPs[0](expr)
+
+
+def test_columnar_ring_points_mismatches_and_empty():
+    F101 = Field("finite field", 101, 1)
+    lCPs = RingPoints([RingPoint(ring, field=Fp, seed=seed) for seed in range(3)]).columnar()
+    lCPs101 = RingPoints([RingPoint(ring, field=F101, seed=seed) for seed in range(3)]).columnar()
+    with pytest.raises(ValueError):
+        ColumnarRingPoints.concatenate([lCPs, lCPs101])
+    with pytest.raises(ValueError):
+        ColumnarRingPoints.concatenate([])
+    with pytest.raises(ValueError):
+        ColumnarRingPoints.from_points([])
+    with pytest.raises(ValueError):
+        ColumnarRingPoints.from_points([lCPs[0], lCPs101[0]])
+    empty = ColumnarRingPoints.from_points([], ring=ring, field=Fp)
+    assert len(empty) == 0 and len(ColumnarRingPoints.concatenate([empty, lCPs])) == 3
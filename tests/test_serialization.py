@@ -0,0 +1,92 @@
+import pickle
+import pytest
+import syngular
+
+from pycoretools import TemporarySetting
+
+from syngular import Field, Ideal, Ring, RingPoint, RingPoints, QRing, save_ideals, load_ideals, save_points, load_points
+from syngular.serialization import poly_to_terms, terms_to_poly
+
+
+@pytest.mark.parametrize("poly", [
+    "x1^2*x2+3*x2", "-1/2*x1*x2^2-x2+7", "x1", "0", "1", "(1.5+I*2)*x1^2*x2-0.000012*x2+3", "1.2e-05*x1-x2", "(a+1)/(b)*x1*x2^2-1/2*x2+(a)"
+])
+def test_poly_terms_round_trip(poly):
+    coeffs, exps = poly_to_terms(poly, ('x1', 'x2'))
+    assert terms_to_poly(coeffs, exps, ('x1', 'x2')) == poly
+
+
+def test_poly_terms_exponents():
+    coeffs, exps = poly_to_terms("-1/2*x1*x2^2-x2+7", ('x1', 'x2'))
+    assert coeffs == ['-1/2', '-', '+7'] and exps == [[1, 2], [0, 1], [0, 0]]
+    assert poly_to_terms("(x1+1)*x2", ('x1', 'x2')) is None
+
+
+def test_save_and_load_ideal_with_invariants(tmp_path):
+    ring = Ring('0', ('x1', 'x2'), 'dp')
+    I = Ideal(ring, ['x1^2*x2'])
+    I.groebner_basis, I.dim, I.indepSets, I.primary_decomposition, I.fingerprint
+    I.save(tmp_path / "I.npz")
+    Ideal.cache_clear()
+    J = Ideal.load(tmp_path / "I.npz")
+    assert J.ring == I.ring and J.generators == I.generators
+    assert J.__dict__['groebner_basis'] == I.groebner_basis and J._dim == I.dim and J._indepSets == I.indepSets
+    assert J._fingerprint == I.fingerprint
+    assert J.__dict__['primary_decomposition'] == I.primary_decomposition
+
+
+def test_save_and_load_ideals_with_algorithm_invariants(tmp_path):
+    I = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['x1^2*x2-x2'])
+    J = Ideal(Ring('0', ('x1', 'x2'), 'dp'), ['x1^2-2', 'x2-x1'])
+    K = Ideal(Ring('0', ('x1', 'x2'), 'lp'), ['x1^2-2', 'x2-x1'])
+    I.minimal_associated_primes, I.rational_parametrisation, J.multiplication_matrices, K.lex_groebner_basis
+    with TemporarySetting(syngular, 'LEX_GROEBNER_STRATEGY', 'direct'):
+        K.lex_groebner_basis
+    save_ideals(tmp_path / "ideals.npz", [I, J, K])
+    Ideal.cache_clear()
+    I2, J2, K2 = load_ideals(tmp_path / "ideals.npz")
+    assert I2.__dict__['minimal_associated_primes'] == I.minimal_associated_primes
+    assert repr(I2.__dict__['rational_parametrisation']) == repr(I.rational_parametrisation)
+    assert J2.__dict__['multiplication_matrices'] == J.multiplication_matrices
+    assert K2._lex_groebner_bases == K._lex_groebner_bases and set(K2._lex_groebner_bases) == {'fglm', 'direct'}
+    misses = Ideal.cache_info().misses
+    assert Ideal(K.ring, K.generators).lex_groebner_basis == K.lex_groebner_basis and Ideal.cache_info().misses == misses
+
+
+def test_save_and_load_skips_guessed_invariants(tmp_path):
+    ring = Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp')
+    generators = ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                  'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w', 'z*zb*X-z*w+z+w']
+    Ideal.cache_clear()
+    I = Ideal(ring, generators)
+    I.point_on_variety(Field("finite field", 2 ** 31 - 1, 1), indepSet='force guess', seed=0)
+    assert I._indepSets is not None and I._assigned_invariants == {'dim', 'indepSets'}
+    save_ideals(tmp_path / "I.npz", [I])
+    Ideal.cache_clear()
+    J, = load_ideals(tmp_path / "I.npz")
+    assert J._dim is None and J._indepSets is None
+    assert len(Ideal(ring, generators).indepSets) == 7
+
+
+def test_save_and_load_ideals_in_qring(tmp_path):
+    ring = Ring(0, ('x1', 'x2', 'x3'), 'dp')
+    qring = QRing(ring, Ideal(ring, ['x1*x2-x3']))
+    ideals = [Ideal(qring, ['x1']), Ideal(ring, ['x3^2', 'x1+x2'])]
+    ideals[0].groebner_basis
+    save_ideals(tmp_path / "ideals.npz", ideals)
+    loaded = load_ideals(tmp_path / "ideals.npz")
+    assert [str(ideal.ring) for ideal in loaded] == [str(ideal.ring) for ideal in ideals]
+    assert [ideal.generators for ideal in loaded] == [ideal.generators for ideal in ideals]
+    assert loaded[0].groebner_basis == ideals[0].groebner_basis
+
+
+@pytest.mark.parametrize("field", [Field("finite field", 2 ** 31 - 1, 1), Field("finite field", 2 ** 61 - 1, 1), Field("padic", 2 ** 31 - 1, 5), Field("mpc", 0, 300)])
+def test_save_append_and_load_points(tmp_path, field):
+    ring = Ring('0', ('z', 'zb', 'w'), 'dp')
+    oPoints = RingPoints([RingPoint(ring, field, val={variable: field.random() for variable in ('z', 'zb', 'w')}) for _ in range(10)])
+    save_points(tmp_path / "points", oPoints[:6]).append(oPoints[6:].columnar())
+    store = pickle.loads(pickle.dumps(load_points(tmp_path / "points")))
+    assert len(store) == 10 and store.field == field and store.ring == ring
+    assert store[3] == oPoints[3] and store[-1] == oPoints[-1]
+    assert list(store[4:8]("z*w")) == list(oPoints[4:8]("z*w"))
+    assert sum(map(len, store.chunks(4))) == 10
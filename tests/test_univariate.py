@@ -0,0 +1,48 @@
+import mpmath
+import pytest
+import random
+
+from syngular.univariate import finite_field_roots, finite_field_roots_batch, complex_roots
+
+
+@pytest.mark.parametrize("prime", [2, 3, 101, 2 ** 31 - 1, 2 ** 61 - 1])
+def test_finite_field_roots(prime):
+    random.seed(prime)
+    roots = sorted({random.randrange(prime) for _ in range(5)})
+    polynomial = [1]  # (x^2 + x + 1) * prod (x - root), in increasing degree
+    for root in roots + [None]:
+        factor = [-root, 1] if root is not None else [1, 1, 1]
+        product = [0] * (len(polynomial) + len(factor) - 1)
+        for i, a in enumerate(polynomial):
+            for j, b in enumerate(factor):
+                product[i + j] = (product[i + j] + a * b) % prime
+        polynomial = product
+    expected = sorted(set(roots) | {x for x in range(prime) if (x * x + x + 1) % prime == 0} if prime < 200 else roots)
+    if prime >= 200:
+        assert set(roots) <= set(finite_field_roots(polynomial, prime))
+    else:
+        assert finite_field_roots(polynomial, prime) == expected
+
+
+def test_finite_field_roots_batch_edge_cases():
+    prime = 2 ** 31 - 1
+    assert finite_field_roots_batch([[0, 0], [5], [3, 1], [4, 0, 1], [-1, 0, 1]], prime) == [None, [], [prime - 3], [], [1, prime - 1]]
+
+
+@pytest.mark.parametrize("digits", [16, 50, 300])
+def test_complex_roots_certified(digits):
+    random.seed(digits)
+    with mpmath.workdps(digits):
+        polynomial = [mpmath.mpc(random.random(), random.random()) for _ in range(10)]
+        certified_roots = complex_roots(polynomial, digits=digits, certified=True)
+        assert len(certified_roots) == 9
+        for root, radius in certified_roots:
+            assert radius <= mpmath.mpf(10) ** -digits * max(1, abs(root))
+            assert abs(mpmath.polyval(polynomial[::-1], root)) < mpmath.mpf(10) ** (5 - digits)
+
+
+def test_complex_roots_multiple_root_falls_back():
+    with mpmath.workdps(30):
+        roots = complex_roots([1, -2, 1], digits=30)  # (x - 1)^2
+        assert len(roots) == 2 and all(abs(root - 1) < 1e-10 for root in roots)
+        assert complex_roots([3]) == [] and complex_roots([-6, 3]) == [2]
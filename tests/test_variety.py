@@ -1,10 +1,15 @@
+import multiprocessing
 import numpy
+import random
 import sympy
 import pytest
+import syngular
 
 from copy import copy
+from pycoretools import TemporarySetting
 
 from syngular import Field, Ring, QRing, Ideal, Polynomial, RingPoint
+from syngular.variety import lex_groebner_solutions, lex_groebner_solve, retry_statistics, retry_to_find_root
 
 
 def test_finite_field_variety_point():
@@ -16,16 +21,68 @@ def test_finite_field_variety_point():
     assert numpy.all(numpy.array(I.generators_eval(**point_dict)) == 0)
 
 
-def test_padic_variety_point():
+@pytest.mark.parametrize("attempts", [None, 2, 'auto'])
+def test_finite_field_variety_point_speculative_retries(attempts):
+    Fp = Field("finite field", 2 ** 31 - 1, 1)
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    with TemporarySetting(syngular, 'POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS', attempts):
+        for seed in range(3):
+            point_dict = I.point_on_variety(Fp, seed=seed)
+            assert numpy.all(numpy.array(I.generators_eval(**point_dict)) == 0)
+    statistics = retry_statistics(I, Fp)
+    assert statistics.attempts >= 3 and 0 < statistics.failure_rate < 1
+    assert 1 <= statistics.suggested_attempts(max_attempts=8) <= 8
+
+
+@pytest.mark.parametrize("cores", [1, 2])
+def test_finite_field_point_stream(cores):
+    Fp = Field("finite field", 2 ** 31 - 1, 1)
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['z*zb*X-z*w+z+w'])
+    oPoints = list(I.point_stream(Fp, number=4, cores=cores, in_flight=2, seed=0))
+    assert len(oPoints) == 4 and all(isinstance(oPoint, RingPoint) for oPoint in oPoints)
+    assert all(oPoint("z*zb*X-z*w+z+w") == 0 for oPoint in oPoints)
+    for i, oPoint in enumerate(I.point_stream(Fp, cores=cores, seed=1)):  # unbounded, stopped early
+        if i == 2:
+            break
+    assert multiprocessing.active_children() == []
+
+
+@pytest.mark.parametrize("field", [Field("finite field", 2 ** 31 - 1, 1), Field("mpc", 0, 300), Field("padic", 2 ** 31 - 1, 10)])
+def test_variety_point_eigen_method(field):
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    point_dict = I.point_on_variety(field, method='eigen')
+    if field.name == "mpc":
+        assert numpy.all(numpy.isclose(numpy.array(I.generators_eval(**point_dict)).astype(complex), 0))
+    elif field.name == "padic":
+        assert numpy.all(numpy.array([entry.n for entry in I.generators_eval(**point_dict)]) >= 10)
+    else:
+        assert numpy.all(numpy.array(I.generators_eval(**point_dict)) == 0)
+
+
+def test_multiplication_matrices():
+    I = Ideal(Ring('0', ('x', 'y'), 'lp'), ['x^2+y^2-5', 'x*y-2'])
+    basis, (Mx, My) = I.multiplication_matrices
+    assert basis == ['y^2', 'y', 'x', '1'] and I.dim == 0
+    assert Mx[3] == ['0', '2', '5', '0']  # x * y = 2, x * x = 5 - y^2
+    assert Ideal(Ring('0', ('x', 'y'), 'lp'), ['x*y-2']).multiplication_matrices == (None, None)
+
+
+@pytest.mark.parametrize("hensel_lift", [True, False])
+def test_padic_variety_point(hensel_lift):
     Qp = Field("padic", 2 ** 31 - 1, 10)
     I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
                                                              'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
                                                              'z*zb*X-z*w+z+w'])
-    point_dict = I.point_on_variety(Qp, directions=(
-        'X**2*wb*zb**2/123 - X**2*wb*zb/123 - X**2*zb**2/123 + X**2*zb/123 - X*w*wb*zb/123 + X*wb*zb/123 - w*wb/123 + wb/123',
-        'X*z*zb/456 - w*z/456 + w/456 + z/456'),
-        valuations=(1, 2)
-    )
+    with TemporarySetting(syngular, 'POINT_ON_VARIETY_HENSEL_LIFT', hensel_lift):
+        point_dict = I.point_on_variety(Qp, directions=(
+            'X**2*wb*zb**2/123 - X**2*wb*zb/123 - X**2*zb**2/123 + X**2*zb/123 - X*w*wb*zb/123 + X*wb*zb/123 - w*wb/123 + wb/123',
+            'X*z*zb/456 - w*z/456 + w/456 + z/456'),
+            valuations=(1, 2)
+        )
     assert numpy.all(numpy.array([entry.n for entry in I.generators_eval(**point_dict)]) >= 1)
     assert eval('(zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb)/123'.replace("^", "**"), point_dict).n == 1
     assert eval('(z*zb*X-z*w+z+w)/456'.replace("^", "**"), point_dict).n == 2
@@ -55,6 +112,98 @@ def test_complex_variety_point_with_base_point_and_unequal_valuations():
     assert [point_dict[key] == base_point[key] for key in base_point.keys()].count(True) == 3
 
 
+def test_complex_variety_point_mixed_precision(capsys):
+    C = Field("mpc", 0, 300)
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    with TemporarySetting(syngular, 'POINT_ON_VARIETY_MIXED_PRECISION', True):
+        point_dict = I.point_on_variety(C, verbose=True)
+        assert "Refined a double precision solution" in capsys.readouterr().out
+        assert max(abs(value) for value in I.generators_eval(**point_dict)) < 10 ** -280
+        base_point = {'X': 1, 'z': 2, 'zb': 3, 'w': 5, 'wb': 7}
+        point_dict = I.point_on_variety(C, base_point=base_point, directions=('zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb', 'z*zb*X-z*w+z+w'),
+                                        valuations=(10 ** -30, 10 ** -60))
+    assert abs(eval('z*zb*X-z*w+z+w'.replace("^", "**"), copy(point_dict)) - 10 ** -60) < 10 ** -250
+    assert [point_dict[key] == base_point[key] for key in base_point.keys()].count(True) == 3
+
+
+def test_complex_variety_point_mixed_precision_speculative_retries():
+    C = Field("mpc", 0, 300)
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    with TemporarySetting(syngular, 'POINT_ON_VARIETY_SPECULATIVE_ATTEMPTS', 2), TemporarySetting(syngular, 'POINT_ON_VARIETY_MIXED_PRECISION', True):
+        point_dict = I.point_on_variety(C, seed=0)
+    assert max(abs(value) for value in I.generators_eval(**point_dict)) < 10 ** -280
+    with pytest.raises(ValueError):
+        retry_to_find_root(max_tries=0)
+
+
+def test_complex_variety_point_homotopy():
+    C = Field("mpc", 0, 300)
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    point_dict = I.point_on_variety(C, method='homotopy', seed=0)
+    assert max(abs(value) for value in I.generators_eval(**point_dict)) < 10 ** -280
+    point_dict = I.point_on_variety(C, method='homotopy', valuations=(10 ** -30, 10 ** -30), seed=0)
+    assert numpy.all(numpy.isclose(numpy.array(I.generators_eval(**point_dict)).astype(complex), 0))
+    with pytest.raises(ValueError):
+        I.point_on_variety(Field("finite field", 2 ** 31 - 1, 1), method='homotopy')
+    statistics = retry_statistics(I, C)
+    attempts = statistics.attempts
+    with pytest.raises(ValueError, match="as many directions as dependent variables"):  # a property of the input, not retried
+        I.point_on_variety(C, directions=['z*zb*X-z*w+z+w'], indepSet=None, method='homotopy')
+    assert statistics.attempts == attempts
+
+
+@pytest.mark.parametrize("field", [Field("finite field", 2 ** 31 - 1, 1), Field("mpc", 0, 300), Field("padic", 2 ** 31 - 1, 5)])
+def test_variety_sampler(field):
+    I = Ideal(Ring('0', ('z', 'zb', 'w', 'wb', 'X'), 'dp'), ['zb^2*wb*X^2-zb*w*wb*X-zb^2*X^2-zb*wb*X^2+zb*wb*X+zb*X^2-w*wb+wb',
+                                                             'z*w*wb*X+zb*w*wb*X+z*w^2+z*w*wb-z*w*X-zb*w*X-z*wb*X-w*wb*X-2*z*w-w^2-z*wb+z*X+w*X+z+w',
+                                                             'z*zb*X-z*w+z+w'])
+    sampler = I.variety_sampler(field)
+    assert sampler.indepSet is None and len(sampler.directions) == (0 if field.name == "finite field" else I.codim)
+    for point_dict in sampler.points(3, seed=1):
+        if field.name == "mpc":
+            assert max(abs(value) for value in I.generators_eval(**point_dict)) < 10 ** -280
+        elif field.name == "padic":
+            assert numpy.all(numpy.array([entry.n for entry in I.generators_eval(**point_dict)]) >= 5)
+        else:
+            assert numpy.all(numpy.array(I.generators_eval(**point_dict)) == 0)
+    base_point = {'X': field.random(), 'z': field.random()} | {key: Polynomial(key, field) for key in ('zb', 'w', 'wb')}
+    for generator in I.generators:
+        assert sampler.substitute(generator, base_point, ('zb', 'w', 'wb')) == Polynomial(generator, field).subs(base_point)
+
+
+def test_lex_groebner_solutions_are_lazy():
+    equations = ['x^2-2', 'y^3-x']
+    solutions = lex_groebner_solutions(equations, digits=30)
+    first = next(solutions)
+    assert len(list(solutions)) == 5 and len(lex_groebner_solve(equations, digits=30)) == 6
+    assert abs(first[sympy.Symbol('y')] ** 3 - first[sympy.Symbol('x')]) < 10 ** -25
+    # over F_7, 2 is a square (3^2) but x^3 = 3 and x^3 = 4 have no roots: the walk backtracks through both branches
+    assert list(lex_groebner_solutions(['x^2-2', 'y^3-x'], prime=7)) == []
+    assert len(list(lex_groebner_solutions(['x^2-2', 'y^2-x'], prime=7, rng=random.Random(0)))) == 2
+
+
+def test_numerical_irreducible_decomposition():
+    I = Ideal(Ring('0', ('x', 'y', 'z'), 'dp'), ['x*z', 'y*z', 'z^2-z'])  # plane z = 0 and point (0, 0, 1)
+    assert [(component.dimension, component.degree) for component in I.numerical_irreducible_decomposition(seed=1)] == [(2, 1), (0, 1)]
+    I = Ideal(Ring('0', ('x', 'y', 'z'), 'dp'), ['y^2-x*z', 'x^2*y-z^2', 'x^3-y*z'])  # monomial curve (t^3, t^4, t^5)
+    assert [(component.dimension, component.degree) for component in I.numerical_irreducible_decomposition(seed=1)] == [(1, 5)]
+
+
+def test_point_on_component():
+    C = Field("mpc", 0, 100)
+    I = Ideal(Ring('0', ('x', 'y'), 'dp'), ['(x^2+y^2-1)*(x-y)*(x-2)'])
+    components = I.numerical_irreducible_decomposition(seed=1)
+    assert [(component.dimension, component.degree) for component in components] == [(1, 2), (1, 1), (1, 1)]
+    point = I.point_on_component(components[0], C, seed=1)
+    assert abs(point['x'] ** 2 + point['y'] ** 2 - 1) < 10 ** -90
+
+
 def test_padic_variety_point_in_qring():
     """This is ("Δ_14|23|56", "⟨1|2+3|4]" ) from lips at six point."""
     ring = Ring(0, ('a1', 'b1', 'c1', 'd1', 'a2', 'b2', 'c2', 'd2', 'a3', 'b3', 'c3', 'd3', 'a4', 'b4', 'c4', 'd4', 'a5', 'b5', 'c5', 'd5', 'a6', 'b6', 'c6', 'd6'), 'dp')